@@ -0,0 +1,141 @@
+"""
+기사 필드 추출 속도 비교 (저장된 기사 HTML 파일 기준)
+
+- legacy: 필드/선택자마다 WebDriver 호출 (이전 get_news_content 방식)
+- page_source: 요소 대기 한 번 + page_source 한 번 + 로컬 파싱 (현재 get_news_content)
+- parse_only: 브라우저 없이 HTML 파싱만 (HTTP 엔진)
+
+사용법:
+    python benchmark_extraction.py --fixtures ./fixtures/articles --repeat 3
+"""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from pathlib import Path
+import argparse
+import re
+import statistics
+import time
+
+from naver_news_crawler import NaverNewsCrawler
+from naver_news_parser import parse_news_content
+
+
+def legacy_get_news_content(driver, wait):
+    """이전 get_news_content의 필드 추출 부분 (비교용)"""
+    title = wait.until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "h2.media_end_head_headline, h3.tit_view"))
+    ).text
+
+    content = None
+    for selector in ["div#newsct_article", "div#articeBody", "div#articleBodyContents"]:
+        try:
+            content = wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            ).text
+            if content:
+                break
+        except:
+            continue
+    if not content:
+        return None
+
+    date_elements = driver.find_elements(By.CSS_SELECTOR, "span.media_end_head_info_datestamp_time, span.date, span.media_end_head_info_datestamp")
+    created_date = date_elements[0].text if len(date_elements) > 0 else None
+    modified_date = date_elements[1].text if len(date_elements) > 1 else None
+
+    try:
+        journalist = driver.find_element(By.CSS_SELECTOR, "em.media_end_head_journalist_name, span.writer, span.media_end_head_journalist").text
+    except Exception:
+        journalist = None
+
+    try:
+        comment_count = driver.find_element(By.CSS_SELECTOR, "a.media_end_head_cmtcount_button, a.cmt_count, span.media_end_head_cmtcount").text
+        comment_count = int(re.sub(r'[^0-9]', '', comment_count))
+    except Exception:
+        comment_count = 0
+
+    related_articles = []
+    for item in driver.find_elements(By.CSS_SELECTOR, "li.media_end_linked_item, li.related_item, div.media_end_head_related_news li"):
+        try:
+            related_title = item.find_element(By.CSS_SELECTOR, "a.media_end_linked_item_inner, a.related_tit, a").text
+            related_url = item.find_element(By.CSS_SELECTOR, "a.media_end_linked_item_inner, a.related_tit, a").get_attribute("href")
+            related_articles.append({'title': related_title, 'url': related_url})
+        except Exception:
+            continue
+
+    return {
+        'title': title,
+        'content': content,
+        'created_date': created_date,
+        'modified_date': modified_date,
+        'journalist': journalist,
+        'comment_count': comment_count,
+        'related_articles': related_articles
+    }
+
+
+def summarize(name, timings):
+    timings_ms = [t * 1000 for t in timings]
+    print(f"{name:<12} 평균 {statistics.mean(timings_ms):8.1f} ms | "
+          f"중앙값 {statistics.median(timings_ms):8.1f} ms | "
+          f"최대 {max(timings_ms):8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 필드 추출 속도 비교")
+    parser.add_argument('--fixtures', required=True, help="저장된 기사 HTML 파일(*.html) 디렉토리")
+    parser.add_argument('--repeat', type=int, default=3, help="파일별 반복 횟수")
+    parser.add_argument('--legacy-timeout', type=float, default=20, help="legacy 방식 WebDriverWait 타임아웃 (초)")
+    args = parser.parse_args()
+
+    fixtures = sorted(Path(args.fixtures).glob('*.html'))
+    if not fixtures:
+        print(f"{args.fixtures}에 HTML 파일이 없습니다.")
+        return
+
+    crawler = NaverNewsCrawler(engine='selenium')
+    legacy_wait = WebDriverWait(crawler.driver, args.legacy_timeout)
+    timings = {'legacy': [], 'page_source': [], 'parse_only': []}
+    mismatches = 0
+
+    try:
+        for path in fixtures:
+            url = path.resolve().as_uri()
+            html = path.read_text(encoding='utf-8')
+            for _ in range(args.repeat):
+                crawler.driver.get(url)
+                started = time.perf_counter()
+                legacy = legacy_get_news_content(crawler.driver, legacy_wait)
+                timings['legacy'].append(time.perf_counter() - started)
+
+                crawler.driver.get(url)
+                started = time.perf_counter()
+                current = crawler.get_news_content()
+                timings['page_source'].append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                parse_news_content(html)
+                timings['parse_only'].append(time.perf_counter() - started)
+
+            # 제목/본문이 같은지 확인 (공백 차이는 무시)
+            if legacy and current:
+                for field in ('title', 'content'):
+                    if ' '.join(legacy[field].split()) != ' '.join(current[field].split()):
+                        mismatches += 1
+                        print(f"필드 불일치: {path.name} ({field})")
+            elif bool(legacy) != bool(current):
+                mismatches += 1
+                print(f"추출 결과 불일치: {path.name}")
+    finally:
+        crawler.close()
+
+    print(f"\n기사 {len(fixtures)}개 x {args.repeat}회")
+    for name, values in timings.items():
+        summarize(name, values)
+    print(f"legacy 대비 속도: {statistics.mean(timings['legacy']) / statistics.mean(timings['page_source']):.1f}배")
+    print(f"불일치: {mismatches}건")
+
+
+if __name__ == "__main__":
+    main()
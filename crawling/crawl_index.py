@@ -0,0 +1,122 @@
+from datetime import datetime
+import os
+import sqlite3
+import threading
+
+from naver_news_parser import extract_article_ids
+
+
+class CrawlIndex:
+    """
+    수집한 기사(oid, aid)와 (언론사, 날짜, 페이지) 진행 위치를 기록하는 SQLite 인덱스
+
+    여러 작업자 프로세스가 같은 파일을 함께 써도 되도록 WAL 모드로 엽니다.
+
+    Args:
+        path (str): SQLite 파일 경로
+    """
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS articles (
+                oid TEXT NOT NULL,
+                aid TEXT NOT NULL,
+                press TEXT,
+                date TEXT,
+                url TEXT,
+                title TEXT,
+                crawled_at TEXT,
+                PRIMARY KEY (oid, aid)
+            );
+            CREATE TABLE IF NOT EXISTS cursors (
+                press TEXT NOT NULL,
+                date TEXT NOT NULL,
+                last_page INTEGER NOT NULL DEFAULT 0,
+                done INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT,
+                PRIMARY KEY (press, date)
+            );
+        ''')
+        self.conn.commit()
+
+    def is_seen(self, oid, aid):
+        """이미 수집한 기사인지 확인"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM articles WHERE oid = ? AND aid = ?", (oid, aid)
+            ).fetchone()
+        return row is not None
+
+    def filter_unseen(self, news_items):
+        """목록 항목 중 아직 수집하지 않은 기사만 반환 (ID를 알 수 없는 항목은 유지)"""
+        unseen = []
+        for item in news_items:
+            ids = extract_article_ids(item['url'])
+            if ids is None or not self.is_seen(*ids):
+                unseen.append(item)
+        return unseen
+
+    def record_page(self, press, date, page, records, advance=True):
+        """
+        한 목록 페이지의 수집 결과와 진행 위치를 한 트랜잭션으로 기록
+
+        advance=False이면 기사만 기록하고 진행 위치는 그대로 둡니다
+        (받지 못한 기사가 있는 페이지를 다음 실행에서 다시 확인하도록).
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = []
+        for record in records:
+            ids = extract_article_ids(record['url'])
+            if ids is not None:
+                rows.append((ids[0], ids[1], press, date, record['url'], record.get('title'), now))
+
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO articles (oid, aid, press, date, url, title, crawled_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            if advance:
+                self.conn.execute(
+                    "INSERT INTO cursors (press, date, last_page, done, updated_at) VALUES (?, ?, ?, 0, ?) "
+                    "ON CONFLICT(press, date) DO UPDATE SET "
+                    "last_page = MAX(last_page, excluded.last_page), updated_at = excluded.updated_at",
+                    (press, date, page, now)
+                )
+
+    def get_cursor(self, press, date):
+        """
+        (언론사, 날짜)의 진행 위치
+
+        Returns:
+            dict: {'last_page': int, 'done': bool}, 기록이 없으면 None
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT last_page, done FROM cursors WHERE press = ? AND date = ?", (press, date)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'last_page': row[0], 'done': bool(row[1])}
+
+    def mark_day_done(self, press, date):
+        """하루치 수집 완료 표시"""
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO cursors (press, date, last_page, done, updated_at) VALUES (?, ?, 0, 1, ?) "
+                "ON CONFLICT(press, date) DO UPDATE SET done = 1, updated_at = excluded.updated_at",
+                (press, date, now)
+            )
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self.conn.close()
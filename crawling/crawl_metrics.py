@@ -0,0 +1,149 @@
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import os
+import threading
+import time
+
+# 단계 이름: list_load(목록 페이지), article_fetch(기사 페이지), extract(필드 추출), write(샤드 기록), day(하루 전체)
+STAGES = ('list_load', 'article_fetch', 'extract', 'write', 'day')
+# 카운터 이름
+COUNTERS = ('articles', 'pages', 'retries', 'timeouts', 'errors', 'fallbacks')
+
+
+class CrawlMetrics:
+    """
+    언론사/날짜별 단계 소요 시간과 카운터를 모으는 계측기 (스레드 안전)
+
+    단계 시간은 (횟수, 합계, 최대) 로, 카운터는 누적 값으로 기록합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._counters = {}
+
+    @contextmanager
+    def stage(self, name, press=None, date=None):
+        """with 블록의 실행 시간을 단계 시간으로 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, press, date)
+
+    def observe(self, name, seconds, press=None, date=None):
+        key = (name, press or '', date or '')
+        with self._lock:
+            count, total, maximum = self._stages.get(key, (0, 0.0, 0.0))
+            self._stages[key] = (count + 1, total + seconds, max(maximum, seconds))
+
+    def increment(self, name, press=None, date=None, value=1):
+        key = (name, press or '', date or '')
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self, press=None, date=None):
+        """
+        기록을 직렬화 가능한 dict로 반환 (press/date를 주면 해당 항목만)
+
+        다른 프로세스의 기록은 merge()로 합칠 수 있습니다.
+        """
+        def selected(key):
+            return (press is None or key[1] == press) and (date is None or key[2] == date)
+
+        with self._lock:
+            return {
+                'stages': [[*key, *value] for key, value in self._stages.items() if selected(key)],
+                'counters': [[*key, value] for key, value in self._counters.items() if selected(key)]
+            }
+
+    def merge(self, snapshot):
+        """snapshot() 결과 합치기"""
+        with self._lock:
+            for name, press, date, count, total, maximum in snapshot['stages']:
+                key = (name, press, date)
+                old_count, old_total, old_max = self._stages.get(key, (0, 0.0, 0.0))
+                self._stages[key] = (old_count + count, old_total + total, max(old_max, maximum))
+            for name, press, date, value in snapshot['counters']:
+                key = (name, press, date)
+                self._counters[key] = self._counters.get(key, 0) + value
+
+    def summary(self):
+        """언론사/날짜별 단계 시간, 카운터, 처리량 정리"""
+        with self._lock:
+            stages = dict(self._stages)
+            counters = dict(self._counters)
+
+        rows = {}
+        for (name, press, date), (count, total, maximum) in stages.items():
+            row = rows.setdefault((press, date), {'press': press, 'date': date, 'stages': {}, 'counters': {}})
+            row['stages'][name] = {
+                'count': count,
+                'total_seconds': round(total, 4),
+                'mean_seconds': round(total / count, 4) if count else 0.0,
+                'max_seconds': round(maximum, 4)
+            }
+        for (name, press, date), value in counters.items():
+            row = rows.setdefault((press, date), {'press': press, 'date': date, 'stages': {}, 'counters': {}})
+            row['counters'][name] = value
+
+        for row in rows.values():
+            day_seconds = row['stages'].get('day', {}).get('total_seconds', 0.0)
+            articles = row['counters'].get('articles', 0)
+            row['articles_per_second'] = round(articles / day_seconds, 3) if day_seconds else None
+        return sorted(rows.values(), key=lambda row: (row['press'], row['date']))
+
+    def export_json(self, path):
+        """JSON 파일로 내보내기"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generated_at': datetime.now().isoformat(timespec='seconds'),
+                'partitions': self.summary()
+            }, f, ensure_ascii=False, indent=2)
+
+    def export_prometheus(self, path):
+        """Prometheus 텍스트 형식으로 내보내기"""
+        def labels(press, date, **extra):
+            items = {'press': press, 'date': date, **extra}
+            return ','.join(f'{key}="{value}"' for key, value in items.items())
+
+        with self._lock:
+            stages = dict(self._stages)
+            counters = dict(self._counters)
+
+        lines = [
+            '# HELP naver_crawler_stage_seconds 단계별 소요 시간',
+            '# TYPE naver_crawler_stage_seconds summary'
+        ]
+        for (name, press, date), (count, total, _) in sorted(stages.items()):
+            lines.append(f'naver_crawler_stage_seconds_sum{{{labels(press, date, stage=name)}}} {total:.6f}')
+            lines.append(f'naver_crawler_stage_seconds_count{{{labels(press, date, stage=name)}}} {count}')
+        lines.append('# HELP naver_crawler_stage_seconds_max 단계별 최대 소요 시간')
+        lines.append('# TYPE naver_crawler_stage_seconds_max gauge')
+        for (name, press, date), (_, _, maximum) in sorted(stages.items()):
+            lines.append(f'naver_crawler_stage_seconds_max{{{labels(press, date, stage=name)}}} {maximum:.6f}')
+        for counter in sorted({key[0] for key in counters}):
+            lines.append(f'# TYPE naver_crawler_{counter}_total counter')
+            for (name, press, date), value in sorted(counters.items()):
+                if name == counter:
+                    lines.append(f'naver_crawler_{counter}_total{{{labels(press, date)}}} {value}')
+        lines.append('# TYPE naver_crawler_articles_per_second gauge')
+        for row in self.summary():
+            if row['articles_per_second'] is not None:
+                lines.append(f'naver_crawler_articles_per_second{{{labels(row["press"], row["date"])}}} {row["articles_per_second"]}')
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def export(self, path):
+        """확장자가 .prom이면 Prometheus 텍스트, 아니면 JSON으로 내보내기"""
+        if path.endswith('.prom'):
+            self.export_prometheus(path)
+        else:
+            self.export_json(path)
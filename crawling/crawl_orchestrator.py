@@ -0,0 +1,163 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from multiprocessing import util
+import json
+import os
+import time
+
+from naver_news_crawler import NaverNewsCrawler, PRESS_IDS, date_range
+from crawl_metrics import CrawlMetrics
+
+# 작업자 프로세스마다 하나씩 만드는 크롤러
+_worker_crawler = None
+
+
+def resolve_press_names(press_names):
+    """'all' 또는 언론사 이름 목록을 PRESS_IDS 기준으로 정리 (같은 언론사 ID는 처음 이름 하나만)"""
+    if press_names in ('all', ['all']):
+        press_names = list(PRESS_IDS)
+    unknown = [name for name in press_names if name not in PRESS_IDS]
+    if unknown:
+        print(f"PRESS_IDS에 없는 언론사는 목록 페이지에서 검색합니다: {', '.join(unknown)}")
+    resolved, seen_ids = [], {}
+    for name in dict.fromkeys(press_names):
+        press_id = PRESS_IDS.get(name)
+        if press_id is not None and press_id in seen_ids:
+            print(f"{name}은(는) {seen_ids[press_id]}와(과) 같은 언론사 ID({press_id})라 건너뜁니다")
+            continue
+        if press_id is not None:
+            seen_ids[press_id] = name
+        resolved.append(name)
+    return resolved
+
+
+def make_shards(press_names, start_date, end_date):
+    """(언론사, 날짜) 단위 작업 목록 생성"""
+    return [(press_name, day) for press_name in press_names for day in date_range(start_date, end_date)]
+
+
+def _close_worker_crawler():
+    if _worker_crawler is not None:
+        _worker_crawler.close()
+
+
+def _init_worker(crawler_kwargs):
+    """작업자 프로세스 초기화: 프로세스 전용 브라우저/세션 생성"""
+    global _worker_crawler
+    _worker_crawler = NaverNewsCrawler(**crawler_kwargs)
+    # 작업자는 os._exit로 끝나 atexit이 실행되지 않으므로 multiprocessing 종료 처리기로 브라우저/세션 정리
+    util.Finalize(None, _close_worker_crawler, exitpriority=10)
+
+
+def _run_shard(press_name, day):
+    """작업자 프로세스에서 하루치 기사를 수집해 샤드 파일로 저장"""
+    started = time.time()
+    try:
+        count = _worker_crawler.crawl_press_day(press_name, day)
+    except Exception as e:
+        # 브라우저 세션이 죽었으면 다음 재시도를 위해 다시 연결
+        if "invalid session id" in str(e):
+            _worker_crawler.reconnect_browser()
+        raise
+    _worker_crawler.commit_days(press_name, [day])
+    return {
+        'press': press_name,
+        'date': day,
+        'articles': count,
+        'seconds': round(time.time() - started, 2),
+        # 단계별 시간/카운터는 메인 프로세스에서 합쳐 내보냄
+        'metrics': _worker_crawler.metrics.snapshot(press_name, day)
+    }
+
+
+def run_batch(press_names, start_date, end_date, workers=4, retries=2, summary_dir='data', **crawler_kwargs):
+    """
+    여러 언론사의 기간별 정치 뉴스를 (언론사, 날짜) 단위로 나눠 병렬 수집
+
+    Args:
+        press_names (list or str): 언론사 이름 목록 또는 'all'
+        start_date (str): 시작 날짜 (YYYY-MM-DD)
+        end_date (str): 종료 날짜 (YYYY-MM-DD)
+        workers (int): 작업자 프로세스 수 (각자 브라우저/세션 보유)
+        retries (int): 실패한 작업의 재시도 횟수
+        summary_dir (str): 실행 요약 JSON과 계측 결과(JSON, Prometheus 텍스트)를 저장할 디렉토리
+        **crawler_kwargs: NaverNewsCrawler 생성 인자 (engine 등)
+
+    Returns:
+        dict: 실행 요약
+    """
+    press_names = resolve_press_names(press_names)
+    shards = make_shards(press_names, start_date, end_date)
+    started = time.time()
+    print(f"총 {len(shards)}개 작업 ({len(press_names)}개 언론사 x {len(shards) // max(len(press_names), 1)}일), 작업자 {workers}개")
+
+    attempts = {shard: 0 for shard in shards}
+    completed = []
+    failed = {}
+    metrics = CrawlMetrics()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(crawler_kwargs,)) as executor:
+        futures = {executor.submit(_run_shard, *shard): shard for shard in shards}
+        while futures:
+            for future in as_completed(list(futures)):
+                shard = futures.pop(future)
+                attempts[shard] += 1
+                try:
+                    result = future.result()
+                    metrics.merge(result.pop('metrics'))
+                    result['attempts'] = attempts[shard]
+                    completed.append(result)
+                    failed.pop(shard, None)
+                    print(f"완료: {shard[0]} {shard[1]} - {result['articles']}개 ({result['seconds']}초)")
+                except Exception as e:
+                    failed[shard] = str(e)
+                    if attempts[shard] <= retries:
+                        print(f"실패: {shard[0]} {shard[1]} ({e}) - 재시도 {attempts[shard]}/{retries}")
+                        futures[executor.submit(_run_shard, *shard)] = shard
+                    else:
+                        print(f"최종 실패: {shard[0]} {shard[1]} ({e})")
+
+    per_press = {}
+    for result in completed:
+        per_press[result['press']] = per_press.get(result['press'], 0) + result['articles']
+
+    summary = {
+        'start_date': start_date,
+        'end_date': end_date,
+        'workers': workers,
+        'shards': len(shards),
+        'succeeded': len(completed),
+        'failed': [
+            {'press': press_name, 'date': day, 'attempts': attempts[(press_name, day)], 'error': error}
+            for (press_name, day), error in sorted(failed.items())
+        ],
+        'articles': sum(per_press.values()),
+        'articles_per_press': per_press,
+        'elapsed_seconds': round(time.time() - started, 2)
+    }
+
+    print("\n" + "=" * 30)
+    print("크롤링 요약")
+    print("=" * 30)
+    print(f"- 기간: {start_date} ~ {end_date}")
+    print(f"- 작업: {summary['succeeded']}/{summary['shards']} 성공, {len(summary['failed'])} 실패")
+    print(f"- 기사 수: {summary['articles']}")
+    print(f"- 소요 시간: {summary['elapsed_seconds']}초")
+    for press_name, count in sorted(per_press.items(), key=lambda x: -x[1]):
+        print(f"  {press_name}: {count}")
+    for failure in summary['failed']:
+        print(f"  실패 - {failure['press']} {failure['date']}: {failure['error']}")
+
+    os.makedirs(summary_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    summary_path = os.path.join(summary_dir, f"crawl_summary_{timestamp}.json")
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    print(f"요약 저장: {summary_path}")
+
+    metrics_path = os.path.join(summary_dir, f"crawl_metrics_{timestamp}")
+    metrics.export_json(metrics_path + '.json')
+    metrics.export_prometheus(metrics_path + '.prom')
+    print(f"계측 저장: {metrics_path}.json, {metrics_path}.prom")
+
+    return summary
@@ -0,0 +1,123 @@
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Referer': 'https://news.naver.com/'
+}
+
+# 다시 요청할 일시적 오류 상태 코드
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def retry_after_seconds(response):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초로 변환 (없거나 읽을 수 없으면 None)"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HttpFetcher:
+    """
+    연결을 재사용하는 requests.Session 기반 페이지 다운로더
+
+    Args:
+        pool_size (int): 호스트별 유지할 keep-alive 연결 수
+        timeout (float): 요청 타임아웃 (초)
+        max_retries (int): 일시적 오류(429, 5xx, 연결 오류/타임아웃) 재시도 횟수
+        limiter (HostRateLimiter): 호스트별 요청 속도 제한 (None이면 제한 없음)
+        backoff_factor (float): 재시도 대기 시간 backoff_factor * 2^(시도 번호) 초
+        max_backoff (float): 재시도 대기 시간 상한 (Retry-After 포함, 초)
+
+    재시도도 limiter를 거쳐 토큰을 하나씩 쓰고, 429/503 응답의 Retry-After 동안은
+    limiter.pause로 그 호스트의 모든 요청을 멈춥니다.
+    여러 스레드에서 동시에 get()을 호출해도 됩니다.
+    """
+    def __init__(self, pool_size=10, timeout=10, max_retries=2, headers=None, limiter=None,
+                 backoff_factor=0.5, max_backoff=60):
+        self.timeout = timeout
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+
+        # 재시도는 속도 제한을 지키도록 get_response에서 직접 (어댑터는 재시도하지 않음)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _get_once(self, url):
+        if self.limiter is not None:
+            return self.limiter.request(url, lambda: self.session.get(url, timeout=self.timeout))
+        return self.session.get(url, timeout=self.timeout)
+
+    def _backoff(self, attempt):
+        return min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+
+    def get_response(self, url):
+        """
+        URL 응답 반환 (HTTP 오류 시 예외 발생)
+
+        재시도 횟수는 response.retries 로 확인할 수 있습니다.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = self._get_once(url)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+            if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                break
+            delay = self._backoff(attempt)
+            retry_after = retry_after_seconds(response)
+            response.close()
+            if retry_after is not None:
+                # 서버가 알려준 시간 동안 이 호스트의 모든 요청을 멈춤
+                delay = min(self.max_backoff, max(delay, retry_after))
+                if self.limiter is not None:
+                    self.limiter.pause(url, delay)
+                else:
+                    time.sleep(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
+        response.retries = attempt
+        response.raise_for_status()
+        # 구형 페이지는 charset이 없거나 euc-kr인 경우가 있음
+        if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+            response.encoding = response.apparent_encoding
+        return response
+
+    def get(self, url):
+        """URL의 HTML 문자열 반환 (HTTP 오류 시 예외 발생)"""
+        return self.get_response(url).text
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
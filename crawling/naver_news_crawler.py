@@ -4,19 +4,191 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
-import pandas as pd
-import time
 from datetime import datetime, timedelta
-import re
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import threading
 import os
 import json
 import requests
 
+from http_fetcher import HttpFetcher
+from rate_limiter import HostRateLimiter
+from crawl_metrics import CrawlMetrics
+from crawl_index import CrawlIndex
+from news_writer import ShardedNewsWriter
+from naver_news_parser import (
+    NAVER_NEWS_URL, TITLE_SELECTOR, CONTENT_SELECTORS,
+    parse_news_list, parse_news_content, has_next_page, to_desktop_url
+)
+
+# 기사 페이지가 준비됐다고 볼 수 있는 요소 (제목 또는 본문)
+ARTICLE_READY_SELECTOR = ', '.join([TITLE_SELECTOR] + CONTENT_SELECTORS)
+
+class IncompleteDayError(RuntimeError):
+    """하루치 수집에서 받지 못한 기사가 있음 (날짜를 완료로 표시하지 않음)"""
+    def __init__(self, press_name, date, failed, collected):
+        super().__init__(f"{press_name} {date}: 기사 {failed}개를 받지 못했습니다 (받은 기사 {collected}개)")
+        self.press_name = press_name
+        self.date = date
+        self.failed = failed
+        self.collected = collected
+
+
+# 언론사 ID 매핑
+PRESS_IDS = {
+    # 신문사
+    '한겨레': '028',
+    '조선일보': '023',
+    '중앙일보': '025',
+    '동아일보': '020',
+    '경향신문': '032',
+    '한국일보': '469',
+    '서울신문': '081',
+    '세계일보': '022',
+    '문화일보': '021',
+    '국민일보': '005',
+    '매일신문': '088',
+    '부산일보': '082',
+    '전북일보': '087',
+    '전주일보': '086',
+    '강원일보': '085',
+    '대구일보': '084',
+    '광주일보': '083',
+    '제주일보': '089',
+    '경남일보': '090',
+    '경북일보': '091',
+    
+    # 방송사
+    'KBS': '056',
+    'MBC': '214',
+    'SBS': '055',
+    'YTN': '052',
+    '채널A': '449',
+    'TV조선': '448',
+    'MBN': '057',
+    '연합뉴스TV': '422',
+    'CBS': '079',
+    'BBS': '078',
+    'TBS': '077',
+    'OBS': '353',
+    'G1': '076',
+    'KNN': '075',
+    'TJB': '074',
+    'JTV': '073',
+    'KBC': '072',
+    'JIBS': '071',
+    'KBSN': '070',
+    'KBS WORLD': '069',
+    
+    # 통신사
+    '연합뉴스': '001',
+    '뉴시스': '003',
+    '뉴스1': '421',
+    '뉴스타운': '006',
+    '아시아경제': '277',
+    '매일경제': '009',
+    '한국경제': '015',
+    '파이낸셜뉴스': '014',
+    '서울경제': '011',
+    '헤럴드경제': '016',
+    '이데일리': '018',
+    '머니투데이': '008',
+    '아시아투데이': '007',
+    '디지털타임스': '029',
+    '전자신문': '030',
+    'ZDNet Korea': '092',
+    '테크홀릭': '093',
+    'IT조선': '094',
+    'IT동아': '095',
+    'IT월드': '096',
+    '오마이뉴스': '047'
+}
+
+
+def date_range(start_date, end_date):
+    """start_date부터 end_date까지의 날짜 문자열 (YYYY-MM-DD) 목록"""
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    if start > end:
+        raise ValueError(f"시작 날짜({start_date})가 종료 날짜({end_date})보다 늦습니다.")
+    return [(start + timedelta(days=offset)).strftime('%Y-%m-%d') for offset in range((end - start).days + 1)]
+
+
 class NaverNewsCrawler:
-    def __init__(self):
+    """
+    네이버 뉴스 정치 기사 크롤러
+
+    Args:
+        engine (str): 'selenium'이면 모든 페이지를 헤드리스 Chrome으로,
+            'http'이면 requests 세션으로 내려받아 BeautifulSoup으로 파싱
+            (파싱에 실패한 기사만 Selenium으로 재시도)
+        base_url (str): 네이버 뉴스 주소 (로컬 테스트 서버로 바꿔서 사용 가능)
+        pool_size (int): HTTP 엔진의 keep-alive 연결 수
+        http_timeout (float): HTTP 요청 타임아웃 (초)
+        max_workers (int): HTTP 엔진에서 동시에 받아올 기사 수
+        per_host_limit (int): 호스트별 최대 동시 요청 수
+        requests_per_second (float): 호스트별 토큰 버킷 초당 요청 수 (None이면 제한 없음)
+        burst (int): 호스트별 토큰 버킷 용량
+        host_rates (dict): 호스트별 초당 요청 수 재정의
+        page_timeout (float): 브라우저 페이지 요소 대기 최대 시간 (초)
+        state_dir (str): 수집 기록 인덱스를 둘 디렉토리
+            (지정하면 이전 실행에서 수집한 기사를 건너뛰고 중단된 위치부터 이어서 수집,
+            생략하면 이번 실행 안에서만 기록)
+        output_dir (str): 언론사/날짜별 샤드 파일을 저장할 디렉토리
+        output_format (str): 샤드 형식 ('jsonl' 또는 'parquet')
+        max_shard_bytes (int): 샤드 하나의 최대 크기 (바이트)
+        metrics_path (str): 종료 시 계측 결과를 내보낼 파일 (.prom이면 Prometheus 텍스트, 그 외 JSON)
+    """
+    def __init__(self, engine='selenium', base_url=NAVER_NEWS_URL, pool_size=10, http_timeout=10,
+                 max_workers=8, per_host_limit=4, requests_per_second=5.0, burst=10, host_rates=None,
+                 page_timeout=20, state_dir=None, output_dir='data/news', output_format='jsonl',
+                 max_shard_bytes=64 * 1024 * 1024, metrics_path=None):
+        if engine not in ('selenium', 'http'):
+            raise ValueError(f"지원하지 않는 엔진입니다: {engine}")
+        self.engine = engine
+        self.base_url = base_url.rstrip('/')
+        self.max_workers = max(1, max_workers)
+        self.page_timeout = page_timeout
+        self.limiter = HostRateLimiter(
+            rate=requests_per_second,
+            burst=burst,
+            max_concurrent=per_host_limit,
+            host_rates=host_rates
+        )
+        self.metrics = CrawlMetrics()
+        self.metrics_path = metrics_path
+        self.fetcher = None
+        if engine == 'http':
+            self.fetcher = HttpFetcher(
+                pool_size=max(pool_size, self.max_workers),
+                timeout=http_timeout,
+                limiter=self.limiter
+            )
+        self._driver = None
+        self._wait = None
+        # 브라우저는 하나뿐이므로 폴백은 한 번에 하나씩만 실행
+        self._browser_lock = threading.Lock()
+
+        # 수집 기록 (oid/aid 인덱스, 페이지 진행 위치)
+        self.state_dir = state_dir
+        index_path = os.path.join(state_dir, 'crawl_index.sqlite3') if state_dir else ':memory:'
+        self.index = CrawlIndex(index_path)
+
+        # 페이지 단위로 바로 기록하는 샤드 writer
+        self.output_dir = output_dir
+        self.writer = ShardedNewsWriter(output_dir, output_format, max_shard_bytes)
+
+        # Selenium 엔진은 바로 브라우저 실행, HTTP 엔진은 폴백이 필요할 때만 실행
+        if engine == 'selenium':
+            self._start_browser()
+
+    def _start_browser(self):
+        """헤드리스 Chrome 실행"""
         # Chrome 옵션 설정
         chrome_options = Options()
         chrome_options.add_argument('--headless')  # 브라우저 창 숨기기
@@ -41,99 +213,55 @@ class NaverNewsCrawler:
         
         # 웹드라이버 설정
         service = Service()
-        self.driver = webdriver.Chrome(
+        self._driver = webdriver.Chrome(
             service=service,
             options=chrome_options
         )
-        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        self._driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
             'source': '''
                 Object.defineProperty(navigator, 'webdriver', {
                     get: () => undefined
                 })
             '''
         })
-        self.wait = WebDriverWait(self.driver, 20)
-        
+        self._wait = WebDriverWait(self._driver, self.page_timeout, poll_frequency=0.1)
+
+    @property
+    def driver(self):
+        """WebDriver (처음 사용할 때 브라우저 실행)"""
+        if self._driver is None:
+            self._start_browser()
+        return self._driver
+
+    @property
+    def wait(self):
+        if self._wait is None:
+            self._start_browser()
+        return self._wait
+
+    def _open_page(self, url, ready_selector=None):
+        """
+        브라우저로 페이지를 열고 준비될 때까지 대기 (고정 sleep 대신 조건 대기)
+
+        ready_selector가 있으면 해당 요소가 나타날 때까지, 없으면
+        document.readyState가 complete가 될 때까지 기다립니다.
+        """
+        self.limiter.acquire(url)
+        self.driver.get(url)
+        if ready_selector:
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector)))
+        else:
+            self.wait.until(lambda driver: driver.execute_script('return document.readyState') == 'complete')
+
     def find_press_link(self, press_name):
         """언론사 이름으로 링크 찾기"""
         try:
-            # 언론사 ID 매핑
-            press_ids = {
-                # 신문사
-                '한겨레': '028',
-                '조선일보': '023',
-                '중앙일보': '025',
-                '동아일보': '020',
-                '경향신문': '032',
-                '한국일보': '469',
-                '서울신문': '081',
-                '세계일보': '022',
-                '문화일보': '021',
-                '국민일보': '005',
-                '매일신문': '088',
-                '부산일보': '082',
-                '전북일보': '087',
-                '전주일보': '086',
-                '강원일보': '085',
-                '대구일보': '084',
-                '광주일보': '083',
-                '제주일보': '089',
-                '경남일보': '090',
-                '경북일보': '091',
-                
-                # 방송사
-                'KBS': '056',
-                'MBC': '214',
-                'SBS': '055',
-                'YTN': '052',
-                '채널A': '277',
-                'TV조선': '448',
-                'MBN': '057',
-                '연합뉴스TV': '422',
-                'CBS': '079',
-                'BBS': '078',
-                'TBS': '077',
-                'OBS': '353',
-                'G1': '076',
-                'KNN': '075',
-                'TJB': '074',
-                'JTV': '073',
-                'KBC': '072',
-                'JIBS': '071',
-                'KBSN': '070',
-                'KBS WORLD': '069',
-                
-                # 통신사
-                '연합뉴스': '001',
-                '뉴시스': '003',
-                '뉴스1': '421',
-                '뉴스타운': '006',
-                '아시아경제': '277',
-                '매일경제': '009',
-                '한국경제': '015',
-                '파이낸셜뉴스': '014',
-                '서울경제': '011',
-                '헤럴드경제': '016',
-                '이데일리': '018',
-                '머니투데이': '008',
-                '아시아투데이': '007',
-                '디지털타임스': '029',
-                '전자신문': '030',
-                'ZDNet Korea': '092',
-                '테크홀릭': '093',
-                'IT조선': '094',
-                'IT동아': '095',
-                'IT월드': '096',
-                '오마이뉴스': '047'
-            }
-            
-            if press_name in press_ids:
-                press_id = press_ids[press_name]
-                return f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={press_id}"
+            if press_name in PRESS_IDS:
+                press_id = PRESS_IDS[press_name]
+                return f"{self.base_url}/main/list.naver?mode=LPOD&mid=sec&oid={press_id}"
             
             # ID가 없는 경우 기존 방식으로 검색
-            self.driver.get("https://news.naver.com/main/officeList.naver")
-            time.sleep(2)
+            self._open_page(f"{self.base_url}/main/officeList.naver", "a[href*='mode=LPOD']")
             
             # 언론사 링크 찾기
             press_links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='mode=LPOD']")
@@ -157,12 +285,7 @@ class NaverNewsCrawler:
                 
             # 모바일 URL을 데스크톱 URL로 변환
             if 'n.news.naver.com/mnews' in current_url:
-                article_id = current_url.split('/')[-1]
-                oid = article_id.split('_')[0]
-                aid = article_id.split('_')[1]
-                desktop_url = f"https://news.naver.com/main/read.naver?mode=LSD&mid=sec&oid={oid}&aid={aid}"
-                self.driver.get(desktop_url)
-                time.sleep(2)
+                self._open_page(to_desktop_url(current_url, self.base_url), ARTICLE_READY_SELECTOR)
                 
             # 카테고리 확인
             try:
@@ -189,118 +312,57 @@ class NaverNewsCrawler:
         return False
             
     def get_news_content(self):
-        """뉴스 기사 내용 가져오기"""
+        """
+        뉴스 기사 내용 가져오기
+
+        제목/본문 중 하나가 나타날 때까지 한 번만 기다린 뒤 page_source를 한 번 받아
+        모든 필드를 로컬에서 파싱합니다 (chromedriver 왕복 최소화).
+        """
         try:
             # 모바일 URL을 데스크톱 URL로 변환
             current_url = self.driver.current_url
             if 'n.news.naver.com/mnews' in current_url:
-                # URL에서 oid와 aid 추출
-                parts = current_url.split('/')
-                oid = parts[-2]  # 028
-                aid = parts[-1]  # 0002747473
-                desktop_url = f"https://news.naver.com/main/read.naver?mode=LSD&mid=sec&oid={oid}&aid={aid}"
+                desktop_url = to_desktop_url(current_url, self.base_url)
                 # print(f"데스크톱 URL로 변환: {desktop_url}")
-                self.driver.get(desktop_url)
-                time.sleep(1)  # 2초에서 1초로 감소
+                self._open_page(desktop_url)
 
-            # 기본 정보 추출 - 명시적 대기 추가
-            title = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "h2.media_end_head_headline, h3.tit_view"))
-            ).text
-
-            # 본문 내용 추출 - 여러 선택자 시도
-            content = None
-            for selector in ["div#newsct_article", "div#articeBody", "div#articleBodyContents"]:
-                try:
-                    content = self.wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    ).text
-                    if content:
-                        break
-                except:
-                    continue
-
-            if not content:
-                # print("본문 내용을 찾을 수 없습니다.")
-                return None
-            
-            # 작성일시와 수정일시
-            try:
-                date_elements = self.driver.find_elements(By.CSS_SELECTOR, "span.media_end_head_info_datestamp_time, span.date, span.media_end_head_info_datestamp")
-                # print(f"찾은 날짜 요소 수: {len(date_elements)}")
-                created_date = date_elements[0].text if len(date_elements) > 0 else None
-                modified_date = date_elements[1].text if len(date_elements) > 1 else None
-            except Exception as e:
-                # print(f"날짜 정보 추출 중 에러: {str(e)}")
-                created_date = None
-                modified_date = None
-            
-            # 기자 정보
-            try:
-                journalist = self.driver.find_element(By.CSS_SELECTOR, "em.media_end_head_journalist_name, span.writer, span.media_end_head_journalist").text
-            except Exception as e:
-                # print(f"기자 정보 추출 중 에러: {str(e)}")
-                journalist = None
-            
-            # 댓글 수 추출
-            try:
-                comment_count = self.driver.find_element(By.CSS_SELECTOR, "a.media_end_head_cmtcount_button, a.cmt_count, span.media_end_head_cmtcount").text
-                comment_count = int(re.sub(r'[^0-9]', '', comment_count))
-            except Exception as e:
-                # print(f"댓글 수 추출 중 에러: {str(e)}")
-                comment_count = 0
-            
-            # 관련 기사 추출
-            related_articles = []
-            try:
-                related_items = self.driver.find_elements(By.CSS_SELECTOR, "li.media_end_linked_item, li.related_item, div.media_end_head_related_news li")
-                # print(f"찾은 관련 기사 수: {len(related_items)}")
-                for item in related_items:
-                    try:
-                        related_title = item.find_element(By.CSS_SELECTOR, "a.media_end_linked_item_inner, a.related_tit, a").text
-                        related_url = item.find_element(By.CSS_SELECTOR, "a.media_end_linked_item_inner, a.related_tit, a").get_attribute("href")
-                        related_articles.append({
-                            'title': related_title,
-                            'url': related_url
-                        })
-                    except Exception as e:
-                        # print(f"관련 기사 항목 처리 중 에러: {str(e)}")
-                        continue
-            except Exception as e:
-                # print(f"관련 기사 추출 중 에러: {str(e)}")
-                pass
-            
-            return {
-                'title': title,
-                'content': content,
-                'created_date': created_date,
-                'modified_date': modified_date,
-                'journalist': journalist,
-                'comment_count': comment_count,
-                'related_articles': related_articles
-            }
+            # 선택자마다 따로 기다리지 않고 어느 하나라도 나타나면 진행
+            self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ARTICLE_READY_SELECTOR))
+            )
+            news_info = parse_news_content(self.driver.page_source, self.base_url)
+            # if not news_info:
+            #     print("제목 또는 본문 내용을 찾을 수 없습니다.")
+            return news_info
         except Exception as e:
             print(f"Error extracting news content: {str(e)}")
             print(f"현재 URL: {self.driver.current_url}")
             return None
             
-    def crawl_press_news(self, press_name, start_date=None, end_date=None):
+    def crawl_press_news(self, press_name, start_date=None, end_date=None, retries=1):
         """
         특정 언론사의 정치 뉴스를 크롤링하는 함수
+
+        요청한 기간의 날짜 목록을 먼저 만들고, 날짜마다 해당 날짜의 목록 URL로
+        바로 이동해 독립적으로 수집합니다. 실패한 날짜만 다시 시도합니다.
         
         Args:
             press_name (str): 언론사 이름
-            start_date (str): 시작 날짜 (YYYY-MM-DD)
-            end_date (str): 종료 날짜 (YYYY-MM-DD)
+            start_date (str): 시작 날짜 (YYYY-MM-DD, 생략 시 종료 날짜 하루만)
+            end_date (str): 종료 날짜 (YYYY-MM-DD, 생략 시 오늘)
+            retries (int): 날짜별 재시도 횟수
+
+        Returns:
+            int: 새로 수집한 기사 수
         """
-        # 날짜 형식 검증
+        end_date = end_date or datetime.now().strftime('%Y-%m-%d')
+        start_date = start_date or end_date
+
+        # 날짜 형식 검증 및 수집할 날짜 목록 생성
         try:
-            if start_date:
-                start_datetime = datetime.strptime(start_date, '%Y-%m-%d')
-            if end_date:
-                end_datetime = datetime.strptime(end_date, '%Y-%m-%d')
-        except ValueError:
-            print("날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+            days = date_range(start_date, end_date)
+        except ValueError as e:
+            print(f"날짜가 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요. ({e})")
             return
 
         # 언론사 링크 찾기
@@ -308,222 +370,258 @@ class NaverNewsCrawler:
         if not press_url:
             print(f"언론사 '{press_name}'를 찾을 수 없습니다.")
             return
-            
-        # 정치 섹션으로 이동
         politics_url = press_url + "&sid1=100"  # 정치 섹션 ID 추가
-        self.driver.get(politics_url)
-        # print(f"{press_name} 뉴스 페이지를 여는 중입니다...")
-        time.sleep(1)  # 3초에서 1초로 감소
-        
-        news_data = []
-        page_count = 1
-        previous_date = None
-        current_date = datetime.now()  # 초기 날짜 설정
-        print("=" * 30)
-        print(f"현재 페이지 날짜: {current_date.strftime('%Y-%m-%d')}")
-        print("=" * 30)
-        
-        while True:
+
+        total_count = 0
+        failed_days = []
+        # 최신 날짜부터 수집
+        for day in reversed(days):
+            print("=" * 30)
+            print(f"현재 페이지 날짜: {day}")
+            print("=" * 30)
+            for attempt in range(retries + 1):
+                try:
+                    total_count += self.crawl_press_day(press_name, day, politics_url)
+                    self.commit_days(press_name, [day])
+                    break
+                except Exception as e:
+                    if "invalid session id" in str(e):
+                        print("브라우저 세션이 종료되었습니다. 재연결을 시도합니다...")
+                        self.reconnect_browser()
+                    print(f"{day} 수집 실패 ({attempt + 1}/{retries + 1}): {e}")
+            else:
+                failed_days.append(day)
+
+        if failed_days:
+            print(f"수집하지 못한 날짜: {', '.join(failed_days)} (다시 실행하면 중단된 위치부터 이어서 수집)")
+        print(f"\n크롤링 완료: {total_count}개의 정치 뉴스가 {self.output_dir}/press={press_name}/ 에 저장되었습니다.")
+        return total_count
+
+    def _http_get(self, url, stage, press_name=None, date=None):
+        """HTTP로 페이지를 받으며 소요 시간, 재시도, 타임아웃 기록"""
+        try:
+            with self.metrics.stage(stage, press_name, date):
+                response = self.fetcher.get_response(url)
+        except requests.Timeout:
+            self.metrics.increment('timeouts', press_name, date)
+            raise
+        retries = getattr(response, 'retries', 0)
+        if retries:
+            self.metrics.increment('retries', press_name, date, retries)
+        return response.text
+
+    def fetch_news_content(self, news_url, press_name=None, date=None):
+        """
+        HTTP로 기사 페이지를 받아 파싱, 실패하면 Selenium으로 재시도
+        (Selenium 엔진은 바로 브라우저로 처리)
+
+        Args:
+            news_url (str): 목록 페이지의 기사 링크
+            press_name (str): 계측용 언론사 이름
+            date (str): 계측용 목록 날짜 (YYYY-MM-DD)
+
+        Returns:
+            dict: get_news_content와 같은 필드, 실패 시 None
+        """
+        desktop_url = to_desktop_url(news_url, self.base_url)
+        if self.engine == 'http':
+            try:
+                html = self._http_get(desktop_url, 'article_fetch', press_name, date)
+                with self.metrics.stage('extract', press_name, date):
+                    news_info = parse_news_content(html, self.base_url)
+                if news_info:
+                    return news_info
+            except requests.RequestException as e:
+                print(f"HTTP 요청 실패: {e}")
+            self.metrics.increment('fallbacks', press_name, date)
+
+        # Selenium 엔진이거나 파싱에 실패한 페이지는 브라우저로 처리
+        with self._browser_lock:
             try:
-                # 시작 날짜와 비교 (같은 날짜도 포함)
-                if start_date and current_date < start_datetime:
-                    print(f"현재 날짜({current_date.strftime('%Y-%m-%d')})가 시작 날짜({start_date})보다 이전입니다. 크롤링을 종료합니다.")
+                with self.metrics.stage('article_fetch', press_name, date):
+                    self._open_page(desktop_url, ARTICLE_READY_SELECTOR)
+                with self.metrics.stage('extract', press_name, date):
+                    return self.get_news_content()
+            except TimeoutException as e:
+                self.metrics.increment('timeouts', press_name, date)
+                self.metrics.increment('errors', press_name, date)
+                print(f"Selenium 폴백 시간 초과: {e}")
+                return None
+            except Exception as e:
+                self.metrics.increment('errors', press_name, date)
+                print(f"Selenium 폴백 실패: {e}")
+                return None
+
+    def _build_list_url(self, politics_url, date, page):
+        """목록 URL의 date, page 파라미터 설정"""
+        parsed = urlparse(politics_url)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        query['date'] = date.strftime('%Y%m%d')
+        query['page'] = str(page)
+        return urlunparse(parsed._replace(query=urlencode(query)))
+
+    def crawl_press_day(self, press_name, date, politics_url=None):
+        """
+        특정 언론사의 하루치 정치 뉴스를 수집해 샤드 파일로 기록
+
+        목록 페이지의 기사가 모두 모이면 writer에 기록한 뒤 인덱스에 기사와
+        페이지 진행 위치를 남깁니다. 이미 수집한 기사는 받지 않고, 중단된 지난
+        날짜는 마지막으로 끝낸 페이지 다음부터 이어서 수집합니다.
+
+        받지 못한 기사가 있으면 그 페이지부터는 진행 위치를 올리지 않고, 받은 기사를
+        확정한 뒤 IncompleteDayError를 발생시킵니다 (완료 표시를 하지 않으므로 재시도나
+        다음 실행에서 받지 못한 기사만 다시 받음).
+
+        Args:
+            press_name (str): 언론사 이름
+            date (str): 수집할 날짜 (YYYY-MM-DD)
+            politics_url (str): 언론사 정치 섹션 목록 URL (생략 시 검색)
+
+        Returns:
+            int: 새로 수집한 기사 수
+
+        Raises:
+            IncompleteDayError: 받지 못한 기사가 있을 때
+        """
+        day = datetime.strptime(date, '%Y-%m-%d')
+        if politics_url is None:
+            press_url = self.find_press_link(press_name)
+            if not press_url:
+                raise ValueError(f"언론사 '{press_name}'를 찾을 수 없습니다.")
+            politics_url = press_url + "&sid1=100"
+
+        page_count = 1
+        cursor = self.index.get_cursor(press_name, date)
+        if cursor and cursor['done']:
+            print(f"[{press_name} {date}] 이미 수집을 마친 날짜입니다. 건너뜁니다.")
+            return 0
+        # 오늘 목록은 새 기사가 앞에 추가되며 페이지가 밀리므로 처음부터 확인
+        if cursor and day.date() < datetime.now().date():
+            page_count = cursor['last_page'] + 1
+            print(f"[{press_name} {date}] {page_count}페이지부터 재개")
+
+        max_pending = self.max_workers * 2
+        pending = deque()
+        page_records = []
+        collected = 0
+        failed = 0
+        page_failed = 0
+        workers = self.max_workers if self.engine == 'http' else 1
+
+        def consume(entry):
+            nonlocal collected, failed, page_failed
+            item, future = entry
+            # 페이지 경계: 그 페이지의 기사가 모두 모였으므로 기록
+            if future is None:
+                failed += page_failed
+                with self.metrics.stage('write', press_name, date):
+                    self.writer.write_batch(press_name, date, page_records)
+                    # 한 번이라도 실패한 페이지가 있으면 그 뒤로는 진행 위치를 올리지 않음
+                    self.index.record_page(press_name, date, item, page_records, advance=failed == 0)
+                self.metrics.increment('pages', press_name, date)
+                self.metrics.increment('articles', press_name, date, len(page_records))
+                page_records.clear()
+                page_failed = 0
+                return
+            news_info = self._collect_news(entry, press_name)
+            if news_info:
+                collected += 1
+                page_records.append(news_info)
+                print(f"[{collected}] {news_info['title']}")
+            else:
+                page_failed += 1
+
+        with self.metrics.stage('day', press_name, date), ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                html = self._load_list_page(self._build_list_url(politics_url, day, page_count), press_name, date)
+                news_items = parse_news_list(html, self.base_url)
+                new_items = self.index.filter_unseen(news_items)
+                print(f"[{press_name} {date}] 페이지 {page_count}: {len(news_items)}개 항목 (새 기사 {len(new_items)}개)")
+
+                for item in new_items:
+                    pending.append((item, executor.submit(self.fetch_news_content, item['url'], press_name, date)))
+                    while len(pending) >= max_pending:
+                        consume(pending.popleft())
+                pending.append((page_count, None))
+
+                if not has_next_page(html, page_count):
                     break
-                
-                # 뉴스 목록 대기
-                news_items = self.wait.until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "ul.type06_headline li, ul.type06 li"))
-                )
-                
-                print("-" * 30)
-                print(f"현재 페이지: {page_count}")
-                print(f"현재 페이지에서 {len(news_items)}개의 뉴스 항목을 찾았습니다.")
-                print("-" * 30)
-                
-                # 현재 페이지의 뉴스 데이터 수집
-                for item in news_items:
-                    try:
-                        # 뉴스 링크와 제목 찾기
-                        news_link = item.find_element(By.CSS_SELECTOR, "dt:not(.photo) a")
-                        title = news_link.text.strip()
-                        news_url = news_link.get_attribute("href")
-                        
-                        if not title or not news_url:
-                            # print("제목 또는 링크가 비어있어 건너뜁니다.")
-                            continue
-                            
-                        # print(f"뉴스 제목: {title}")
-                        # print(f"뉴스 링크: {news_url}")
-                        
-                        # 새 탭에서 뉴스 열기
-                        self.driver.execute_script(f"window.open('{news_url}', '_blank');")
-                        time.sleep(0.5)  # 2초에서 0.5초로 감소
-                        
-                        # 새 탭으로 전환
-                        if len(self.driver.window_handles) <= 1:
-                            # print("새 탭이 열리지 않았습니다.")
-                            continue
-                            
-                        self.driver.switch_to.window(self.driver.window_handles[-1])
-                        # print(f"새 탭으로 전환됨. 현재 URL: {self.driver.current_url}")
-                        
-                        # 페이지 로딩 대기
-                        self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                        
-                        # 뉴스 내용 가져오기
-                        news_info = self.get_news_content()
-                        if news_info:
-                            news_info['press'] = press_name
-                            news_info['url'] = news_url
-                            news_data.append(news_info)
-                            print(f"[{len(news_data)}] {news_info['title']}")  # 진행 상황 표시는 유지
-                        else:
-                            print("뉴스 내용을 가져오지 못했습니다.")
-                            pass
-                            
-                    except Exception as e:
-                        if "invalid session id" in str(e):
-                            print("브라우저 세션이 종료되었습니다. 재연결을 시도합니다...")
-                            self.reconnect_browser()
-                            # 현재 페이지부터 다시 시작
-                            return self.crawl_press_news(press_name, start_date, end_date)
-                        else:
-                            print(f"에러 발생: {str(e)}")
-                    finally:
-                        # 탭이 열려있다면 닫기
-                        if len(self.driver.window_handles) > 1:
-                            self.driver.close()
-                            self.driver.switch_to.window(self.driver.window_handles[0])
-                
-                # 다음 페이지 버튼 확인
-                try:
-                    # 다음 페이지 링크 찾기
-                    next_page_link = self.driver.find_element(By.CSS_SELECTOR, f"div.paging a[href*='page={page_count + 1}']")
-                    if next_page_link:
-                        next_page_link.click()
-                        time.sleep(1)  # 3초에서 1초로 감소
-                        page_count += 1
-                        # print(f"다음 페이지로 이동합니다...")
-                    else:
-                        print("다음 페이지가 없습니다.")
-                        # 다음 날짜로 이동
-                        current_url = self.driver.current_url
-                        if 'date=' in current_url:
-                            current_date_str = current_date.strftime('%Y%m%d')
-                            next_date = current_date - timedelta(days=1)
-                            next_date_str = next_date.strftime('%Y%m%d')
-                            next_url = current_url.replace(f'date={current_date_str}', f'date={next_date_str}')
-                            self.driver.get(next_url)
-                            time.sleep(1)  # 3초에서 1초로 감소
-                            page_count = 1
-                            previous_date = current_date
-                            current_date = next_date
-                            print("=" * 30)
-                            print(f"현재 페이지 날짜: {current_date.strftime('%Y-%m-%d')}")
-                            print("=" * 30)
-                        else:
-                            # date 파라미터가 없는 경우 직접 추가
-                            next_date = current_date - timedelta(days=1)
-                            next_date_str = next_date.strftime('%Y%m%d')
-                            if '?' in current_url:
-                                next_url = f"{current_url}&date={next_date_str}"
-                            else:
-                                next_url = f"{current_url}?date={next_date_str}"
-                            self.driver.get(next_url)
-                            time.sleep(1)  # 3초에서 1초로 감소
-                            page_count = 1
-                            previous_date = current_date
-                            current_date = next_date
-                            print("=" * 30)
-                            print(f"현재 페이지 날짜: {current_date.strftime('%Y-%m-%d')}")
-                            print("=" * 30)
-                except NoSuchElementException:
-                    print("다음 페이지를 찾을 수 없습니다.")
-                    # 다음 날짜로 이동
-                    current_url = self.driver.current_url
-                    if 'date=' in current_url:
-                        current_date_str = current_date.strftime('%Y%m%d')
-                        next_date = current_date - timedelta(days=1)
-                        next_date_str = next_date.strftime('%Y%m%d')
-                        next_url = current_url.replace(f'date={current_date_str}', f'date={next_date_str}')
-                        self.driver.get(next_url)
-                        time.sleep(1)  # 3초에서 1초로 감소
-                        page_count = 1
-                        previous_date = current_date
-                        current_date = next_date
-                        print("=" * 30)
-                        print(f"현재 페이지 날짜: {current_date.strftime('%Y-%m-%d')}")
-                        print("=" * 30)
-                    else:
-                        # date 파라미터가 없는 경우 직접 추가
-                        next_date = current_date - timedelta(days=1)
-                        next_date_str = next_date.strftime('%Y%m%d')
-                        if '?' in current_url:
-                            next_url = f"{current_url}&date={next_date_str}"
-                        else:
-                            next_url = f"{current_url}?date={next_date_str}"
-                        self.driver.get(next_url)
-                        time.sleep(1)  # 3초에서 1초로 감소
-                        page_count = 1
-                        previous_date = current_date
-                        current_date = next_date
-                        print("=" * 30)
-                        print(f"현재 페이지 날짜: {current_date.strftime('%Y-%m-%d')}")
-                        print("=" * 30)
-                    
+                page_count += 1
+
+            while pending:
+                consume(pending.popleft())
+
+        if failed:
+            # 받은 기사는 확정해 두고, 날짜는 완료로 표시하지 않음
+            self.writer.close_partition(press_name, date)
+            raise IncompleteDayError(press_name, date, failed, collected)
+        return collected
+
+    def commit_days(self, press_name, days):
+        """
+        수집을 마친 날짜의 샤드를 확정하고, 지난 날짜는 완료로 표시
+        (오늘은 기사가 계속 추가되므로 다음 실행에서 새 기사만 다시 확인)
+        """
+        today = datetime.now().strftime('%Y-%m-%d')
+        for day in days:
+            self.writer.close_partition(press_name, day)
+            if day < today:
+                self.index.mark_day_done(press_name, day)
+
+    def _load_list_page(self, list_url, press_name=None, date=None):
+        """목록 페이지 HTML 가져오기 (엔진에 따라 HTTP 또는 브라우저)"""
+        if self.engine == 'http':
+            return self._http_get(list_url, 'list_load', press_name, date)
+        with self._browser_lock:
+            try:
+                with self.metrics.stage('list_load', press_name, date):
+                    self._open_page(list_url)
             except TimeoutException:
-                print("페이지 로딩 시간 초과. 현재까지 수집된 데이터를 저장합니다.")
-                break
-                
-        # DataFrame 생성 및 저장
+                self.metrics.increment('timeouts', press_name, date)
+                raise
+            return self.driver.page_source
+
+    def _collect_news(self, entry, press_name):
+        """완료된 기사 작업 결과 반환 (실패 시 None)"""
+        item, future = entry
         try:
-            if news_data:
-                # 관련 기사 정보를 별도의 컬럼으로 분리
-                for news in news_data:
-                    if 'related_articles' in news:
-                        related_titles = [article['title'] for article in news['related_articles']]
-                        related_urls = [article['url'] for article in news['related_articles']]
-                        news['related_titles'] = '|'.join(related_titles)
-                        news['related_urls'] = '|'.join(related_urls)
-                        del news['related_articles']
-                
-                df = pd.DataFrame(news_data)
-                
-                # 컬럼 순서 지정
-                columns = [
-                    'title', 'content', 'press', 'url', 'created_date', 'modified_date',
-                    'journalist', 'comment_count', 'related_titles', 'related_urls'
-                ]
-                df = df[columns]
-                
-                # data 디렉토리가 없으면 생성
-                os.makedirs('data', exist_ok=True)
-                
-                # 파일명에 날짜 포함
-                filename = f"data/{press_name}_politics_news_{start_date}_to_{end_date}.csv"
-                df.to_csv(filename, index=False, encoding='utf-8-sig')
-                print(f"\n크롤링 완료: {len(news_data)}개의 정치 뉴스가 {filename}에 저장되었습니다.")
-            else:
-                print("\n수집된 정치 뉴스가 없습니다.")
+            news_info = future.result()
         except Exception as e:
-            print(f"\n데이터 저장 중 오류 발생: {str(e)}")
-            # 임시 파일로 저장 시도
-            try:
-                temp_filename = f"data/{press_name}_politics_news_temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                df.to_csv(temp_filename, index=False, encoding='utf-8-sig')
-                print(f"임시 파일로 저장 완료: {temp_filename}")
-            except Exception as e2:
-                print(f"임시 파일 저장도 실패: {str(e2)}")
+            print(f"에러 발생: {str(e)}")
+            news_info = None
+
+        if news_info:
+            news_info['press'] = press_name
+            news_info['url'] = item['url']
+        else:
+            print("뉴스 내용을 가져오지 못했습니다.")
+        return news_info
         
+    def export_metrics(self, path):
+        """계측 결과 내보내기 (.prom이면 Prometheus 텍스트, 그 외 JSON)"""
+        self.metrics.export(path)
+
     def close(self):
-        """브라우저 종료"""
-        self.driver.quit() 
+        """브라우저 및 HTTP 세션 종료, 열린 샤드 확정, 계측 결과 내보내기"""
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
+        if self.fetcher is not None:
+            self.fetcher.close()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+        if self.metrics_path:
+            self.export_metrics(self.metrics_path)
         
     def reconnect_browser(self):
         """브라우저 재연결"""
         try:
-            self.driver.quit()
+            self._driver.quit()
         except:
             pass
-        self.__init__() 
+        self._start_browser() 
         
\ No newline at end of file
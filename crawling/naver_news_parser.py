@@ -0,0 +1,149 @@
+from bs4 import BeautifulSoup
+from urllib.parse import urljoin, urlparse, parse_qs
+import re
+
+NAVER_NEWS_URL = "https://news.naver.com"
+
+# 목록/기사 페이지 선택자 (Selenium 경로와 동일하게 유지)
+NEWS_LIST_SELECTOR = "ul.type06_headline li, ul.type06 li"
+NEWS_LINK_SELECTOR = "dt:not(.photo) a"
+TITLE_SELECTOR = "h2.media_end_head_headline, h3.tit_view"
+CONTENT_SELECTORS = ["div#newsct_article", "div#articeBody", "div#articleBodyContents"]
+DATE_SELECTOR = "span.media_end_head_info_datestamp_time, span.date, span.media_end_head_info_datestamp"
+JOURNALIST_SELECTOR = "em.media_end_head_journalist_name, span.writer, span.media_end_head_journalist"
+COMMENT_COUNT_SELECTOR = "a.media_end_head_cmtcount_button, a.cmt_count, span.media_end_head_cmtcount"
+RELATED_ITEM_SELECTOR = "li.media_end_linked_item, li.related_item, div.media_end_head_related_news li"
+RELATED_LINK_SELECTOR = "a.media_end_linked_item_inner, a.related_tit, a"
+
+
+def make_soup(html):
+    """lxml이 있으면 lxml, 없으면 내장 파서로 파싱"""
+    try:
+        return BeautifulSoup(html, 'lxml')
+    except Exception:
+        return BeautifulSoup(html, 'html.parser')
+
+
+def element_text(element):
+    """브라우저의 innerText와 비슷하게 요소의 텍스트 추출"""
+    if element is None:
+        return ''
+    for tag in element.find_all(['script', 'style', 'noscript']):
+        tag.decompose()
+    for br in element.find_all('br'):
+        br.replace_with('\n')
+    lines = [re.sub(r'[ \t\xa0]+', ' ', line).strip() for line in element.get_text().split('\n')]
+    text = '\n'.join(lines)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def extract_article_ids(url):
+    """기사 URL에서 (oid, aid) 추출, 실패 시 None"""
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    if 'oid' in query and 'aid' in query:
+        return query['oid'][0], query['aid'][0]
+
+    # 모바일 URL: https://n.news.naver.com/mnews/article/028/0002747473
+    match = re.search(r'/article/(\d+)/(\d+)', parsed.path)
+    if match:
+        return match.group(1), match.group(2)
+    return None
+
+
+def to_desktop_url(url, base_url=NAVER_NEWS_URL):
+    """모바일 기사 URL을 read.naver 데스크톱 URL로 변환"""
+    if 'n.news.naver.com/mnews' not in url:
+        return url
+    ids = extract_article_ids(url)
+    if not ids:
+        return url
+    oid, aid = ids
+    return f"{base_url}/main/read.naver?mode=LSD&mid=sec&oid={oid}&aid={aid}"
+
+
+def parse_news_list(html, base_url=NAVER_NEWS_URL):
+    """뉴스 목록 페이지에서 기사 제목과 링크 추출"""
+    soup = make_soup(html)
+    news_items = []
+    for item in soup.select(NEWS_LIST_SELECTOR):
+        news_link = item.select_one(NEWS_LINK_SELECTOR)
+        if news_link is None:
+            continue
+        title = news_link.get_text().strip()
+        news_url = news_link.get('href')
+        if not title or not news_url:
+            continue
+        news_items.append({
+            'title': title,
+            'url': urljoin(base_url, news_url)
+        })
+    return news_items
+
+
+def has_next_page(html, page):
+    """목록 페이지에 다음 페이지 링크가 있는지 확인"""
+    soup = make_soup(html)
+    return soup.select_one(f"div.paging a[href*='page={page + 1}']") is not None
+
+
+def parse_news_content(html, base_url=NAVER_NEWS_URL):
+    """
+    기사 페이지 HTML에서 get_news_content와 같은 필드 추출
+
+    Returns:
+        dict: 제목이나 본문을 찾지 못하면 None
+    """
+    soup = make_soup(html)
+
+    title_element = soup.select_one(TITLE_SELECTOR)
+    if title_element is None:
+        return None
+    title = element_text(title_element)
+
+    # 본문 내용 추출 - 여러 선택자 시도
+    content = None
+    for selector in CONTENT_SELECTORS:
+        content = element_text(soup.select_one(selector))
+        if content:
+            break
+    if not content:
+        return None
+
+    # 작성일시와 수정일시
+    date_elements = soup.select(DATE_SELECTOR)
+    created_date = element_text(date_elements[0]) if len(date_elements) > 0 else None
+    modified_date = element_text(date_elements[1]) if len(date_elements) > 1 else None
+
+    # 기자 정보
+    journalist_element = soup.select_one(JOURNALIST_SELECTOR)
+    journalist = element_text(journalist_element) if journalist_element is not None else None
+
+    # 댓글 수
+    comment_count = 0
+    comment_element = soup.select_one(COMMENT_COUNT_SELECTOR)
+    if comment_element is not None:
+        digits = re.sub(r'[^0-9]', '', element_text(comment_element))
+        comment_count = int(digits) if digits else 0
+
+    # 관련 기사
+    related_articles = []
+    for item in soup.select(RELATED_ITEM_SELECTOR):
+        link = item.select_one(RELATED_LINK_SELECTOR)
+        if link is None:
+            continue
+        related_articles.append({
+            'title': element_text(link),
+            'url': urljoin(base_url, link.get('href') or '')
+        })
+
+    return {
+        'title': title,
+        'content': content,
+        'created_date': created_date,
+        'modified_date': modified_date,
+        'journalist': journalist,
+        'comment_count': comment_count,
+        'related_articles': related_articles
+    }
@@ -0,0 +1,194 @@
+from datetime import datetime
+import glob
+import json
+import os
+import re
+import uuid
+
+import pandas as pd
+
+# 저장 컬럼 순서 (기존 CSV와 동일)
+COLUMNS = [
+    'title', 'content', 'press', 'url', 'created_date', 'modified_date',
+    'journalist', 'comment_count', 'related_titles', 'related_urls'
+]
+
+OUTPUT_FORMATS = ('jsonl', 'parquet')
+
+
+def flatten_record(record):
+    """관련 기사 목록을 related_titles/related_urls 컬럼으로 펼치고 컬럼 순서 정리"""
+    related_articles = record.get('related_articles') or []
+    flat = {column: record.get(column) for column in COLUMNS}
+    if 'related_articles' in record:
+        flat['related_titles'] = '|'.join(article['title'] for article in related_articles)
+        flat['related_urls'] = '|'.join(article['url'] for article in related_articles)
+    return flat
+
+
+def partition_dir(root, press, date):
+    """언론사/날짜 파티션 디렉토리"""
+    return os.path.join(root, f"press={press}", f"date={date}")
+
+
+class ShardedNewsWriter:
+    """
+    수집한 기사를 언론사/날짜 파티션별 샤드 파일로 바로바로 저장하는 writer
+
+    배치마다 파티션의 저널 파일(.journal, JSONL)에 추가하고 fsync 합니다.
+    저널이 max_shard_bytes를 넘거나 파티션을 닫으면 최종 형식(JSONL/Parquet)으로
+    변환해 임시 파일에 쓴 뒤 os.replace로 원자적으로 확정합니다.
+    비정상 종료로 남은 저널은 다음에 같은 파티션을 열 때 확정됩니다.
+
+    Args:
+        root (str): 출력 루트 디렉토리 (root/press=<언론사>/date=<YYYY-MM-DD>/part-*.jsonl)
+        output_format (str): 'jsonl' 또는 'parquet' (pyarrow 필요)
+        max_shard_bytes (int): 샤드 하나의 최대 크기 (저널 기준, 바이트)
+    """
+    def __init__(self, root='data/news', output_format='jsonl', max_shard_bytes=64 * 1024 * 1024):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"지원하지 않는 저장 형식입니다: {output_format}")
+        if output_format == 'parquet':
+            import pyarrow  # noqa: F401  (없으면 바로 알 수 있도록)
+        self.root = root
+        self.output_format = output_format
+        self.max_shard_bytes = max_shard_bytes
+        self._journals = {}
+        self._sequence = 0
+
+    def _new_journal_path(self, directory):
+        self._sequence += 1
+        name = f"part-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}-{self._sequence:04d}"
+        return os.path.join(directory, f".{name}.journal")
+
+    def _open_partition(self, press, date):
+        """파티션 저널 열기 (처음 열 때 남아 있던 저널 복구)"""
+        key = (press, date)
+        if key not in self._journals:
+            directory = partition_dir(self.root, press, date)
+            os.makedirs(directory, exist_ok=True)
+            for orphan in glob.glob(os.path.join(directory, '.*.journal')):
+                self._finalize(orphan)
+            self._journals[key] = self._new_journal_path(directory)
+        return self._journals[key]
+
+    def write_batch(self, press, date, records):
+        """
+        기사 묶음을 파티션 저널에 추가하고 디스크에 반영
+
+        Args:
+            press (str): 언론사 이름
+            date (str): 목록 날짜 (YYYY-MM-DD)
+            records (list): 기사 정보 dict 목록
+        """
+        if not records:
+            return
+        journal = self._open_partition(press, date)
+        with open(journal, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(flatten_record(record), ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        # 샤드 크기 제한을 넘으면 확정하고 새 샤드 시작
+        if os.path.getsize(journal) >= self.max_shard_bytes:
+            self._finalize(journal)
+            self._journals[(press, date)] = self._new_journal_path(os.path.dirname(journal))
+
+    def _finalize(self, journal):
+        """저널을 최종 샤드 파일로 원자적으로 확정"""
+        if not os.path.exists(journal):
+            return None
+        rows = []
+        with open(journal, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # 기록 도중 중단된 마지막 줄
+                    break
+        if not rows:
+            os.remove(journal)
+            return None
+
+        directory = os.path.dirname(journal)
+        name = os.path.basename(journal)[1:-len('.journal')]
+        final_path = os.path.join(directory, f"{name}.{self.output_format}")
+        temp_path = final_path + '.tmp'
+        if self.output_format == 'parquet':
+            df = pd.DataFrame(rows, columns=COLUMNS)
+            df['comment_count'] = pd.to_numeric(df['comment_count'], errors='coerce').fillna(0).astype('int64')
+            df.to_parquet(temp_path, index=False)
+        else:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, final_path)
+        os.remove(journal)
+        return final_path
+
+    def close_partition(self, press, date):
+        """파티션의 열린 샤드 확정"""
+        journal = self._journals.pop((press, date), None)
+        if journal is not None:
+            return self._finalize(journal)
+        return None
+
+    def close(self):
+        """열린 샤드 모두 확정"""
+        for press, date in list(self._journals):
+            self.close_partition(press, date)
+
+
+def iter_news_files(root='data/news', press=None, start_date=None, end_date=None):
+    """
+    조건에 맞는 파티션의 확정된 샤드 파일 경로 나열 (디렉토리 이름으로만 거름)
+
+    Args:
+        root (str): ShardedNewsWriter 출력 루트
+        press (str or list): 언론사 이름 (목록), None이면 전체
+        start_date (str): 시작 날짜 (YYYY-MM-DD, 포함)
+        end_date (str): 종료 날짜 (YYYY-MM-DD, 포함)
+
+    Yields:
+        tuple: (언론사, 날짜, 파일 경로)
+    """
+    if isinstance(press, str):
+        press = [press]
+    for press_dir in sorted(glob.glob(os.path.join(root, 'press=*'))):
+        press_name = os.path.basename(press_dir)[len('press='):]
+        if press is not None and press_name not in press:
+            continue
+        for date_dir in sorted(glob.glob(os.path.join(press_dir, 'date=*'))):
+            date = os.path.basename(date_dir)[len('date='):]
+            if start_date and date < start_date:
+                continue
+            if end_date and date > end_date:
+                continue
+            for path in sorted(os.listdir(date_dir)):
+                if re.match(r'part-.*\.(jsonl|parquet)$', path):
+                    yield press_name, date, os.path.join(date_dir, path)
+
+
+def read_news_file(path, columns=None):
+    """샤드 파일 하나를 DataFrame으로 읽기"""
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path, columns=columns)
+    df = pd.read_json(path, lines=True, dtype=False)
+    return df[columns] if columns else df
+
+
+def iter_news(root='data/news', press=None, start_date=None, end_date=None, columns=None):
+    """조건에 맞는 샤드를 하나씩 DataFrame으로 읽기 (메모리에 전체를 올리지 않음)"""
+    for _, _, path in iter_news_files(root, press, start_date, end_date):
+        yield read_news_file(path, columns)
+
+
+def read_news(root='data/news', press=None, start_date=None, end_date=None, columns=None):
+    """조건에 맞는 샤드를 모두 읽어 하나의 DataFrame으로 반환"""
+    frames = list(iter_news(root, press, start_date, end_date, columns))
+    if not frames:
+        return pd.DataFrame(columns=columns or COLUMNS)
+    return pd.concat(frames, ignore_index=True)
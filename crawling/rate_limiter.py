@@ -0,0 +1,100 @@
+from urllib.parse import urlparse
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기
+
+    Args:
+        rate (float): 초당 채워지는 토큰 수 (초당 요청 수)
+        burst (int): 버킷 용량 (순간적으로 허용하는 최대 요청 수)
+    """
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기하고 대기한 시간(초) 반환"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds):
+        """seconds 동안 새 토큰을 주지 않음 (429 Retry-After 등, 모든 스레드에 적용)"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # 남은 토큰을 버리고 seconds만큼 빚을 져서, 다음 토큰은 seconds 뒤에 생김
+            self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+
+class HostRateLimiter:
+    """
+    호스트별 토큰 버킷과 동시 요청 수 제한
+
+    Args:
+        rate (float): 호스트별 기본 초당 요청 수 (None 또는 0 이하면 제한 없음)
+        burst (int): 호스트별 버킷 용량
+        max_concurrent (int): 호스트별 최대 동시 요청 수
+        host_rates (dict): 호스트별 초당 요청 수 재정의 (예: {'n.news.naver.com': 3})
+    """
+    def __init__(self, rate=5.0, burst=10, max_concurrent=4, host_rates=None):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+        self.host_rates = host_rates or {}
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._semaphores = {}
+
+    def _bucket(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                rate = self.host_rates.get(host, self.rate)
+                self._buckets[host] = TokenBucket(rate, self.burst) if rate and rate > 0 else None
+            return self._buckets[host]
+
+    def _semaphore(self, host):
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.max_concurrent)
+            return self._semaphores[host]
+
+    def acquire(self, url):
+        """url 호스트의 토큰을 하나 얻을 때까지 대기 (브라우저 요청용)"""
+        bucket = self._bucket(urlparse(url).netloc)
+        return bucket.acquire() if bucket is not None else 0.0
+
+    def pause(self, url, seconds):
+        """
+        url 호스트 요청을 seconds 동안 멈춤 (속도 제한 응답을 받았을 때)
+
+        제한이 없는 호스트는 버킷이 없으므로 호출한 스레드만 기다립니다.
+        """
+        bucket = self._bucket(urlparse(url).netloc)
+        if bucket is not None:
+            bucket.pause(seconds)
+        else:
+            time.sleep(seconds)
+
+    def request(self, url, func):
+        """제한을 지키며 func() 실행"""
+        host = urlparse(url).netloc
+        with self._semaphore(host):
+            self.acquire(url)
+            return func()
@@ -1,36 +1,60 @@
 from naver_news_crawler import NaverNewsCrawler
+from crawl_orchestrator import run_batch
 from datetime import datetime, timedelta
+import argparse
 import sys
 
-def main():
+# 이미 수집한 기사와 진행 위치를 기록하는 디렉토리
+DEFAULT_STATE_DIR = 'data/.crawl_state'
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="네이버 뉴스 정치 기사 크롤러")
+    parser.add_argument('--press', nargs='+',
+                        help="크롤링할 언론사 이름 목록 또는 all (생략하면 대화형 모드)")
+    parser.add_argument('--start', help="시작 날짜 (YYYY-MM-DD, 기본값: 어제)")
+    parser.add_argument('--end', help="종료 날짜 (YYYY-MM-DD, 기본값: 오늘)")
+    parser.add_argument('--workers', type=int, default=4, help="작업자 프로세스 수")
+    parser.add_argument('--retries', type=int, default=2, help="실패한 작업 재시도 횟수")
+    parser.add_argument('--engine', choices=['http', 'selenium'], default='http', help="페이지 수집 엔진")
+    parser.add_argument('--max-workers', type=int, default=8, help="프로세스별 동시 기사 요청 수 (HTTP 엔진)")
+    parser.add_argument('--rate', type=float, default=5.0,
+                        help="프로세스별 호스트당 초당 요청 수 (토큰 버킷, 0이면 제한 없음)")
+    parser.add_argument('--burst', type=int, default=10, help="토큰 버킷 용량 (순간 허용 요청 수)")
+    parser.add_argument('--state-dir', default=DEFAULT_STATE_DIR,
+                        help="수집 기록(SQLite 인덱스) 디렉토리")
+    parser.add_argument('--output-dir', default='data/news', help="언론사/날짜별 샤드 저장 디렉토리")
+    parser.add_argument('--output-format', choices=['jsonl', 'parquet'], default='jsonl', help="샤드 파일 형식")
+    return parser.parse_args()
+
+def run_interactive():
     # 크롤러 인스턴스 생성
-    crawler = NaverNewsCrawler()
-    
+    crawler = NaverNewsCrawler(state_dir=DEFAULT_STATE_DIR)
+
     try:
         # 사용자 입력 받기
         print("\n=== 네이버 뉴스 크롤러 ===")
         print("크롤링할 언론사와 날짜를 입력해주세요.")
         print("(날짜를 입력하지 않으면 어제 날짜부터 크롤링합니다)")
         print("=" * 30)
-        
+
         # 언론사 이름 입력
         press_name = input("\n언론사 이름을 입력하세요: ")
-        
+
         # 시작 날짜 입력
         start_date = input("시작 날짜를 입력하세요 (YYYY-MM-DD, 생략 가능): ").strip()
         if not start_date:
             start_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-            
+
         # 종료 날짜는 오늘로 설정
         end_date = datetime.now().strftime('%Y-%m-%d')
-        
+
         print(f"\n크롤링 설정:")
         print(f"- 언론사: {press_name}")
         print(f"- 기간: {start_date} ~ {end_date}")
-        
+
         # 크롤링 실행
         crawler.crawl_press_news(press_name, start_date, end_date)
-        
+
     except KeyboardInterrupt:
         print("\n크롤링이 중단되었습니다.")
     except Exception as e:
@@ -39,5 +63,35 @@ def main():
         # 브라우저 종료
         crawler.close()
 
+def main():
+    args = parse_args()
+    if not args.press:
+        run_interactive()
+        return
+
+    start_date = args.start or (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    end_date = args.end or datetime.now().strftime('%Y-%m-%d')
+    press_names = 'all' if args.press == ['all'] else args.press
+
+    try:
+        summary = run_batch(
+            press_names, start_date, end_date,
+            workers=args.workers,
+            retries=args.retries,
+            engine=args.engine,
+            max_workers=args.max_workers,
+            requests_per_second=args.rate,
+            burst=args.burst,
+            state_dir=args.state_dir,
+            output_dir=args.output_dir,
+            output_format=args.output_format
+        )
+    except KeyboardInterrupt:
+        print("\n크롤링이 중단되었습니다.")
+        sys.exit(1)
+
+    if summary['failed']:
+        sys.exit(1)
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
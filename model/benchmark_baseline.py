@@ -0,0 +1,159 @@
+"""
+베이스라인 벤치마크 (노트북 TF-IDF + LogisticRegression vs 스트리밍 베이스라인)
+
+말뭉치 크기를 늘려 가며 학습 시간, 최대 메모리(tracemalloc), macro F1을 비교합니다.
+두 방법 모두 같은 CSV 파일에서 읽습니다 (노트북 방식은 전체를 한 번에, 스트리밍은 청크 단위로).
+--data를 주지 않으면 정당별로 단어 분포가 다른 합성 기사를 만들어 사용합니다.
+
+사용법:
+    python benchmark_baseline.py --sizes 2000 10000 50000
+    python benchmark_baseline.py --data ../data/정당_관점_라벨링_최종_업데이트.csv --sizes 500 1000
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import f1_score
+from sklearn.pipeline import Pipeline
+
+from streaming_baseline import StreamingBaselineModel, is_holdout, party_mapping, read_labeled_chunks
+
+
+class BaselineModel:
+    """baseline_model.ipynb의 BaselineModel (비교용 사본)"""
+    def __init__(self):
+        self.party_pipeline = Pipeline([
+            ('tfidf', TfidfVectorizer(max_features=5000, ngram_range=(1, 2), min_df=2, max_df=0.95)),
+            ('clf', LogisticRegression(max_iter=1000, class_weight='balanced', random_state=42))
+        ])
+
+    def train(self, train_texts, train_party_labels):
+        self.party_pipeline.fit(train_texts, train_party_labels)
+
+    def predict(self, texts):
+        return self.party_pipeline.predict(texts)
+
+
+def make_corpus(n, seed=42):
+    """정당별 단어 분포가 다른 합성 레이블 기사"""
+    rng = np.random.default_rng(seed)
+    common = [f'공통{i}' for i in range(3000)]
+    party_words = {party: [f'{party}어휘{i}' for i in range(300)] for party in party_mapping}
+    parties = rng.choice(list(party_mapping), size=n, p=[0.35, 0.4, 0.25])
+    titles, contents = [], []
+    for party in parties:
+        length = rng.integers(80, 400)
+        words = rng.choice(common, size=length).tolist()
+        # 레이블이 흐릿한 기사도 섞이도록 정당 어휘 비율을 다르게
+        own = rng.choice(party_words[party], size=rng.integers(2, 25)).tolist()
+        other = rng.choice(party_words[rng.choice(list(party_mapping))], size=rng.integers(0, 10)).tolist()
+        words = words + own + other
+        rng.shuffle(words)
+        titles.append(' '.join(words[:8]))
+        contents.append(' '.join(words[8:]))
+    return pd.DataFrame({'title_cleaned': titles, 'content_cleaned': contents, 'party': parties})
+
+
+def measure(fn):
+    """
+    함수 실행 시간(초)과 최대 메모리(MB)
+
+    tracemalloc은 실행을 느리게 하므로 시간은 추적 없이 한 번 더 실행해 잽니다.
+    """
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+def run_legacy(path):
+    """노트북과 같이 전체 CSV를 읽어 분할 후 학습"""
+    df = pd.read_csv(path)
+    df['party_label'] = df['party'].map(party_mapping)
+    df = df.dropna(subset=['title_cleaned', 'content_cleaned', 'party_label'])
+    df['text'] = df['title_cleaned'] + ' ' + df['content_cleaned']
+    holdout = df['text'].map(is_holdout)
+    model = BaselineModel()
+    model.train(df.loc[~holdout, 'text'].values, df.loc[~holdout, 'party_label'].values)
+    return model
+
+
+def run_streaming(path, epochs, chunksize):
+    """CSV를 청크로 읽어 검증용 기사를 빼고 학습"""
+    def chunks():
+        for texts, labels in read_labeled_chunks(path, chunksize):
+            keep = [i for i, text in enumerate(texts) if not is_holdout(text)]
+            yield [texts[i] for i in keep], labels[keep]
+
+    model = StreamingBaselineModel()
+    model.train_stream(chunks, epochs=epochs)
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="베이스라인 학습 시간/메모리/F1 벤치마크")
+    parser.add_argument('--data', help="레이블이 있는 기사 CSV (생략하면 합성 데이터)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 10000, 50000], help="말뭉치 크기")
+    parser.add_argument('--epochs', type=int, default=5, help="스트리밍 학습 반복 횟수")
+    parser.add_argument('--chunksize', type=int, default=2000, help="스트리밍 청크 크기")
+    args = parser.parse_args()
+
+    source = pd.read_csv(args.data) if args.data else None
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for n in args.sizes:
+            if source is not None:
+                corpus = source.sample(n=min(n, len(source)), random_state=42)
+            else:
+                corpus = make_corpus(n)
+            path = os.path.join(directory, f'corpus_{n}.csv')
+            corpus.to_csv(path, index=False)
+
+            # 검증 세트: 두 방법 모두 같은 해시 기준 검증 기사
+            val_texts, val_labels = [], []
+            for texts, labels in read_labeled_chunks(path):
+                for text, label in zip(texts, labels):
+                    if is_holdout(text):
+                        val_texts.append(text)
+                        val_labels.append(label)
+
+            legacy, legacy_seconds, legacy_mb = measure(lambda: run_legacy(path))
+            streaming, streaming_seconds, streaming_mb = measure(
+                lambda: run_streaming(path, args.epochs, args.chunksize)
+            )
+            # 저장/불러오기 왕복 확인 (불러온 모델의 예측이 같아야 함)
+            model_path = os.path.join(directory, f'streaming_{n}.joblib')
+            streaming.save(model_path)
+            restored = StreamingBaselineModel.load(model_path)
+            assert np.array_equal(restored.predict(val_texts)['party_probs'],
+                                  streaming.predict(val_texts)['party_probs'])
+
+            row = {
+                'articles': len(corpus),
+                'legacy_seconds': legacy_seconds,
+                'streaming_seconds': streaming_seconds,
+                'legacy_peak_mb': legacy_mb,
+                'streaming_peak_mb': streaming_mb,
+                'streaming_model_mb': os.path.getsize(model_path) / 1024 / 1024,
+                'legacy_macro_f1': f1_score(val_labels, legacy.predict(val_texts), average='macro'),
+                'streaming_macro_f1': streaming.evaluate(val_texts, val_labels)['party_macro_f1'],
+            }
+            rows.append(row)
+            print(row)
+
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(pd.DataFrame(rows).set_index('articles').round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
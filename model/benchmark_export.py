@@ -0,0 +1,169 @@
+"""
+내보낸 모델(TorchScript / ONNX / int8) CPU 추론 벤치마크
+
+multitask_model.ipynb와 같은 방식으로 데이터를 나눈 검증 세트(test_size=0.2, random_state=42)에서
+모델별로 다음을 측정해 eager PyTorch(fp32) 모델과 비교합니다.
+- 배치 1 지연 시간 p50/p99 (ms)
+- 배치 추론 처리량 (기사/초)
+- 정당/감성 weighted F1, 정확도와 eager 모델 대비 차이
+- eager 모델과 예측이 같은 비율
+
+사용법:
+    python export_model.py --model-path ./news_bias_model --output-dir ./exported
+    python benchmark_export.py --model-path ./news_bias_model --exported-dir ./exported \\
+        --data ../data/정당_관점_라벨링_최종_업데이트.csv --samples 500 --threads 4
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+
+from export_model import ExportedNewsBiasModel
+from news_bias_model import load_model
+
+party_mapping = {'국민의힘': 0, '민주당': 1, '그외': 2}
+sentiment_mapping = {'긍정': 0, '중립': 1, '부정': 2}
+
+EXPORTED_FILES = ['news_bias.pt', 'news_bias.int8.pt', 'news_bias.onnx', 'news_bias.int8.onnx']
+
+
+def load_validation_split(path, samples=None, test_size=0.2):
+    """
+    노트북과 같은 전처리/분할로 검증 세트 (텍스트, 정당 레이블, 감성 레이블)
+
+    test_size는 multitask_model.ipynb가 0.2, multitask_model_longformer.ipynb가 0.1입니다.
+    """
+    df = pd.read_csv(path)
+    df['party_label'] = df['party'].map(party_mapping)
+    df['sentiment_label'] = df['sentiment'].map(sentiment_mapping)
+    df = df.dropna(subset=['title_cleaned', 'content_cleaned', 'party_label', 'sentiment_label'])
+    df['text'] = df['title_cleaned'] + ' ' + df['content_cleaned']
+
+    _, val_texts, _, val_party_labels, _, val_sentiment_labels = train_test_split(
+        df['text'].tolist(),
+        df['party_label'].to_numpy(),
+        df['sentiment_label'].to_numpy(),
+        test_size=test_size,
+        random_state=42
+    )
+    if samples:
+        val_texts = val_texts[:samples]
+        val_party_labels = val_party_labels[:samples]
+        val_sentiment_labels = val_sentiment_labels[:samples]
+    return list(val_texts), val_party_labels.astype(int), val_sentiment_labels.astype(int)
+
+
+def encode(texts, tokenizer, pad_to=512):
+    """기사별 (input_ids, attention_mask) 텐서 (pad_to가 None이면 패딩 없음)"""
+    encodings = []
+    for text in texts:
+        enc = tokenizer(text, max_length=512, truncation=True,
+                        padding='max_length' if pad_to else False,
+                        return_tensors='pt')
+        encodings.append((enc['input_ids'], enc['attention_mask']))
+    return encodings
+
+
+def run_model(model, encodings, tokenizer, batch_size, warmup=3):
+    """
+    배치 1 지연 시간과 배치 처리량 측정
+
+    Returns:
+        dict: 지연 시간, 처리량, 정당/감성 예측
+    """
+    with torch.no_grad():
+        for input_ids, attention_mask in encodings[:warmup]:
+            model(input_ids=input_ids, attention_mask=attention_mask)
+
+        latencies = []
+        for input_ids, attention_mask in encodings:
+            start = time.perf_counter()
+            model(input_ids=input_ids, attention_mask=attention_mask)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        party_preds, sentiment_preds = [], []
+        start = time.perf_counter()
+        for batch_start in range(0, len(encodings), batch_size):
+            batch = encodings[batch_start:batch_start + batch_size]
+            enc = tokenizer.pad(
+                {'input_ids': [ids[0].tolist() for ids, _ in batch],
+                 'attention_mask': [mask[0].tolist() for _, mask in batch]},
+                padding='longest', return_tensors='pt'
+            )
+            out = model(input_ids=enc['input_ids'], attention_mask=enc['attention_mask'])
+            party_preds.append(out['party_logits'].argmax(dim=1).numpy())
+            sentiment_preds.append(out['sentiment_logits'].argmax(dim=1).numpy())
+        elapsed = time.perf_counter() - start
+
+    return {
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'throughput': len(encodings) / elapsed,
+        'party_preds': np.concatenate(party_preds),
+        'sentiment_preds': np.concatenate(sentiment_preds),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="내보낸 모델 CPU 추론 벤치마크")
+    parser.add_argument('--model-path', default='./news_bias_model', help="model.safetensors와 토크나이저가 있는 폴더")
+    parser.add_argument('--model-name', default='klue/roberta-base', help="인코더 설정 이름 또는 경로")
+    parser.add_argument('--exported-dir', default='./exported', help="export_model.py 출력 폴더")
+    parser.add_argument('--data', default='../data/정당_관점_라벨링_최종_업데이트.csv', help="레이블이 있는 기사 CSV")
+    parser.add_argument('--samples', type=int, default=500, help="사용할 검증 기사 수 (0이면 전체)")
+    parser.add_argument('--batch-size', type=int, default=16, help="처리량 측정 배치 크기")
+    parser.add_argument('--threads', type=int, default=None, help="CPU 추론 스레드 수")
+    parser.add_argument('--dynamic-padding', action='store_true',
+                        help="512 고정 패딩 대신 기사 길이만큼만 사용 (노트북과 확률이 달라짐)")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    texts, party_labels, sentiment_labels = load_validation_split(args.data, args.samples or None)
+    eager, tokenizer = load_model(args.model_path, model_name=args.model_name)
+    encodings = encode(texts, tokenizer, pad_to=None if args.dynamic_padding else 512)
+    print(f"검증 기사 수: {len(texts)}")
+
+    models = {'eager fp32': eager}
+    for name in EXPORTED_FILES:
+        path = os.path.join(args.exported_dir, name)
+        if os.path.exists(path):
+            models[name] = ExportedNewsBiasModel(path, num_threads=args.threads)
+
+    rows = []
+    reference = None
+    for name, model in models.items():
+        result = run_model(model, encodings, tokenizer, args.batch_size)
+        if reference is None:
+            reference = result
+        party_f1 = f1_score(party_labels, result['party_preds'], average='weighted')
+        sentiment_f1 = f1_score(sentiment_labels, result['sentiment_preds'], average='weighted')
+        rows.append({
+            'model': name,
+            'p50_ms': result['p50_ms'],
+            'p99_ms': result['p99_ms'],
+            'articles/s': result['throughput'],
+            'party_f1': party_f1,
+            'party_acc': accuracy_score(party_labels, result['party_preds']),
+            'sentiment_f1': sentiment_f1,
+            'sentiment_acc': accuracy_score(sentiment_labels, result['sentiment_preds']),
+            'party_agree': float(np.mean(result['party_preds'] == reference['party_preds'])),
+            'sentiment_agree': float(np.mean(result['sentiment_preds'] == reference['sentiment_preds'])),
+        })
+
+    report = pd.DataFrame(rows).set_index('model')
+    report['party_f1_delta'] = report['party_f1'] - report.loc['eager fp32', 'party_f1']
+    report['sentiment_f1_delta'] = report['sentiment_f1'] - report.loc['eager fp32', 'sentiment_f1']
+    report['speedup'] = report['articles/s'] / report.loc['eager fp32', 'articles/s']
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(report.round(4).to_string())
+
+
+if __name__ == "__main__":
+    main()
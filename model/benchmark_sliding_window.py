@@ -0,0 +1,124 @@
+"""
+슬라이딩 윈도우 추론 벤치마크 (RoBERTa 512 truncation / 슬라이딩 윈도우 / Longformer 1600)
+
+모든 방법을 multitask_model_longformer.ipynb의 검증 세트(test_size=0.1, random_state=42)에서 비교합니다.
+같은 random_state로 나눈 multitask_model.ipynb의 검증 세트(test_size=0.2)에 포함되므로
+RoBERTa와 Longformer 모두 학습에 쓰지 않은 기사입니다.
+- 처리량 (기사/초), 추론한 패딩 포함 토큰 수 (계산량/메모리 비교용)
+- 정당/감성 weighted F1, 정확도 (전체, 512 토큰을 넘는 긴 기사만)
+
+사용법:
+    python benchmark_sliding_window.py --model-path ./news_bias_model \\
+        --longformer-path ./news_bias_longformer_model \\
+        --data ../data/정당_관점_라벨링_최종_업데이트.csv --samples 500 --threads 4
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+from sklearn.metrics import accuracy_score, f1_score
+
+from benchmark_export import load_validation_split
+from bias_index import predict_probs_batched
+from news_bias_model import load_longformer_model, load_model
+from sliding_window import POOLINGS, predict_windowed
+
+# multitask_model_longformer.ipynb의 분할 비율 (multitask_model.ipynb의 0.2 검증 세트의 부분집합)
+LONGFORMER_TEST_SIZE = 0.1
+
+
+def run_truncated(texts, model, tokenizer, device, batch_size, max_length):
+    """노트북과 같이 max_length로 자르고 고정 패딩한 배치 추론"""
+    party_probs, sentiment_probs = predict_probs_batched(
+        texts, model, tokenizer, device, batch_size=batch_size, max_length=max_length, pad_to=max_length
+    )
+    return party_probs.argmax(axis=1), sentiment_probs.argmax(axis=1), len(texts) * max_length
+
+
+def run_windowed(texts, model, tokenizer, device, batch_size, pooling, stride, pad_to):
+    out = predict_windowed(texts, model, tokenizer, device, batch_size=batch_size,
+                           stride=stride, pooling=pooling, pad_to=pad_to)
+    return (out['party_logits'].argmax(dim=1).numpy(), out['sentiment_logits'].argmax(dim=1).numpy(),
+            out['padded_tokens'])
+
+
+def scores(labels, preds, mask=None):
+    if mask is not None:
+        if not mask.any():
+            return float('nan'), float('nan')
+        labels, preds = labels[mask], preds[mask]
+    return f1_score(labels, preds, average='weighted'), accuracy_score(labels, preds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="슬라이딩 윈도우 추론 벤치마크")
+    parser.add_argument('--model-path', default='./news_bias_model', help="RoBERTa 모델 폴더")
+    parser.add_argument('--model-name', default='klue/roberta-base', help="RoBERTa 인코더 설정 이름 또는 경로")
+    parser.add_argument('--longformer-path', help="Longformer 모델 폴더 (생략하면 Longformer 비교 안 함)")
+    parser.add_argument('--longformer-name', default='allenai/longformer-base-4096', help="Longformer 인코더 설정 이름 또는 경로")
+    parser.add_argument('--data', default='../data/정당_관점_라벨링_최종_업데이트.csv', help="레이블이 있는 기사 CSV")
+    parser.add_argument('--samples', type=int, default=500, help="사용할 검증 기사 수 (0이면 전체)")
+    parser.add_argument('--batch-size', type=int, default=16, help="배치당 기사 수")
+    parser.add_argument('--stride', type=int, default=128, help="윈도우가 겹치는 토큰 수")
+    parser.add_argument('--threads', type=int, default=None, help="CPU 추론 스레드 수")
+    parser.add_argument('--dynamic-padding', action='store_true',
+                        help="윈도우를 512 고정 대신 배치 안 최대 길이로 패딩 (짧은 기사 확률이 노트북과 달라짐)")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+
+    texts, party_labels, sentiment_labels = load_validation_split(args.data, args.samples or None,
+                                                                   test_size=LONGFORMER_TEST_SIZE)
+    model, tokenizer = load_model(args.model_path, model_name=args.model_name)
+    model.to(device)
+    token_counts = np.array([len(ids) for ids in tokenizer(texts)['input_ids']])
+    long_mask = token_counts > 512
+    print(f"검증 기사 수: {len(texts)}, 512 토큰 초과: {long_mask.sum()}개 ({long_mask.mean():.1%})")
+
+    pad_to = None if args.dynamic_padding else 512
+    methods = {'roberta-512 (truncate)': lambda: run_truncated(texts, model, tokenizer, device, args.batch_size, 512)}
+    for pooling in POOLINGS:
+        methods[f'roberta-window ({pooling})'] = (
+            lambda pooling=pooling: run_windowed(texts, model, tokenizer, device, args.batch_size,
+                                                 pooling, args.stride, pad_to)
+        )
+    if args.longformer_path:
+        longformer, longformer_tokenizer = load_longformer_model(args.longformer_path, model_name=args.longformer_name)
+        longformer.to(device)
+        methods['longformer-1600'] = lambda: run_truncated(
+            texts, longformer, longformer_tokenizer, device, args.batch_size, 1600
+        )
+
+    rows = []
+    for name, run in methods.items():
+        started = time.perf_counter()
+        party_preds, sentiment_preds, padded_tokens = run()
+        elapsed = time.perf_counter() - started
+        party_f1, party_acc = scores(party_labels, party_preds)
+        sentiment_f1, sentiment_acc = scores(sentiment_labels, sentiment_preds)
+        long_party_f1, _ = scores(party_labels, party_preds, long_mask)
+        long_sentiment_f1, _ = scores(sentiment_labels, sentiment_preds, long_mask)
+        rows.append({
+            'method': name,
+            'articles/s': len(texts) / elapsed,
+            'padded_tokens': padded_tokens,
+            'party_f1': party_f1,
+            'party_acc': party_acc,
+            'sentiment_f1': sentiment_f1,
+            'sentiment_acc': sentiment_acc,
+            'long_party_f1': long_party_f1,
+            'long_sentiment_f1': long_sentiment_f1,
+        })
+
+    report = pd.DataFrame(rows).set_index('method')
+    report['tokens_vs_truncate'] = report['padded_tokens'] / report['padded_tokens'].iloc[0]
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(report.round(4).to_string())
+
+
+if __name__ == "__main__":
+    main()
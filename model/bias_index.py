@@ -0,0 +1,180 @@
+"""
+통합 편향성 지수 계산 (통합 편향성 지수.ipynb)
+
+- predict_news_with_probs, compute_final_bias: 노트북과 같은 기사 단위 함수
+- score_dataframe: (text, press) DataFrame 전체를 배치로 추론하고 지수를 한 번에 계산해
+  청크 단위로 돌려주는 대량 계산 함수
+
+대량 계산은 청크마다 토큰 길이순으로 정렬해 배치를 만들고, 기본값으로 노트북과 같이
+512 토큰 고정 길이로 패딩합니다. NewsBiasModel은 패딩 위치까지 평균을 내므로 배치 안에서
+가장 긴 기사 길이까지만 패딩하면(pad_to=None) 더 빠르지만 확률이 같은 배치에 묶인 다른 기사에
+따라 달라집니다 (노트북 값과 다르고 배치/청크 크기에 따라 바뀜).
+
+사용 예:
+    for chunk in score_dataframe(df, model, tokenizer, device, batch_size=64, num_threads=8):
+        chunk.to_csv('bias_scores.csv', mode='a', header=first, index=False)
+"""
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn.functional as F
+
+# 언론사별 통합 편향성 지수 (사전 계산된 값, outlet_scores를 주지 않을 때의 기본값)
+# 기사 출력으로 다시 계산한 값은 outlet_bias_store.OutletBiasStore.outlet_scores 사용
+outlet_bias_scores = {
+    '조선일보':  1.30,
+    '동아일보':  0.80,
+    '중앙일보':  0.40,
+    '한국일보':  0.25,
+    'SBS':       0.10,
+    '경향신문': -0.90,
+    '오마이뉴스': -1.00,
+    '한겨레':   -1.20
+}
+
+PARTY_LABELS = ['국민의힘', '민주당', '그외']
+SENTIMENT_LABELS = ['긍정', '중립', '부정']
+
+
+def predict_news_with_probs(text, model, tokenizer, device):
+    """기사 하나의 정당/감성 확률 (노트북과 같음)"""
+    model.eval()
+    enc = tokenizer(text, max_length=512, truncation=True,
+                    padding='max_length', return_tensors='pt')
+    enc = {k: v.to(device) for k, v in enc.items()}
+    with torch.no_grad():
+        out = model(**enc)
+    # Softmax → 확률
+    party_probs = F.softmax(out['party_logits'], dim=1).cpu().tolist()[0]
+    sentiment_probs = F.softmax(out['sentiment_logits'], dim=1).cpu().tolist()[0]
+    party_p = {PARTY_LABELS[i]: p for i, p in enumerate(party_probs)}
+    sent_p = {SENTIMENT_LABELS[i]: p for i, p in enumerate(sentiment_probs)}
+    return party_p, sent_p
+
+
+def compute_final_bias(text, press, model, tokenizer, device, alpha=0.7, outlet_scores=None):
+    """
+    기사 하나의 통합 편향성 지수 (노트북과 같음)
+
+    outlet_scores를 주면 outlet_bias_scores 대신 그 언론사 지수를 사용합니다
+    (예: OutletBiasStore(...).outlet_scores(days=30)).
+    """
+    party_p, sent_p = predict_news_with_probs(text, model, tokenizer, device)
+    party_probs = np.array([[party_p[label] for label in PARTY_LABELS]])
+    sentiment_probs = np.array([[sent_p[label] for label in SENTIMENT_LABELS]])
+    scores = bias_from_probs(party_probs, sentiment_probs, [press], alpha, outlet_scores)
+    return {key: float(values[0]) for key, values in scores.items()}
+
+
+def bias_from_probs(party_probs, sentiment_probs, presses, alpha=0.7, outlet_scores=None):
+    """
+    확률 배열로 기사/언론사 편향 지수 계산 (벡터 연산)
+
+    Args:
+        party_probs (ndarray): (기사 수, 3) 국민의힘/민주당/그외 확률
+        sentiment_probs (ndarray): (기사 수, 3) 긍정/중립/부정 확률
+        presses (list): 언론사 이름
+        alpha (float): 기사 지수 가중치 (언론사 지수는 1 - alpha)
+        outlet_scores (dict): 언론사 지수 (기본값: outlet_bias_scores)
+
+    Returns:
+        dict: 지수 이름 -> ndarray
+    """
+    outlet_scores = outlet_bias_scores if outlet_scores is None else outlet_scores
+    # 정당 편향
+    article_party_bias = party_probs[:, 0] - party_probs[:, 1]
+    # 감성 편향에 0.5 가중치
+    article_sentiment_bias = (sentiment_probs[:, 0] - sentiment_probs[:, 2]) / 2
+    # 통합 편향성 지수
+    article_unified_bias = article_party_bias * (1 + np.abs(article_sentiment_bias))
+    # 언론사 지수 (없는 언론사는 0)
+    outlet_unified_bias = np.array([outlet_scores.get(press, 0.0) for press in presses], dtype=np.float64)
+    final_score = alpha * article_unified_bias + (1 - alpha) * outlet_unified_bias
+    return {
+        'article_party_bias': article_party_bias,
+        'article_sentiment_bias': article_sentiment_bias,
+        'article_unified_bias': article_unified_bias,
+        'outlet_unified_bias': outlet_unified_bias,
+        'final_unified_bias_score': final_score
+    }
+
+
+def predict_probs_batched(texts, model, tokenizer, device, batch_size=32, max_length=512, pad_to=512):
+    """
+    여러 기사의 정당/감성 확률을 배치로 계산
+
+    토큰 길이순으로 배치를 만들고 pad_to 길이로 고정 패딩합니다 (노트북과 같은 확률).
+    pad_to=None이면 배치마다 가장 긴 기사 길이까지만 패딩합니다 (빠르지만 확률이 배치 구성에 따라 달라짐).
+
+    Returns:
+        tuple: (party_probs, sentiment_probs) 입력 순서의 (기사 수, 3) 배열
+    """
+    texts = ["" if pd.isnull(text) else str(text) for text in texts]
+    encodings = tokenizer(texts, max_length=max_length, truncation=True)['input_ids']
+    order = np.argsort([len(ids) for ids in encodings], kind='stable')
+    party_probs = np.zeros((len(texts), len(PARTY_LABELS)), dtype=np.float64)
+    sentiment_probs = np.zeros((len(texts), len(SENTIMENT_LABELS)), dtype=np.float64)
+
+    model.eval()
+    with torch.no_grad():
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            enc = tokenizer.pad(
+                {'input_ids': [encodings[i] for i in batch]},
+                padding='max_length' if pad_to else 'longest',
+                max_length=pad_to,
+                return_tensors='pt'
+            )
+            out = model(input_ids=enc['input_ids'].to(device), attention_mask=enc['attention_mask'].to(device))
+            party_probs[batch] = F.softmax(out['party_logits'], dim=1).cpu().numpy()
+            sentiment_probs[batch] = F.softmax(out['sentiment_logits'], dim=1).cpu().numpy()
+    return party_probs, sentiment_probs
+
+
+def score_dataframe(df, model, tokenizer, device, text_column='text', press_column='press', batch_size=32,
+                    chunk_size=4096, num_threads=None, alpha=0.7, outlet_scores=None, max_length=512, pad_to=512):
+    """
+    (text, press) DataFrame의 통합 편향성 지수를 청크 단위로 계산
+
+    Args:
+        df (DataFrame): 기사 DataFrame
+        batch_size (int): 추론 배치 크기
+        chunk_size (int): 한 번에 정렬/추론해 돌려줄 기사 수
+        num_threads (int): CPU 추론 스레드 수 (torch.set_num_threads, None이면 기본값)
+        alpha (float): 기사 지수 가중치
+        outlet_scores (dict): 언론사 지수 (기본값: outlet_bias_scores)
+        pad_to (int): 고정 패딩 길이 (기본값 512는 노트북과 같은 확률, None이면 배치별 동적 패딩)
+
+    Yields:
+        DataFrame: 입력 청크와 같은 인덱스의 확률, 예측 레이블, 편향 지수 컬럼
+    """
+    if num_threads:
+        torch.set_num_threads(num_threads)
+
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        party_probs, sentiment_probs = predict_probs_batched(
+            chunk[text_column].tolist(), model, tokenizer, device,
+            batch_size=batch_size, max_length=max_length, pad_to=pad_to
+        )
+        presses = chunk[press_column].tolist() if press_column in chunk else [None] * len(chunk)
+        scores = bias_from_probs(party_probs, sentiment_probs, presses, alpha, outlet_scores)
+
+        result = pd.DataFrame(index=chunk.index)
+        for i, label in enumerate(PARTY_LABELS):
+            result[f'prob_{label}'] = party_probs[:, i]
+        for i, label in enumerate(SENTIMENT_LABELS):
+            result[f'prob_{label}'] = sentiment_probs[:, i]
+        result['party_pred'] = np.array(PARTY_LABELS)[party_probs.argmax(axis=1)]
+        result['sentiment_pred'] = np.array(SENTIMENT_LABELS)[sentiment_probs.argmax(axis=1)]
+        for key, values in scores.items():
+            result[key] = values
+        yield result
+
+
+def bulk_compute_final_bias(df, model, tokenizer, device, **kwargs):
+    """score_dataframe 결과를 하나의 DataFrame으로 합쳐 반환 (인자는 score_dataframe과 같음)"""
+    chunks = list(score_dataframe(df, model, tokenizer, device, **kwargs))
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks)
@@ -0,0 +1,390 @@
+"""
+통합 편향성 지수 로컬 추론 서버 (마이크로 배치)
+
+모델과 토크나이저를 한 번만 불러 두고, 동시에 들어온 요청을 모아
+(최대 배치 크기 또는 최대 대기 시간까지) 한 번의 추론으로 처리합니다.
+
+엔드포인트:
+    POST /score          {"text": "...", "press": "조선일보"}
+                         또는 {"articles": [{"text": "...", "press": "..."}, ...]}
+    GET  /metrics        Prometheus 텍스트 (대기열 길이, 배치 크기, 지연 시간)
+    GET  /metrics.json   같은 지표의 JSON
+    GET  /health         상태 확인
+
+사용법:
+    python bias_server.py --model-path ./news_bias_model --port 8000 --max-batch-size 32 --max-wait-ms 10
+    # 내보낸 모델 사용 (export_model.py)
+    python bias_server.py --exported ./exported/news_bias.int8.onnx --port 8000
+    # 언론사 지수를 집계 저장소(outlet_bias_store.py)의 최근 30일 값으로
+    python bias_server.py --outlet-store ./outlet_bias.sqlite3 --outlet-days 30
+
+    curl -X POST localhost:8000/score -d '{"text": "기사 본문", "press": "한겨레"}'
+"""
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+import torch
+
+from bias_index import PARTY_LABELS, SENTIMENT_LABELS, bias_from_probs, predict_probs_batched
+
+# 배치 크기 분포 구간 (Prometheus histogram)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+class ServerMetrics:
+    """
+    요청/배치 지표 (스레드 안전)
+
+    지연 시간은 최근 window개만 보관해 백분위를 계산하고, 합계/횟수는 누적합니다.
+    """
+    def __init__(self, window=10000):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self._queue_waits = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_articles = 0
+        self.latency_total = 0.0
+        self.inference_total = 0.0
+        self.batch_size_counts = dict.fromkeys(BATCH_SIZE_BUCKETS, 0)
+        self.started = time.time()
+
+    def observe_batch(self, size, inference_seconds):
+        with self._lock:
+            self.batches += 1
+            self.batched_articles += size
+            self.inference_total += inference_seconds
+            for bucket in BATCH_SIZE_BUCKETS:
+                if size <= bucket:
+                    self.batch_size_counts[bucket] += 1
+
+    def observe_request(self, latency_seconds, queue_seconds, error=False):
+        with self._lock:
+            self.requests += 1
+            self.errors += int(error)
+            self.latency_total += latency_seconds
+            self._latencies.append(latency_seconds)
+            self._queue_waits.append(queue_seconds)
+
+    def summary(self, queue_depth=0):
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000
+            queue_waits = np.array(self._queue_waits) * 1000
+            summary = {
+                'uptime_seconds': round(time.time() - self.started, 1),
+                'queue_depth': queue_depth,
+                'requests': self.requests,
+                'errors': self.errors,
+                'batches': self.batches,
+                'mean_batch_size': round(self.batched_articles / self.batches, 2) if self.batches else 0.0,
+                'batch_size_buckets': {str(bucket): count for bucket, count in self.batch_size_counts.items()},
+                'inference_seconds_total': round(self.inference_total, 4),
+            }
+        for name, values in (('latency_ms', latencies), ('queue_wait_ms', queue_waits)):
+            summary[name] = {
+                f'p{q}': round(float(np.percentile(values, q)), 2) if len(values) else None
+                for q in (50, 95, 99)
+            }
+        return summary
+
+    def prometheus(self, queue_depth=0):
+        with self._lock:
+            lines = [
+                '# HELP bias_server_queue_depth 처리를 기다리는 기사 수',
+                '# TYPE bias_server_queue_depth gauge',
+                f'bias_server_queue_depth {queue_depth}',
+                '# TYPE bias_server_requests_total counter',
+                f'bias_server_requests_total {self.requests}',
+                '# TYPE bias_server_errors_total counter',
+                f'bias_server_errors_total {self.errors}',
+                '# HELP bias_server_batch_size 추론 배치 크기',
+                '# TYPE bias_server_batch_size histogram',
+            ]
+            for bucket, count in self.batch_size_counts.items():
+                lines.append(f'bias_server_batch_size_bucket{{le="{bucket}"}} {count}')
+            lines.append(f'bias_server_batch_size_bucket{{le="+Inf"}} {self.batches}')
+            lines.append(f'bias_server_batch_size_sum {self.batched_articles}')
+            lines.append(f'bias_server_batch_size_count {self.batches}')
+            lines.append('# HELP bias_server_inference_seconds 배치 추론 시간')
+            lines.append('# TYPE bias_server_inference_seconds summary')
+            lines.append(f'bias_server_inference_seconds_sum {self.inference_total:.6f}')
+            lines.append(f'bias_server_inference_seconds_count {self.batches}')
+            lines.append('# HELP bias_server_request_latency_seconds 요청 도착부터 응답까지 시간')
+            lines.append('# TYPE bias_server_request_latency_seconds summary')
+            latencies = np.array(self._latencies)
+            for q in (0.5, 0.95, 0.99):
+                if len(latencies):
+                    lines.append(f'bias_server_request_latency_seconds{{quantile="{q}"}} '
+                                 f'{float(np.quantile(latencies, q)):.6f}')
+            lines.append(f'bias_server_request_latency_seconds_sum {self.latency_total:.6f}')
+            lines.append(f'bias_server_request_latency_seconds_count {self.requests}')
+        return '\n'.join(lines) + '\n'
+
+
+class _Pending:
+    """대기열에 들어간 기사 하나"""
+    __slots__ = ('text', 'press', 'enqueued', 'started', 'result', 'error', 'done')
+
+    def __init__(self, text, press):
+        self.text = text
+        self.press = press
+        self.enqueued = time.perf_counter()
+        self.started = None
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class MicroBatcher:
+    """
+    동시 요청을 모아 배치로 처리하는 작업 스레드
+
+    첫 기사가 도착하면 max_batch_size개가 모이거나 max_wait_ms가 지날 때까지 기다린 뒤
+    score_fn(texts, presses)를 한 번 호출합니다.
+
+    Args:
+        score_fn (callable): (texts, presses) -> 기사별 결과 dict 리스트
+        max_batch_size (int): 최대 배치 크기
+        max_wait_ms (float): 첫 기사 도착 후 배치를 모으는 최대 시간
+        metrics (ServerMetrics): 지표 기록 (None이면 새로 만듦)
+    """
+    def __init__(self, score_fn, max_batch_size=32, max_wait_ms=10, metrics=None):
+        self.score_fn = score_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.metrics = metrics or ServerMetrics()
+        self._queue = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._thread.start()
+
+    @property
+    def queue_depth(self):
+        return self._queue.qsize()
+
+    def submit(self, articles, timeout=None):
+        """
+        기사 목록을 대기열에 넣고 결과를 기다림
+
+        Args:
+            articles (list): (text, press) 튜플 리스트
+
+        Returns:
+            list: 기사별 결과 dict
+        """
+        pending = [_Pending(text, press) for text, press in articles]
+        for item in pending:
+            self._queue.put(item)
+        results = []
+        for item in pending:
+            if not item.done.wait(timeout):
+                raise TimeoutError("추론 대기 시간 초과")
+            if item.error is not None:
+                raise item.error
+            results.append(item.result)
+        return results
+
+    def _collect(self):
+        """첫 기사를 기다린 뒤 최대 배치 크기/대기 시간까지 모으기"""
+        try:
+            batch = [self._queue.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not self._stopped.is_set():
+            batch = self._collect()
+            if not batch:
+                continue
+            started = time.perf_counter()
+            error = None
+            try:
+                results = self.score_fn([item.text for item in batch], [item.press for item in batch])
+            except Exception as e:
+                error = e
+                results = [None] * len(batch)
+            finished = time.perf_counter()
+            self.metrics.observe_batch(len(batch), finished - started)
+            for item, result in zip(batch, results):
+                item.result = result
+                item.error = error
+                self.metrics.observe_request(finished - item.enqueued, started - item.enqueued, error is not None)
+                item.done.set()
+
+    def close(self):
+        self._stopped.set()
+        self._thread.join()
+
+
+def make_scorer(model, tokenizer, device, alpha=0.7, outlet_scores=None, max_length=512, pad_to=512):
+    """
+    기사 배치를 확률과 편향 지수로 바꾸는 함수 (MicroBatcher의 score_fn)
+
+    기본값 pad_to=512는 노트북(compute_final_bias)과 같은 확률을 돌려줍니다.
+    pad_to=None(동적 패딩)은 NewsBiasModel이 패딩 위치까지 평균을 내므로 한 요청의 점수가
+    같은 배치에 묶인 다른 요청에 따라 달라집니다.
+    """
+    def score(texts, presses):
+        party_probs, sentiment_probs = predict_probs_batched(
+            texts, model, tokenizer, device, batch_size=len(texts), max_length=max_length, pad_to=pad_to
+        )
+        scores = bias_from_probs(party_probs, sentiment_probs, presses, alpha, outlet_scores)
+        results = []
+        for i in range(len(texts)):
+            result = {
+                'party_probs': {label: float(p) for label, p in zip(PARTY_LABELS, party_probs[i])},
+                'sentiment_probs': {label: float(p) for label, p in zip(SENTIMENT_LABELS, sentiment_probs[i])},
+                'party_pred': PARTY_LABELS[int(party_probs[i].argmax())],
+                'sentiment_pred': SENTIMENT_LABELS[int(sentiment_probs[i].argmax())],
+            }
+            result.update({key: float(values[i]) for key, values in scores.items()})
+            results.append(result)
+        return results
+    return score
+
+
+class BiasRequestHandler(BaseHTTPRequestHandler):
+    """/score, /metrics, /metrics.json, /health 처리"""
+    server_version = 'BiasServer/1.0'
+
+    def _send(self, status, body, content_type='application/json; charset=utf-8'):
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False))
+
+    def do_GET(self):
+        batcher = self.server.batcher
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == '/metrics':
+            self._send(200, batcher.metrics.prometheus(batcher.queue_depth), 'text/plain; version=0.0.4')
+        elif self.path == '/metrics.json':
+            self._send_json(200, batcher.metrics.summary(batcher.queue_depth))
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path != '/score':
+            self._send_json(404, {'error': 'not found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            single = 'articles' not in payload
+            articles = [payload] if single else payload['articles']
+            articles = [(str(article.get('text') or ''), article.get('press')) for article in articles]
+        except (ValueError, TypeError, AttributeError, KeyError) as e:
+            self._send_json(400, {'error': f'잘못된 요청: {e}'})
+            return
+
+        try:
+            results = self.server.batcher.submit(articles, timeout=self.server.request_timeout)
+        except TimeoutError as e:
+            self._send_json(503, {'error': str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+            return
+        self._send_json(200, results[0] if single else {'results': results})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class BiasHTTPServer(ThreadingHTTPServer):
+    """요청마다 스레드를 쓰는 HTTP 서버 (동시 접속이 몰려도 연결이 거부되지 않도록 접속 대기열을 늘림)"""
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def serve(batcher, host='127.0.0.1', port=8000, request_timeout=60, verbose=False):
+    """HTTP 서버 시작 (Ctrl+C로 종료)"""
+    server = BiasHTTPServer((host, port), BiasRequestHandler)
+    server.batcher = batcher
+    server.request_timeout = request_timeout
+    server.verbose = verbose
+    print(f"🚀 편향성 지수 서버 시작: http://{host}:{port} "
+          f"(최대 배치 {batcher.max_batch_size}, 최대 대기 {batcher.max_wait * 1000:.0f}ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n서버 종료")
+    finally:
+        server.server_close()
+        batcher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통합 편향성 지수 로컬 추론 서버")
+    parser.add_argument('--model-path', default='./news_bias_model', help="model.safetensors와 토크나이저가 있는 폴더")
+    parser.add_argument('--model-name', default='klue/roberta-base', help="인코더 설정 이름 또는 경로")
+    parser.add_argument('--exported', help="export_model.py로 내보낸 .pt/.onnx 파일 (토크나이저는 같은 폴더에서 읽음)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--max-batch-size', type=int, default=32, help="최대 배치 크기")
+    parser.add_argument('--max-wait-ms', type=float, default=10, help="배치를 모으는 최대 대기 시간 (ms)")
+    parser.add_argument('--threads', type=int, default=None, help="CPU 추론 스레드 수")
+    parser.add_argument('--pad-to', type=int, default=512, help="고정 패딩 길이 (기본값 512는 노트북과 같은 확률)")
+    parser.add_argument('--dynamic-padding', action='store_true',
+                        help="배치마다 가장 긴 기사까지만 패딩 (빠르지만 점수가 함께 묶인 요청에 따라 달라짐)")
+    parser.add_argument('--alpha', type=float, default=0.7, help="기사 지수 가중치")
+    parser.add_argument('--outlet-store', help="언론사 지수 집계 저장소 (생략하면 outlet_bias_scores 사용)")
+    parser.add_argument('--outlet-days', type=int, default=None, help="언론사 지수 집계 기간 (최근 일 수, 생략하면 전체)")
+    parser.add_argument('--verbose', action='store_true', help="요청 로그 출력")
+    args = parser.parse_args()
+
+    outlet_scores = None
+    if args.outlet_store:
+        from outlet_bias_store import OutletBiasStore
+        store = OutletBiasStore(args.outlet_store)
+        outlet_scores = store.outlet_scores(days=args.outlet_days)
+        store.close()
+        print(f"언론사 지수 로드: {len(outlet_scores)}개 언론사")
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    device = torch.device('cuda' if torch.cuda.is_available() and not args.exported else 'cpu')
+
+    started = time.perf_counter()
+    if args.exported:
+        from transformers import AutoTokenizer
+        from export_model import ExportedNewsBiasModel
+        model = ExportedNewsBiasModel(args.exported, num_threads=args.threads)
+        tokenizer = AutoTokenizer.from_pretrained(os.path.dirname(os.path.abspath(args.exported)))
+    else:
+        from news_bias_model import load_model
+        model, tokenizer = load_model(args.model_path, model_name=args.model_name)
+        model.to(device)
+    print(f"모델 로드 완료: {time.perf_counter() - started:.1f}초")
+
+    scorer = make_scorer(model, tokenizer, device, alpha=args.alpha, outlet_scores=outlet_scores,
+                         pad_to=None if args.dynamic_padding else args.pad_to)
+    batcher = MicroBatcher(scorer, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+    serve(batcher, args.host, args.port, verbose=args.verbose)
+
+
+if __name__ == "__main__":
+    main()
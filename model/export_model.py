@@ -0,0 +1,197 @@
+"""
+NewsBiasModel CPU 추론용 내보내기 (TorchScript / ONNX / 동적 int8 양자화)
+
+- export_torchscript: torch.jit.trace로 내보낸 .pt (quantize=True면 Linear/LSTM 동적 int8)
+- export_onnx: 배치/시퀀스 축이 동적인 .onnx (opset 17)
+- quantize_onnx: onnxruntime 동적 int8 양자화 (.int8.onnx)
+- ExportedNewsBiasModel: 내보낸 파일을 읽어 NewsBiasModel과 같은
+  {'party_logits', 'sentiment_logits'} 출력을 돌려주는 로더
+  (bias_index.score_dataframe 등에 model 대신 그대로 넣을 수 있음)
+
+사용법:
+    python export_model.py --model-path ./news_bias_model --output-dir ./exported
+    # exported/ 에 news_bias.pt, news_bias.int8.pt, news_bias.onnx, news_bias.int8.onnx, 토크나이저 저장
+
+    model = ExportedNewsBiasModel('./exported/news_bias.int8.onnx', num_threads=4)
+    out = model(input_ids=enc['input_ids'], attention_mask=enc['attention_mask'])
+"""
+import argparse
+import copy
+import inspect
+import os
+
+import torch
+
+from news_bias_model import load_model
+
+OUTPUT_NAMES = ['party_logits', 'sentiment_logits']
+
+
+class _LogitsOnly(torch.nn.Module):
+    """내보내기용 래퍼: dict 대신 (party_logits, sentiment_logits) 튜플 반환"""
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        out = self.model(input_ids=input_ids, attention_mask=attention_mask)
+        return out['party_logits'], out['sentiment_logits']
+
+
+def _example_inputs(batch_size=2, length=64, vocab_size=1000):
+    input_ids = torch.randint(5, vocab_size, (batch_size, length), dtype=torch.long)
+    attention_mask = torch.ones(batch_size, length, dtype=torch.long)
+    attention_mask[-1, length // 2:] = 0
+    return input_ids, attention_mask
+
+
+def quantize_dynamic_int8(model):
+    """Linear/LSTM 가중치를 int8로 바꾼 복사본 (활성값은 실행 중 동적으로 양자화)"""
+    model = copy.deepcopy(model).eval()
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+    )
+
+
+def export_torchscript(model, path, quantize=False):
+    """
+    TorchScript(.pt)로 내보내기
+
+    trace는 입력 텐서의 크기를 상수로 굳히지 않으므로 배치/시퀀스 길이가 달라도 그대로 쓸 수 있습니다.
+    """
+    model = quantize_dynamic_int8(model) if quantize else model.eval()
+    wrapper = _LogitsOnly(model).eval()
+    example = _example_inputs(vocab_size=model.bert.config.vocab_size)
+    with torch.no_grad():
+        traced = torch.jit.trace(wrapper, example, check_trace=False, strict=False)
+    traced.save(path)
+    return path
+
+
+def export_onnx(model, path, opset=17):
+    """ONNX(.onnx)로 내보내기 (input_ids, attention_mask의 batch/sequence 축 동적)"""
+    wrapper = _LogitsOnly(model.eval()).eval()
+    example = _example_inputs(vocab_size=model.bert.config.vocab_size)
+    dynamic_axes = {
+        'input_ids': {0: 'batch', 1: 'sequence'},
+        'attention_mask': {0: 'batch', 1: 'sequence'},
+        'party_logits': {0: 'batch'},
+        'sentiment_logits': {0: 'batch'},
+    }
+    kwargs = {}
+    # torch 2.x 최신 버전의 dynamo 내보내기 대신 기존 trace 방식 사용
+    if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+        kwargs['dynamo'] = False
+    with torch.no_grad():
+        torch.onnx.export(
+            wrapper, example, path,
+            input_names=['input_ids', 'attention_mask'],
+            output_names=OUTPUT_NAMES,
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True,
+            **kwargs
+        )
+    return path
+
+
+def quantize_onnx(path, output_path):
+    """onnxruntime 동적 int8 양자화 (MatMul/Gemm 등 가중치를 int8로 저장)"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    quantize_dynamic(path, output_path, weight_type=QuantType.QInt8)
+    return output_path
+
+
+class ExportedNewsBiasModel:
+    """
+    내보낸 TorchScript(.pt) / ONNX(.onnx) 모델 로더
+
+    NewsBiasModel과 같이 model(input_ids=..., attention_mask=...)로 호출하면
+    {'party_logits': Tensor, 'sentiment_logits': Tensor}를 돌려줍니다.
+
+    Args:
+        path (str): .pt 또는 .onnx 파일
+        num_threads (int): CPU 추론 스레드 수 (None이면 기본값)
+    """
+    def __init__(self, path, num_threads=None):
+        self.path = path
+        self.backend = 'onnx' if path.endswith('.onnx') else 'torchscript'
+        if self.backend == 'onnx':
+            import onnxruntime as ort
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            if num_threads:
+                options.intra_op_num_threads = num_threads
+            self.session = ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+        else:
+            if num_threads:
+                torch.set_num_threads(num_threads)
+            self.module = torch.jit.load(path, map_location='cpu').eval()
+
+    def __call__(self, input_ids, attention_mask, **kwargs):
+        if self.backend == 'onnx':
+            party_logits, sentiment_logits = self.session.run(OUTPUT_NAMES, {
+                'input_ids': input_ids.cpu().numpy().astype('int64'),
+                'attention_mask': attention_mask.cpu().numpy().astype('int64'),
+            })
+            party_logits = torch.from_numpy(party_logits)
+            sentiment_logits = torch.from_numpy(sentiment_logits)
+        else:
+            with torch.no_grad():
+                party_logits, sentiment_logits = self.module(input_ids.cpu(), attention_mask.cpu())
+        return {'party_logits': party_logits, 'sentiment_logits': sentiment_logits}
+
+    # NewsBiasModel 대신 쓸 수 있도록 맞춘 메서드 (CPU 전용이므로 아무 일도 하지 않음)
+    def eval(self):
+        return self
+
+    def to(self, device):
+        return self
+
+
+def export_all(model_path, output_dir, formats=('torchscript', 'onnx'), quantize=True,
+               model_name='klue/roberta-base', opset=17):
+    """
+    저장된 모델을 읽어 지정한 형식으로 모두 내보내고 토크나이저도 함께 저장
+
+    Returns:
+        dict: 이름 -> 파일 경로
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    model, tokenizer = load_model(model_path, model_name=model_name)
+    tokenizer.save_pretrained(output_dir)
+
+    paths = {}
+    if 'torchscript' in formats:
+        paths['torchscript'] = export_torchscript(model, os.path.join(output_dir, 'news_bias.pt'))
+        if quantize:
+            paths['torchscript_int8'] = export_torchscript(
+                model, os.path.join(output_dir, 'news_bias.int8.pt'), quantize=True
+            )
+    if 'onnx' in formats:
+        paths['onnx'] = export_onnx(model, os.path.join(output_dir, 'news_bias.onnx'), opset=opset)
+        if quantize:
+            paths['onnx_int8'] = quantize_onnx(paths['onnx'], os.path.join(output_dir, 'news_bias.int8.onnx'))
+
+    for name, path in paths.items():
+        print(f"{name}: {path} ({os.path.getsize(path) / 1024 / 1024:.1f}MB)")
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NewsBiasModel CPU 추론용 내보내기")
+    parser.add_argument('--model-path', default='./news_bias_model', help="model.safetensors와 토크나이저가 있는 폴더")
+    parser.add_argument('--output-dir', default='./exported', help="내보낸 파일을 저장할 폴더")
+    parser.add_argument('--model-name', default='klue/roberta-base', help="인코더 설정 이름 또는 경로")
+    parser.add_argument('--formats', nargs='+', default=['torchscript', 'onnx'], choices=['torchscript', 'onnx'])
+    parser.add_argument('--no-quantize', action='store_true', help="int8 양자화 모델은 만들지 않음")
+    parser.add_argument('--opset', type=int, default=17, help="ONNX opset 버전")
+    args = parser.parse_args()
+
+    export_all(args.model_path, args.output_dir, formats=args.formats, quantize=not args.no_quantize,
+               model_name=args.model_name, opset=args.opset)
+    print("✅ 내보내기 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+bias_server.py 부하 테스트
+
+여러 스레드에서 동시에 /score 요청을 보내 클라이언트 기준 지연 시간(p50/p95/p99)과 처리량을 재고,
+끝난 뒤 서버의 /metrics.json (평균 배치 크기, 대기열 대기 시간)을 함께 출력합니다.
+
+사용법:
+    python bias_server.py --model-path ./news_bias_model --port 8000 &
+    python load_test_server.py --url http://127.0.0.1:8000 --data ../data/전체통합_전처리.csv \\
+        --requests 1000 --concurrency 32
+"""
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import json
+import random
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+
+
+def load_articles(path=None, limit=1000, seed=42):
+    """(text, press) 목록 (CSV가 없으면 임의 문장으로 생성)"""
+    if path:
+        df = pd.read_csv(path)
+        if 'text' not in df:
+            df['text'] = df['title_cleaned'].fillna('') + ' ' + df['content_cleaned'].fillna('')
+        df = df.dropna(subset=['text']).sample(n=min(limit, len(df)), random_state=seed)
+        presses = df['press'] if 'press' in df else [None] * len(df)
+        return list(zip(df['text'].astype(str), presses))
+
+    rng = random.Random(seed)
+    words = ['정부', '국회', '여당', '야당', '대통령', '의원', '법안', '예산', '선거', '정책', '발표', '비판', '논란', '합의']
+    presses = ['조선일보', '동아일보', '중앙일보', '한국일보', 'SBS', '경향신문', '오마이뉴스', '한겨레']
+    return [
+        (' '.join(rng.choice(words) for _ in range(rng.randint(20, 600))), rng.choice(presses))
+        for _ in range(limit)
+    ]
+
+
+def post_json(url, payload, timeout=120):
+    request = urllib.request.Request(
+        url, data=json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+        headers={'Content-Type': 'application/json'}, method='POST'
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+def get_json(url, timeout=30):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+def run_load_test(url, articles, requests=1000, concurrency=32):
+    """
+    동시 요청 부하 테스트
+
+    Returns:
+        dict: 성공/실패 수, 지연 시간 백분위(ms), 처리량(요청/초)
+    """
+    def send(i):
+        text, press = articles[i % len(articles)]
+        started = time.perf_counter()
+        try:
+            post_json(f'{url}/score', {'text': text, 'press': press})
+            return time.perf_counter() - started, None
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            return time.perf_counter() - started, e
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(send, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = np.array([latency for latency, error in results if error is None]) * 1000
+    errors = [error for _, error in results if error is not None]
+    if errors:
+        print(f"⚠️ 실패 {len(errors)}건 (예: {errors[0]})")
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'succeeded': len(latencies),
+        'failed': len(errors),
+        'elapsed_seconds': round(elapsed, 2),
+        'throughput_rps': round(len(latencies) / elapsed, 2),
+        **{f'p{q}_ms': round(float(np.percentile(latencies, q)), 2) if len(latencies) else None for q in (50, 95, 99)},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="편향성 지수 서버 부하 테스트")
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help="서버 주소")
+    parser.add_argument('--data', help="기사 CSV (text 또는 title_cleaned/content_cleaned, press 컬럼), 생략하면 임의 문장")
+    parser.add_argument('--requests', type=int, default=1000, help="보낼 요청 수")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32], help="동시 요청 수 (여러 개면 차례로 실행)")
+    args = parser.parse_args()
+
+    url = args.url.rstrip('/')
+    get_json(f'{url}/health')
+    articles = load_articles(args.data, limit=args.requests)
+
+    rows = []
+    for concurrency in args.concurrency:
+        before = get_json(f'{url}/metrics.json')
+        row = run_load_test(url, articles, args.requests, concurrency)
+        after = get_json(f'{url}/metrics.json')
+        batches = after['batches'] - before['batches']
+        row['server_mean_batch_size'] = round((after['requests'] - before['requests']) / batches, 2) if batches else None
+        row['server_queue_wait_p50_ms'] = after['queue_wait_ms']['p50']
+        rows.append(row)
+        print(json.dumps(row, ensure_ascii=False))
+
+    print(pd.DataFrame(rows).set_index('concurrency').to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+다중 태스크 뉴스 편향성 모델 (multitask_model.ipynb의 NewsBiasModel, load_model)
+
+노트북과 같은 구조/파라미터 이름이므로 노트북에서 저장한 model.safetensors를 그대로 읽습니다.
+"""
+import os
+
+import torch
+from transformers import AutoConfig, AutoModel, AutoTokenizer
+
+PARTY_LABELS = ['국민의힘', '민주당', '그외']
+SENTIMENT_LABELS = ['긍정', '중립', '부정']
+
+
+class NewsBiasModel(torch.nn.Module):
+    """
+    RoBERTa 인코더 + 특성 추출 레이어 + BiLSTM + 정당/감성 분류기
+
+    Args:
+        model_name (str): 사전학습 인코더 이름 또는 경로
+        class_weights: 정당 분류 손실 가중치 (None이면 모두 1)
+        pretrained (bool): 사전학습 가중치를 내려받을지 여부
+            (저장된 체크포인트를 바로 불러올 때는 False로 설정 구조만 만듦)
+    """
+    def __init__(self, model_name, num_party_labels=3, num_sentiment_labels=3,
+                 class_weights=None, dropout_rate=0.2, hidden_size=512, pretrained=True):
+        super().__init__()
+        if pretrained:
+            self.bert = AutoModel.from_pretrained(model_name)
+        else:
+            self.bert = AutoModel.from_config(AutoConfig.from_pretrained(model_name))
+        if class_weights is None:
+            class_weights = [1.0] * num_party_labels
+        self.register_buffer("class_weights", torch.tensor(class_weights, dtype=torch.float))
+
+        hidden_size_bert = self.bert.config.hidden_size
+        self.dropout = torch.nn.Dropout(dropout_rate)
+
+        # 특성 추출 레이어
+        self.feature_layer = torch.nn.Sequential(
+            torch.nn.Linear(hidden_size_bert, hidden_size),
+            torch.nn.LayerNorm(hidden_size),
+            torch.nn.ReLU(),
+            torch.nn.Dropout(dropout_rate)
+        )
+
+        # BiLSTM 레이어
+        self.bilstm = torch.nn.LSTM(
+            input_size=hidden_size,
+            hidden_size=hidden_size // 2,
+            num_layers=1,
+            batch_first=True,
+            bidirectional=True,
+            dropout=dropout_rate + 0.1
+        )
+
+        # 정당 분류기
+        self.party_classifier = torch.nn.Sequential(
+            torch.nn.Linear(hidden_size, hidden_size // 2),
+            torch.nn.LayerNorm(hidden_size // 2),
+            torch.nn.ReLU(),
+            torch.nn.Dropout(dropout_rate),
+            torch.nn.Linear(hidden_size // 2, num_party_labels)
+        )
+
+        # 감성 분류기
+        self.sentiment_classifier = torch.nn.Sequential(
+            torch.nn.Linear(hidden_size, hidden_size // 2),
+            torch.nn.LayerNorm(hidden_size // 2),
+            torch.nn.ReLU(),
+            torch.nn.Dropout(dropout_rate),
+            torch.nn.Linear(hidden_size // 2, num_sentiment_labels)
+        )
+
+    def forward(self, input_ids, attention_mask, party_label=None, sentiment_label=None):
+        # BERT 출력
+        outputs = self.bert(input_ids=input_ids, attention_mask=attention_mask)
+        sequence_output = outputs.last_hidden_state
+
+        # 특성 추출
+        features = self.dropout(sequence_output)
+        features = self.feature_layer(features)
+
+        # BiLSTM 적용
+        lstm_output, _ = self.bilstm(features)
+
+        # 최종 특성 추출 (평균 풀링)
+        final_features = torch.mean(lstm_output, dim=1)
+
+        # 예측
+        party_logits = self.party_classifier(final_features)
+        sentiment_logits = self.sentiment_classifier(final_features)
+
+        output = {
+            'party_logits': party_logits,
+            'sentiment_logits': sentiment_logits
+        }
+
+        if party_label is not None and sentiment_label is not None:
+            loss_fct_party = torch.nn.CrossEntropyLoss(weight=self.class_weights)
+            loss_fct_sentiment = torch.nn.CrossEntropyLoss()
+            party_loss = loss_fct_party(party_logits, party_label)
+            sentiment_loss = loss_fct_sentiment(sentiment_logits, sentiment_label)
+            output['loss'] = (party_loss + sentiment_loss) / 2
+
+        return output
+
+
+def load_model(model_path, class_weights=None, model_name='klue/roberta-base', **model_kwargs):
+    """
+    저장된 모델(model.safetensors)과 토크나이저 불러오기
+
+    체크포인트가 모든 가중치를 가지고 있으므로 사전학습 가중치는 내려받지 않고
+    설정만으로 구조를 만든 뒤 체크포인트를 읽습니다.
+
+    Returns:
+        tuple: (model, tokenizer), model은 eval 모드
+    """
+    from safetensors.torch import load_file
+
+    model = NewsBiasModel(model_name, class_weights=class_weights, pretrained=False, **model_kwargs)
+    model.load_state_dict(load_file(os.path.join(model_path, 'model.safetensors')))
+    model.eval()
+
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    return model, tokenizer
+
+
+def load_longformer_model(model_path, model_name='allenai/longformer-base-4096', **model_kwargs):
+    """
+    multitask_model_longformer.ipynb에서 저장한 모델과 토크나이저 불러오기
+
+    노트북 모델은 인코더 속성 이름(longformer)만 다르므로 같은 NewsBiasModel 구조로 읽습니다.
+    (trainer.save_model 결과인 model.safetensors 또는 pytorch_model.bin)
+
+    Returns:
+        tuple: (model, tokenizer), model은 eval 모드
+    """
+    safetensors_path = os.path.join(model_path, 'model.safetensors')
+    if os.path.exists(safetensors_path):
+        from safetensors.torch import load_file
+        state_dict = load_file(safetensors_path)
+    else:
+        state_dict = torch.load(os.path.join(model_path, 'pytorch_model.bin'), map_location='cpu')
+    state_dict = {
+        ('bert.' + key[len('longformer.'):] if key.startswith('longformer.') else key): value
+        for key, value in state_dict.items()
+    }
+
+    model = NewsBiasModel(model_name, pretrained=False, **model_kwargs)
+    model.load_state_dict(state_dict)
+    model.eval()
+
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    return model, tokenizer
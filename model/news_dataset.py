@@ -0,0 +1,283 @@
+"""
+미리 토큰화한 결과를 메모리 맵으로 읽는 NewsDataset
+
+multitask_model.ipynb / multitask_model_longformer.ipynb의 NewsDataset은 __getitem__마다
+토크나이저를 호출하고 max_length(512, 1600)까지 패딩합니다. 여기서는
+
+- 전체 텍스트를 한 번만 토큰화해 토큰 ID(int32)와 오프셋 배열로 저장하고 메모리 맵으로 읽음
+- 배치마다 가장 긴 기사 길이까지만 패딩 (PaddingCollator)
+- 길이가 비슷한 기사끼리 배치를 묶는 샘플러 (LengthBucketSampler)
+- 레이블은 토큰화 없이 바로 읽음 (dataset.party_labels)
+
+사용 예:
+    train_dataset = NewsDataset(train_texts, train_party_labels, train_sentiment_labels, tokenizer,
+                                cache_dir='./token_cache/train')
+    label_list = train_dataset.party_labels
+    train_loader = make_dataloader(train_dataset, batch_size=32, shuffle=True)
+    for epoch in range(num_epochs):
+        train_loader.batch_sampler.set_epoch(epoch)  # 에폭마다 다른 배치 순서
+        ...
+
+    Trainer를 쓸 때는 data_collator=train_dataset.collator(), group_by_length=True로
+    지정하면 됩니다. (__getitem__이 토큰화를 하지 않으므로 길이 계산도 빠름)
+
+주의: NewsBiasModel은 BiLSTM 출력 전체를 평균하므로 패딩 위치도 결과에 들어갑니다.
+max_length 패딩으로 학습한 체크포인트를 평가할 때 결과를 똑같이 맞추려면
+PaddingCollator(pad_to=max_length)를 사용하세요.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset, DataLoader, Sampler
+
+CACHE_VERSION = 1
+
+
+def _texts_fingerprint(texts, tokenizer, max_length):
+    """텍스트 목록과 토크나이저 설정 해시 (캐시가 같은 입력으로 만들어졌는지 확인용)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{getattr(tokenizer, 'name_or_path', '')}|{len(tokenizer)}|{max_length}|".encode('utf-8'))
+    for text in texts:
+        digest.update(str(text).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def build_token_cache(texts, tokenizer, cache_dir, max_length=512, batch_size=1000):
+    """
+    텍스트를 한 번 토큰화해 cache_dir에 저장
+
+    - input_ids.bin: 모든 기사의 토큰 ID를 이어 붙인 int32 배열
+    - offsets.npy: 기사 i의 토큰은 input_ids[offsets[i]:offsets[i + 1]]
+    - meta.json: 기사 수, max_length, 입력 해시
+
+    Returns:
+        TokenCache
+    """
+    texts = [str(text) for text in texts]
+    os.makedirs(cache_dir, exist_ok=True)
+    ids_path = os.path.join(cache_dir, 'input_ids.bin')
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+
+    with open(ids_path + '.tmp', 'wb') as f:
+        for start in range(0, len(texts), batch_size):
+            encodings = tokenizer(
+                texts[start:start + batch_size],
+                add_special_tokens=True,
+                max_length=max_length,
+                truncation=True
+            )['input_ids']
+            for i, ids in enumerate(encodings, start=start):
+                f.write(np.asarray(ids, dtype=np.int32).tobytes())
+                offsets[i + 1] = offsets[i] + len(ids)
+    os.replace(ids_path + '.tmp', ids_path)
+    np.save(os.path.join(cache_dir, 'offsets.npy'), offsets)
+
+    # meta.json은 마지막에 써서, 중간에 멈춘 캐시는 다시 만들도록 함
+    with open(os.path.join(cache_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': CACHE_VERSION,
+            'count': len(texts),
+            'max_length': max_length,
+            'fingerprint': _texts_fingerprint(texts, tokenizer, max_length),
+            'pad_token_id': tokenizer.pad_token_id
+        }, f, ensure_ascii=False, indent=2)
+    return TokenCache(cache_dir)
+
+
+class TokenCache:
+    """
+    build_token_cache로 만든 토큰 캐시 (토큰 ID는 메모리 맵으로 필요한 부분만 읽음)
+
+    DataLoader 작업자로 넘어갈 때는 메모리 맵을 복사하지 않고 작업자에서 다시 엽니다.
+    """
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        with open(os.path.join(cache_dir, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.offsets = np.load(os.path.join(cache_dir, 'offsets.npy'))
+        self.lengths = np.diff(self.offsets)
+        self._ids = None
+
+    @property
+    def ids(self):
+        if self._ids is None:
+            path = os.path.join(self.cache_dir, 'input_ids.bin')
+            # 빈 파일은 메모리 맵으로 열 수 없음
+            self._ids = np.memmap(path, dtype=np.int32, mode='r') if self.offsets[-1] else np.empty(0, dtype=np.int32)
+        return self._ids
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __getitem__(self, idx):
+        return self.ids[self.offsets[idx]:self.offsets[idx + 1]]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_ids'] = None
+        return state
+
+    @staticmethod
+    def load_or_build(texts, tokenizer, cache_dir, max_length=512):
+        """입력과 설정이 같은 캐시가 있으면 읽고, 없거나 다르면 새로 만듦"""
+        meta_path = os.path.join(cache_dir, 'meta.json')
+        texts = [str(text) for text in texts]
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            if (meta.get('version') == CACHE_VERSION and meta.get('count') == len(texts)
+                    and meta.get('max_length') == max_length
+                    and meta.get('fingerprint') == _texts_fingerprint(texts, tokenizer, max_length)):
+                return TokenCache(cache_dir)
+            print(f"토큰 캐시가 입력과 달라 다시 만듭니다: {cache_dir}")
+        return build_token_cache(texts, tokenizer, cache_dir, max_length)
+
+
+class NewsDataset(Dataset):
+    """
+    뉴스 편향성 학습용 데이터셋 (노트북 NewsDataset과 같은 인자)
+
+    Args:
+        texts: 기사 텍스트 목록
+        party_labels: 정당 레이블 (0: 국민의힘, 1: 민주당, 2: 그외)
+        sentiment_labels: 감정 레이블 (0: 긍정, 1: 중립, 2: 부정)
+        tokenizer: Hugging Face 토크나이저
+        max_length (int): 최대 토큰 수 (RoBERTa 512, Longformer 1600)
+        cache_dir (str): 토큰 캐시 디렉토리 (None이면 .token_cache/<입력 해시>)
+
+    __getitem__은 패딩하지 않은 input_ids를 반환하므로 PaddingCollator와 함께 사용합니다.
+    """
+    def __init__(self, texts, party_labels, sentiment_labels, tokenizer, max_length=512, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join('.token_cache', _texts_fingerprint([str(text) for text in texts], tokenizer, max_length))
+        self.cache = TokenCache.load_or_build(texts, tokenizer, cache_dir, max_length)
+        self.party_labels = np.asarray(party_labels, dtype=np.int64)
+        self.sentiment_labels = np.asarray(sentiment_labels, dtype=np.int64)
+        self.tokenizer = tokenizer
+        self.max_length = max_length
+        self.pad_token_id = tokenizer.pad_token_id
+
+    @property
+    def lengths(self):
+        """기사별 토큰 수 (특수 토큰 포함)"""
+        return self.cache.lengths
+
+    def __len__(self):
+        return len(self.cache)
+
+    def __getitem__(self, idx):
+        input_ids = torch.from_numpy(np.array(self.cache[idx], dtype=np.int64))
+        return {
+            'input_ids': input_ids,
+            'attention_mask': torch.ones_like(input_ids),
+            'party_label': torch.tensor(self.party_labels[idx], dtype=torch.long),
+            'sentiment_label': torch.tensor(self.sentiment_labels[idx], dtype=torch.long)
+        }
+
+    def collator(self, pad_to=None, pad_to_multiple_of=8):
+        return PaddingCollator(self.pad_token_id, pad_to=pad_to, pad_to_multiple_of=pad_to_multiple_of)
+
+
+class PaddingCollator:
+    """
+    배치 안에서 가장 긴 기사 길이까지만 패딩 (Trainer의 data_collator로도 사용 가능)
+
+    Args:
+        pad_token_id (int): 패딩 토큰 ID
+        pad_to (int): 고정 길이로 패딩 (기존 max_length 패딩과 같은 결과가 필요할 때)
+        pad_to_multiple_of (int): 패딩 길이를 이 값의 배수로 맞춤 (텐서 코어/커널 효율)
+    """
+    def __init__(self, pad_token_id, pad_to=None, pad_to_multiple_of=8):
+        self.pad_token_id = pad_token_id
+        self.pad_to = pad_to
+        self.pad_to_multiple_of = pad_to_multiple_of
+
+    def __call__(self, features):
+        lengths = [len(feature['input_ids']) for feature in features]
+        width = self.pad_to or max(lengths)
+        if self.pad_to is None and self.pad_to_multiple_of:
+            width = -(-width // self.pad_to_multiple_of) * self.pad_to_multiple_of
+
+        input_ids = torch.full((len(features), width), self.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(features), width), dtype=torch.long)
+        for i, (feature, length) in enumerate(zip(features, lengths)):
+            input_ids[i, :length] = torch.as_tensor(feature['input_ids'][:width])
+            attention_mask[i, :length] = 1
+
+        batch = {'input_ids': input_ids, 'attention_mask': attention_mask}
+        for key in ('party_label', 'sentiment_label'):
+            if key in features[0]:
+                batch[key] = torch.stack([torch.as_tensor(feature[key]) for feature in features])
+        return batch
+
+
+class LengthBucketSampler(Sampler):
+    """
+    길이가 비슷한 기사끼리 배치를 만드는 배치 샘플러
+
+    학습(shuffle=True)에서는 인덱스를 섞은 뒤 batch_size * bucket_multiplier개씩 나눠
+    각 묶음 안에서 길이순으로 배치를 자르고, 배치 순서를 다시 섞습니다.
+    평가(shuffle=False)에서는 전체를 길이순으로 정렬해 패딩을 최소화합니다.
+
+    Args:
+        lengths (array): 기사별 토큰 수 (NewsDataset.lengths)
+        batch_size (int): 배치 크기
+        shuffle (bool): 학습용 무작위 순서 여부
+        bucket_multiplier (int): 길이 정렬 묶음 크기 (배치 수)
+        drop_last (bool): 마지막 작은 배치 버리기
+        seed (int): 섞기 시드 (set_epoch로 에폭마다 다른 순서)
+    """
+    def __init__(self, lengths, batch_size, shuffle=True, bucket_multiplier=50, drop_last=False, seed=42):
+        self.lengths = np.asarray(lengths)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.bucket_multiplier = bucket_multiplier
+        self.drop_last = drop_last
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch):
+        self.epoch = epoch
+
+    def _batches(self):
+        if not self.shuffle:
+            order = np.argsort(self.lengths, kind='stable')
+            return [order[i:i + self.batch_size] for i in range(0, len(order), self.batch_size)]
+
+        rng = np.random.default_rng(self.seed + self.epoch)
+        order = rng.permutation(len(self.lengths))
+        bucket = self.batch_size * self.bucket_multiplier
+        batches = []
+        for start in range(0, len(order), bucket):
+            chunk = order[start:start + bucket]
+            chunk = chunk[np.argsort(self.lengths[chunk], kind='stable')]
+            batches.extend(chunk[i:i + self.batch_size] for i in range(0, len(chunk), self.batch_size))
+        rng.shuffle(batches)
+        return batches
+
+    def __iter__(self):
+        for batch in self._batches():
+            if self.drop_last and len(batch) < self.batch_size:
+                continue
+            yield batch.tolist()
+
+    def __len__(self):
+        if self.drop_last:
+            return len(self.lengths) // self.batch_size
+        return -(-len(self.lengths) // self.batch_size)
+
+
+def make_dataloader(dataset, batch_size=32, shuffle=True, num_workers=0, pad_to=None, **sampler_kwargs):
+    """NewsDataset용 DataLoader (길이 버킷 샘플러 + 동적 패딩)"""
+    sampler = LengthBucketSampler(dataset.lengths, batch_size, shuffle=shuffle, **sampler_kwargs)
+    return DataLoader(
+        dataset,
+        batch_sampler=sampler,
+        collate_fn=dataset.collator(pad_to=pad_to),
+        num_workers=num_workers,
+        persistent_workers=num_workers > 0
+    )
@@ -0,0 +1,404 @@
+"""
+언론사별 편향 지수 집계 저장소 (통합 편향성 지수.ipynb의 outlet_bias_scores 대체)
+
+기사 단위 모델 출력(정당/감성 확률, 통합 편향성 지수)을 들어오는 대로 받아
+(언론사, 날짜)별 충분 통계(기사 수, 합, 제곱합)를 SQLite 파일에 누적합니다.
+
+- 날짜 행마다 그 날까지의 누적 통계를 함께 저장해, 최근 N일/전체 기간 언론사 지수를
+  언론사마다 기본 키로 두 행만 찾아 계산 (기간 길이/저장된 날짜 수와 관계없이 O(언론사 수))
+- 새 날짜는 그 날짜 행만 추가, 지난 날짜에 늦게 들어온 기사는 그 언론사의 이후 누적 행만 갱신
+  (이전 기사를 다시 읽지 않음)
+- key_column(url 등)을 주면 이미 집계한 기사는 건너뜀 (같은 파일을 다시 넣어도 중복 집계 없음)
+- 언론사 목록은 크롤러의 PRESS_IDS를 사용해, 기사가 없는 언론사도 기본값(0.0)으로 포함
+
+사용 예:
+    store = OutletBiasStore('./outlet_bias.sqlite3')
+    for chunk in score_dataframe(df, model, tokenizer, device):
+        store.add_scores(chunk.join(df[['press', 'created_date', 'url']]))
+    outlet_scores = store.outlet_scores(days=30)
+    result = compute_final_bias(text, press, model, tokenizer, device, outlet_scores=outlet_scores)
+
+    python outlet_bias_store.py add --input bias_scores.csv --store ./outlet_bias.sqlite3
+    python outlet_bias_store.py show --store ./outlet_bias.sqlite3 --days 30
+"""
+import argparse
+import ast
+import hashlib
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from bias_index import PARTY_LABELS, SENTIMENT_LABELS, bias_from_probs
+
+# 집계하는 기사 단위 값 (score_dataframe 결과 컬럼 이름)
+METRICS = (
+    [f'prob_{label}' for label in PARTY_LABELS]
+    + [f'prob_{label}' for label in SENTIMENT_LABELS]
+    + ['article_party_bias', 'article_sentiment_bias', 'article_unified_bias']
+)
+# 통계 배열: [기사 수, 값별 합..., 값별 제곱합...]
+STATS_SIZE = 1 + 2 * len(METRICS)
+CRAWLER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crawling', 'naver_news_crawler.py')
+
+
+def load_press_names(path=CRAWLER_PATH):
+    """
+    크롤러의 PRESS_IDS 언론사 이름 목록
+
+    크롤러 모듈은 selenium 등을 불러오므로 import하지 않고 소스에서 PRESS_IDS 값만 읽습니다.
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == 'PRESS_IDS' for t in node.targets):
+            return list(ast.literal_eval(node.value))
+    raise ValueError(f"PRESS_IDS를 찾을 수 없습니다: {path}")
+
+
+def to_days(values):
+    """
+    작성일을 날짜 번호(1970-01-01부터 일 수)로 변환 (파싱 실패는 -1)
+
+    노트북 형식('2025.05.23. 오후 1:00')을 먼저 시도하고 나머지는 일반 날짜 문자열로 읽습니다.
+    시간대가 붙은 문자열('2025-05-24T23:30:00+09:00', '...Z')은 한국 시간 기준 날짜로 바꿉니다.
+    """
+    raw = pd.Series(values, dtype=object).astype(str)
+    text = raw.str.replace('오전', 'AM', regex=False).str.replace('오후', 'PM', regex=False)
+    dates = pd.to_datetime(text, format="%Y.%m.%d. %p %I:%M", errors='coerce')
+    missing = dates.isna()
+    if missing.any():
+        aware = missing & raw.str.contains(r'(?:Z|[+-]\d{2}:?\d{2})$', regex=True)
+        naive = missing & ~aware
+        if naive.any():
+            dates[naive] = pd.to_datetime(raw[naive], errors='coerce', format='mixed')
+        if aware.any():
+            # 오프셋이 서로 달라도 읽히도록 UTC로 맞춘 뒤 한국 시간으로 변환
+            parsed = pd.to_datetime(raw[aware], errors='coerce', format='mixed', utc=True)
+            dates[aware] = parsed.dt.tz_convert('Asia/Seoul').dt.tz_localize(None)
+    days = np.full(len(dates), -1, dtype=np.int64)
+    valid = dates.notna().to_numpy()
+    days[valid] = dates[valid].to_numpy().astype('datetime64[D]').astype(np.int64)
+    return days
+
+
+def day_to_str(day):
+    return str(np.datetime64(int(day), 'D'))
+
+
+class OutletBiasStore:
+    """
+    (언론사, 날짜)별 충분 통계 저장소
+
+    daily 테이블 한 행에 그 날의 통계(stats)와 그 날까지의 누적 통계(cumulative)를
+    float64 배열(STATS_SIZE개)로 저장합니다.
+
+    Args:
+        path (str): SQLite 파일 경로
+    """
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS daily (
+                press TEXT NOT NULL,
+                day INTEGER NOT NULL,
+                stats BLOB NOT NULL,
+                cumulative BLOB NOT NULL,
+                PRIMARY KEY (press, day)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS seen (
+                key BLOB PRIMARY KEY
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS presses (
+                press TEXT PRIMARY KEY
+            ) WITHOUT ROWID;
+        ''')
+        metrics = ','.join(METRICS)
+        row = self.conn.execute("SELECT value FROM meta WHERE name = 'metrics'").fetchone()
+        if row is None:
+            with self.conn:
+                self.conn.execute("INSERT INTO meta (name, value) VALUES ('metrics', ?)", (metrics,))
+        elif row[0] != metrics:
+            raise ValueError(f"저장소의 집계 항목이 다릅니다: {row[0]}")
+
+    @staticmethod
+    def _key(value):
+        return hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest()
+
+    @staticmethod
+    def _array(blob):
+        return np.frombuffer(blob, dtype=np.float64)
+
+    def _unseen(self, keys):
+        """아직 집계하지 않은 기사 위치와 그 키 (입력 안의 중복도 한 번만)"""
+        hashed = [self._key(key) for key in keys]
+        known = set()
+        unique = list(set(hashed))
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            known.update(row[0] for row in self.conn.execute(
+                f"SELECT key FROM seen WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            ))
+        keep, new_keys = [], []
+        for i, key in enumerate(hashed):
+            if key not in known:
+                known.add(key)
+                keep.append(i)
+                new_keys.append(key)
+        return np.array(keep, dtype=np.int64), new_keys
+
+    def add(self, presses, days, values, keys=None):
+        """
+        기사 배치를 (언론사, 날짜)별로 묶어 통계에 더하기
+
+        Args:
+            presses: 기사별 언론사 이름
+            days: 기사별 날짜 번호 (to_days, 음수는 제외)
+            values (ndarray): (기사 수, len(METRICS)) 기사 단위 값
+            keys: 기사 키 (url 등, 주면 이미 집계한 기사는 건너뜀)
+
+        Returns:
+            int: 집계한 기사 수
+        """
+        presses = pd.Series(presses, dtype=object).to_numpy()
+        days = np.asarray(days, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        valid = (days >= 0) & pd.notna(presses) & np.isfinite(values).all(axis=1)
+        new_keys = []
+        if keys is not None:
+            keys = pd.Series(keys, dtype=object).to_numpy()[valid]
+        presses, days, values = presses[valid], days[valid], values[valid]
+        if keys is not None:
+            keep, new_keys = self._unseen(keys)
+            presses, days, values = presses[keep], days[keep], values[keep]
+        if len(days) == 0:
+            return 0
+
+        press_names, press_codes = np.unique(presses.astype(str), return_inverse=True)
+        groups, group_codes = np.unique(np.stack([press_codes, days], axis=1), axis=0, return_inverse=True)
+        group_codes = group_codes.ravel()
+        deltas = np.zeros((len(groups), STATS_SIZE), dtype=np.float64)
+        deltas[:, 0] = np.bincount(group_codes, minlength=len(groups))
+        np.add.at(deltas[:, 1:1 + len(METRICS)], group_codes, values)
+        np.add.at(deltas[:, 1 + len(METRICS):], group_codes, values ** 2)
+
+        with self.conn:
+            for (press_code, day), delta in zip(groups, deltas):
+                self._merge(str(press_names[press_code]), int(day), delta)
+            if new_keys:
+                self.conn.executemany("INSERT OR IGNORE INTO seen (key) VALUES (?)", [(key,) for key in new_keys])
+        return len(days)
+
+    def _merge(self, press, day, delta):
+        """한 (언론사, 날짜) 통계를 더하고 그 날짜 이후 누적 통계 갱신"""
+        row = self.conn.execute("SELECT stats FROM daily WHERE press = ? AND day = ?", (press, day)).fetchone()
+        if row is None:
+            previous = self.conn.execute(
+                "SELECT cumulative FROM daily WHERE press = ? AND day < ? ORDER BY day DESC LIMIT 1", (press, day)
+            ).fetchone()
+            cumulative = self._array(previous[0]) if previous else np.zeros(STATS_SIZE)
+            self.conn.execute("INSERT OR IGNORE INTO presses (press) VALUES (?)", (press,))
+            self.conn.execute(
+                "INSERT INTO daily (press, day, stats, cumulative) VALUES (?, ?, ?, ?)",
+                (press, day, delta.tobytes(), (cumulative + delta).tobytes())
+            )
+        else:
+            self.conn.execute(
+                "UPDATE daily SET stats = ?, cumulative = ? WHERE press = ? AND day = ?",
+                ((self._array(row[0]) + delta).tobytes(),
+                 (self._cumulative_at(press, day) + delta).tobytes(), press, day)
+            )
+        # 늦게 들어온 기사: 이후 날짜의 누적 통계에도 더하기 (보통 새 날짜라 0행)
+        later = self.conn.execute(
+            "SELECT day, cumulative FROM daily WHERE press = ? AND day > ?", (press, day)
+        ).fetchall()
+        if later:
+            self.conn.executemany(
+                "UPDATE daily SET cumulative = ? WHERE press = ? AND day = ?",
+                [((self._array(blob) + delta).tobytes(), press, later_day) for later_day, blob in later]
+            )
+
+    def _cumulative_at(self, press, day):
+        row = self.conn.execute("SELECT cumulative FROM daily WHERE press = ? AND day = ?", (press, day)).fetchone()
+        return self._array(row[0])
+
+    def add_scores(self, df, press_column='press', date_column='created_date', key_column='url'):
+        """
+        score_dataframe 결과(기사 단위 값 컬럼)와 언론사/작성일 컬럼이 있는 DataFrame 집계
+
+        key_column이 없으면 중복 확인 없이 모두 집계합니다.
+        """
+        missing = [column for column in METRICS + [press_column, date_column] if column not in df]
+        if missing:
+            raise KeyError(f"집계에 필요한 컬럼이 없습니다: {', '.join(missing)}")
+        days = to_days(df[date_column])
+        if (days < 0).any():
+            print(f"작성일을 읽을 수 없는 기사 {int((days < 0).sum())}개 제외")
+        keys = df[key_column].tolist() if key_column and key_column in df else None
+        return self.add(df[press_column].tolist(), days, df[METRICS].to_numpy(dtype=np.float64), keys)
+
+    def add_probs(self, party_probs, sentiment_probs, presses, dates, keys=None):
+        """정당/감성 확률 배열로 기사 단위 값을 계산해 집계 (predict_probs_batched 결과)"""
+        party_probs = np.asarray(party_probs, dtype=np.float64)
+        sentiment_probs = np.asarray(sentiment_probs, dtype=np.float64)
+        scores = bias_from_probs(party_probs, sentiment_probs, presses, outlet_scores={})
+        values = np.column_stack([
+            party_probs, sentiment_probs,
+            scores['article_party_bias'], scores['article_sentiment_bias'], scores['article_unified_bias']
+        ])
+        return self.add(presses, to_days(dates), values, keys)
+
+    def presses(self):
+        return [row[0] for row in self.conn.execute("SELECT press FROM presses")]
+
+    def latest_day(self):
+        """저장소의 마지막 날짜 번호 (언론사마다 기본 키로 마지막 행 하나)"""
+        days = [
+            self.conn.execute("SELECT MAX(day) FROM daily WHERE press = ?", (press,)).fetchone()[0]
+            for press in self.presses()
+        ]
+        days = [day for day in days if day is not None]
+        return max(days) if days else None
+
+    def _cumulative(self, before):
+        """언론사별로 before보다 이전 마지막 날짜의 누적 통계 (before가 None이면 전체)"""
+        cumulative = {}
+        for press in self.presses():
+            if before is None:
+                row = self.conn.execute(
+                    "SELECT cumulative FROM daily WHERE press = ? ORDER BY day DESC LIMIT 1", (press,)
+                ).fetchone()
+            else:
+                row = self.conn.execute(
+                    "SELECT cumulative FROM daily WHERE press = ? AND day < ? ORDER BY day DESC LIMIT 1",
+                    (press, before)
+                ).fetchone()
+            if row is not None:
+                cumulative[press] = self._array(row[0])
+        return cumulative
+
+    def totals(self, days=None, end=None):
+        """
+        언론사별 기간 통계 배열 (누적 통계의 차이)
+
+        Args:
+            days (int): 최근 일 수 (None이면 전체 기간)
+            end: 기간 마지막 날짜 (기본값: 저장소의 마지막 날짜)
+
+        Returns:
+            dict: 언론사 -> STATS_SIZE 배열
+        """
+        end_day = self.latest_day() if end is None else int(to_days([end])[0])
+        if end_day is None:
+            return {}
+        upper = self._cumulative(end_day + 1)
+        if days is None:
+            return upper
+        lower = self._cumulative(end_day + 1 - days)
+        totals = {}
+        for press, stats in upper.items():
+            window = stats - lower.get(press, 0.0)
+            if window[0] > 0:
+                totals[press] = window
+        return totals
+
+    def stats(self, days=None, end=None, presses=None):
+        """
+        언론사별 기사 수와 값별 평균/표준편차 DataFrame
+
+        outlet_unified_bias는 article_unified_bias 평균입니다.
+        presses를 주면 그 언론사만 (기사가 없는 언론사는 기사 수 0) 포함합니다.
+        """
+        totals = self.totals(days, end)
+        names = sorted(totals) if presses is None else list(presses)
+        matrix = np.array([totals.get(name, np.zeros(STATS_SIZE)) for name in names]).reshape(len(names), STATS_SIZE)
+        counts = matrix[:, 0]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = matrix[:, 1:1 + len(METRICS)] / counts[:, None]
+            variances = matrix[:, 1 + len(METRICS):] / counts[:, None] - means ** 2
+        stds = np.sqrt(np.clip(variances, 0, None))
+        frame = pd.DataFrame({'press': names, 'articles': counts.astype(np.int64)})
+        for i, metric in enumerate(METRICS):
+            frame[f'{metric}_mean'] = means[:, i]
+            frame[f'{metric}_std'] = stds[:, i]
+        frame['outlet_unified_bias'] = frame['article_unified_bias_mean']
+        return frame.set_index('press')
+
+    def outlet_scores(self, days=None, end=None, presses=None, min_articles=1, default=0.0):
+        """
+        compute_final_bias/bias_from_probs에 넘길 언론사 지수 dict
+
+        Args:
+            days (int): 최근 일 수 (None이면 전체 기간)
+            presses: 포함할 언론사 (기본값: 크롤러 PRESS_IDS와 저장소의 모든 언론사)
+            min_articles (int): 이보다 기사가 적은 언론사는 default 사용
+            default (float): 기사가 없는 언론사 지수 (노트북과 같은 0.0)
+        """
+        totals = self.totals(days, end)
+        if presses is None:
+            presses = list(dict.fromkeys(load_press_names() + sorted(totals)))
+        scores = {}
+        for press in presses:
+            stats = totals.get(press)
+            if stats is None or stats[0] < min_articles:
+                scores[press] = default
+            else:
+                scores[press] = float(stats[METRICS.index('article_unified_bias') + 1] / stats[0])
+        return scores
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="언론사별 편향 지수 집계")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    add_parser = subparsers.add_parser('add', help="기사 단위 점수 CSV를 집계에 추가")
+    add_parser.add_argument('--input', required=True, nargs='+', help="score_dataframe 결과와 언론사/작성일 컬럼이 있는 CSV")
+    add_parser.add_argument('--press-column', default='press')
+    add_parser.add_argument('--date-column', default='created_date')
+    add_parser.add_argument('--key-column', default='url', help="중복 집계를 막을 기사 키 컬럼 (없으면 확인 안 함)")
+    add_parser.add_argument('--chunksize', type=int, default=50000, help="CSV 청크 크기")
+
+    show_parser = subparsers.add_parser('show', help="언론사 지수 출력")
+    show_parser.add_argument('--days', type=int, default=None, help="최근 일 수 (생략하면 전체 기간)")
+    show_parser.add_argument('--end', default=None, help="기간 마지막 날짜 (YYYY-MM-DD)")
+    show_parser.add_argument('--output', help="언론사별 통계 CSV")
+
+    for sub in (add_parser, show_parser):
+        sub.add_argument('--store', default='./outlet_bias.sqlite3', help="집계 저장소 파일")
+    args = parser.parse_args()
+
+    store = OutletBiasStore(args.store)
+    try:
+        if args.command == 'add':
+            added = 0
+            for path in args.input:
+                for chunk in pd.read_csv(path, chunksize=args.chunksize):
+                    added += store.add_scores(chunk, args.press_column, args.date_column, args.key_column)
+            print(f"집계한 기사: {added}개 (마지막 날짜 {day_to_str(store.latest_day()) if added else '-'})")
+        else:
+            frame = store.stats(args.days, args.end, presses=list(store.outlet_scores(args.days, args.end)))
+            if args.output:
+                frame.to_csv(args.output, encoding='utf-8-sig')
+            with pd.option_context('display.width', 200, 'display.max_rows', None):
+                print(frame[['articles', 'article_unified_bias_mean', 'article_unified_bias_std']]
+                      .sort_values('article_unified_bias_mean', ascending=False).round(3).to_string())
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
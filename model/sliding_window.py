@@ -0,0 +1,157 @@
+"""
+슬라이딩 윈도우 긴 기사 추론 (RoBERTa NewsBiasModel)
+
+512 토큰을 넘는 기사를 겹치는 512 토큰 윈도우로 나눠 모두 추론하고, 윈도우 로짓을 기사별로 합칩니다.
+Longformer(1600 토큰 고정 패딩) 없이 긴 기사 전체를 보면서 짧은 기사는 윈도우 하나(기존 512 토큰
+경로와 같은 입력)만 사용하므로 계산량이 기사 길이에 비례합니다.
+
+- 기사 배치의 모든 윈도우를 모아 한 번에(max_batch_windows 단위) 512 토큰 고정 패딩/추론
+  (NewsBiasModel은 패딩 위치까지 평균을 내므로 pad_to=None인 동적 패딩은 빠르지만 윈도우 로짓이
+  같은 배치에 묶인 다른 윈도우에 따라 달라짐)
+- pooling='mean': 윈도우의 실제 토큰 수로 가중 평균한 로짓
+- pooling='attention': 윈도우 확신도(예측 분포의 음의 엔트로피)를 softmax한 가중치 x 토큰 수로 가중 평균
+  (학습이 필요 없는 가중치이며, 태스크마다 따로 계산)
+
+사용 예:
+    party_probs, sentiment_probs = predict_probs_windowed(texts, model, tokenizer, device, pooling='mean')
+    scores = bias_from_probs(party_probs, sentiment_probs, presses)
+"""
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn.functional as F
+
+from bias_index import PARTY_LABELS, SENTIMENT_LABELS
+
+POOLINGS = ('mean', 'attention')
+
+
+def encode_windows(texts, tokenizer, max_length=512, stride=128, max_windows=None):
+    """
+    기사들을 겹치는 윈도우로 토큰화
+
+    stride는 이웃한 윈도우가 겹치는 토큰 수입니다 (transformers 토크나이저의 stride와 같음).
+    max_length 이하인 기사는 윈도우 하나이며, 일반 truncation 토큰화 결과와 같습니다.
+
+    Returns:
+        tuple: (윈도우별 input_ids 리스트, 윈도우별 기사 번호 ndarray)
+    """
+    if not tokenizer.is_fast:
+        raise ValueError("슬라이딩 윈도우 토큰화에는 fast 토크나이저가 필요합니다")
+    texts = ["" if pd.isnull(text) else str(text) for text in texts]
+    enc = tokenizer(texts, max_length=max_length, truncation=True, stride=stride,
+                    return_overflowing_tokens=True)
+    windows = enc['input_ids']
+    owners = np.asarray(enc['overflow_to_sample_mapping'], dtype=np.int64)
+
+    if max_windows:
+        # 기사마다 앞에서부터 max_windows개 윈도우만 사용
+        starts = np.r_[0, np.cumsum(np.bincount(owners, minlength=len(texts)))]
+        position = np.arange(len(owners)) - starts[owners]
+        keep = np.flatnonzero(position < max_windows)
+        windows = [windows[i] for i in keep]
+        owners = owners[keep]
+    return windows, owners
+
+
+def pool_window_logits(logits, owners, num_articles, weights, pooling='mean', temperature=1.0):
+    """
+    윈도우 로짓을 기사별로 합치기
+
+    Args:
+        logits (Tensor): (윈도우 수, 클래스 수)
+        owners (Tensor): 윈도우별 기사 번호
+        weights (Tensor): 윈도우별 기본 가중치 (실제 토큰 수)
+        pooling (str): 'mean' 또는 'attention'
+        temperature (float): attention 가중치 온도 (클수록 평균에 가까움)
+
+    Returns:
+        Tensor: (기사 수, 클래스 수)
+    """
+    weights = weights.to(logits.dtype)
+    if pooling == 'attention':
+        log_probs = F.log_softmax(logits, dim=1)
+        confidence = (log_probs.exp() * log_probs).sum(dim=1)  # 음의 엔트로피
+        scores = confidence / temperature + torch.log(weights)
+        # 기사별 softmax (기사 안에서 최댓값을 빼 안정화)
+        maximum = torch.full((num_articles,), float('-inf'), dtype=scores.dtype)
+        maximum = maximum.scatter_reduce(0, owners, scores, reduce='amax')
+        weights = torch.exp(scores - maximum[owners])
+    elif pooling != 'mean':
+        raise ValueError(f"pooling은 {POOLINGS} 중 하나여야 합니다: {pooling}")
+
+    totals = torch.zeros(num_articles, dtype=logits.dtype).index_add_(0, owners, weights)
+    pooled = torch.zeros(num_articles, logits.shape[1], dtype=logits.dtype)
+    pooled.index_add_(0, owners, logits * weights.unsqueeze(1))
+    return pooled / totals.unsqueeze(1)
+
+
+def predict_windowed(texts, model, tokenizer, device, batch_size=16, max_length=512, stride=128,
+                     pooling='mean', temperature=1.0, max_windows=None, max_batch_windows=64, pad_to=512):
+    """
+    슬라이딩 윈도우로 기사별 정당/감성 로짓 계산
+
+    토큰 수가 비슷한 기사끼리 batch_size개씩 묶고, 그 기사들의 윈도우를 모두 모아
+    max_batch_windows개씩 한 번에 추론합니다 (pad_to 길이로 고정 패딩, pad_to=None이면
+    가장 긴 윈도우 길이까지만 패딩해 빠르지만 윈도우 로짓이 배치 구성에 따라 달라짐).
+
+    Returns:
+        dict: party_logits, sentiment_logits (기사 수 x 3 Tensor), num_windows (기사별 윈도우 수),
+            padded_tokens (추론한 패딩 포함 토큰 수)
+    """
+    texts = list(texts)
+    windows, owners = encode_windows(texts, tokenizer, max_length, stride, max_windows)
+    lengths = np.array([len(ids) for ids in windows], dtype=np.int64)
+    article_tokens = np.bincount(owners, weights=lengths, minlength=len(texts))
+    num_windows = np.bincount(owners, minlength=len(texts))
+
+    # 기사별 윈도우 위치 (encode_windows 결과는 기사 순서대로 이어져 있음)
+    window_starts = np.r_[0, np.cumsum(num_windows)]
+    article_order = np.argsort(article_tokens, kind='stable')
+
+    party_logits = torch.zeros(len(windows), len(PARTY_LABELS))
+    sentiment_logits = torch.zeros(len(windows), len(SENTIMENT_LABELS))
+    padded_tokens = 0
+
+    model.eval()
+    with torch.no_grad():
+        for start in range(0, len(article_order), batch_size):
+            articles = article_order[start:start + batch_size]
+            batch_windows = np.concatenate([
+                np.arange(window_starts[i], window_starts[i + 1]) for i in articles
+            ])
+            batch_windows = batch_windows[np.argsort(lengths[batch_windows], kind='stable')]
+            for sub_start in range(0, len(batch_windows), max_batch_windows):
+                sub = batch_windows[sub_start:sub_start + max_batch_windows]
+                enc = tokenizer.pad(
+                    {'input_ids': [windows[i] for i in sub]},
+                    padding='max_length' if pad_to else 'longest',
+                    max_length=pad_to,
+                    return_tensors='pt'
+                )
+                padded_tokens += enc['input_ids'].numel()
+                out = model(input_ids=enc['input_ids'].to(device), attention_mask=enc['attention_mask'].to(device))
+                party_logits[sub] = out['party_logits'].float().cpu()
+                sentiment_logits[sub] = out['sentiment_logits'].float().cpu()
+
+    owners_tensor = torch.from_numpy(owners)
+    weights = torch.from_numpy(lengths).float()
+    return {
+        'party_logits': pool_window_logits(party_logits, owners_tensor, len(texts), weights, pooling, temperature),
+        'sentiment_logits': pool_window_logits(sentiment_logits, owners_tensor, len(texts), weights, pooling, temperature),
+        'num_windows': num_windows,
+        'padded_tokens': padded_tokens,
+    }
+
+
+def predict_probs_windowed(texts, model, tokenizer, device, **kwargs):
+    """
+    슬라이딩 윈도우 정당/감성 확률 (bias_index.predict_probs_batched와 같은 반환 형식)
+
+    Returns:
+        tuple: (party_probs, sentiment_probs) 입력 순서의 (기사 수, 3) 배열
+    """
+    out = predict_windowed(texts, model, tokenizer, device, **kwargs)
+    party_probs = F.softmax(out['party_logits'], dim=1).numpy().astype(np.float64)
+    sentiment_probs = F.softmax(out['sentiment_logits'], dim=1).numpy().astype(np.float64)
+    return party_probs, sentiment_probs
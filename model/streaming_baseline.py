@@ -0,0 +1,235 @@
+"""
+스트리밍 베이스라인 모델 (baseline_model.ipynb의 BaselineModel을 청크 단위/점진 학습으로)
+
+- HashingVectorizer: 어휘 사전을 만들지 않는 상태 없는 벡터화 (1~2-gram, TF-IDF 대신 l2 정규화한 빈도)
+- SGDClassifier(loss='log_loss'): partial_fit으로 청크마다 학습하는 로지스틱 회귀
+- class_weight='balanced'는 partial_fit에서 쓸 수 없으므로 지금까지 본 레이블 수로 표본 가중치를 계산
+- 새로 레이블링한 기사는 partial_fit으로 이어서 학습하고 save/load로 작은 파일(joblib)로 보관
+
+train/predict/evaluate는 노트북 BaselineModel과 같은 인터페이스입니다.
+
+사용법:
+    # CSV를 청크로 읽어 학습, 평가 결과를 baseline_results.csv와 같은 형식으로 저장
+    python streaming_baseline.py --input ../data/정당_관점_라벨링_최종_업데이트.csv \\
+        --model ./baseline_results/streaming_baseline.joblib
+    # 새로 레이블링한 기사로 이어서 학습
+    python streaming_baseline.py --input ../data/새_레이블.csv --model ./baseline_results/streaming_baseline.joblib --update
+"""
+import argparse
+import hashlib
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import classification_report, f1_score
+
+party_mapping = {'국민의힘': 0, '민주당': 1, '그외': 2}
+TARGET_NAMES = ['국민의힘', '민주당', '그외']
+
+
+def read_labeled_chunks(path, chunksize=5000):
+    """노트북과 같은 전처리로 레이블 CSV를 청크 단위로 읽기 (텍스트, 정당 레이블)"""
+    for df in pd.read_csv(path, chunksize=chunksize):
+        df['party_label'] = df['party'].map(party_mapping)
+        df = df.dropna(subset=['title_cleaned', 'content_cleaned', 'party_label'])
+        df['text'] = df['title_cleaned'] + ' ' + df['content_cleaned']
+        yield df['text'].tolist(), df['party_label'].astype(int).to_numpy()
+
+
+def is_holdout(text, ratio=0.2):
+    """텍스트 해시로 정하는 검증용 기사 여부 (청크/실행 순서와 관계없이 항상 같음)"""
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') / 2 ** 64 < ratio
+
+
+class StreamingBaselineModel:
+    """
+    HashingVectorizer + SGD 로지스틱 회귀 베이스라인 (점진 학습)
+
+    Args:
+        n_features (int): 해시 특성 수
+        ngram_range (tuple): n-gram 범위 (노트북과 같은 (1, 2))
+        alpha (float): L2 규제 강도
+        balanced (bool): 지금까지 본 레이블 수로 클래스 균형 가중치 적용
+    """
+    def __init__(self, n_features=2 ** 18, ngram_range=(1, 2), alpha=1e-5, balanced=True, random_state=42):
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=ngram_range,
+            alternate_sign=False,
+            norm='l2'
+        )
+        self.clf = SGDClassifier(loss='log_loss', alpha=alpha, random_state=random_state)
+        self.classes = np.arange(len(TARGET_NAMES))
+        self.class_counts = np.zeros(len(self.classes), dtype=np.int64)
+        self.balanced = balanced
+        self.random_state = random_state
+
+    def _sample_weight(self, labels):
+        if not self.balanced:
+            return None
+        counts = np.maximum(self.class_counts, 1)
+        weights = self.class_counts.sum() / (len(self.classes) * counts)
+        return weights[labels]
+
+    def partial_fit(self, texts, party_labels):
+        """새 레이블 배치로 한 번 학습 (이전 학습 결과에 이어서)"""
+        party_labels = np.asarray(party_labels, dtype=np.int64)
+        if len(party_labels) == 0:
+            return self
+        self.class_counts += np.bincount(party_labels, minlength=len(self.classes))
+        features = self.vectorizer.transform(texts)
+        self.clf.partial_fit(features, party_labels, classes=self.classes,
+                             sample_weight=self._sample_weight(party_labels))
+        return self
+
+    def train_stream(self, chunks, epochs=1):
+        """
+        (텍스트, 레이블) 청크 반복자로 학습
+
+        epochs가 2 이상이면 chunks는 다시 만들 수 있는 함수(호출하면 반복자 반환)여야 합니다.
+        """
+        print("모델 학습 중...")
+        for epoch in range(epochs):
+            iterator = chunks() if callable(chunks) else chunks
+            for texts, party_labels in iterator:
+                self.partial_fit(texts, party_labels)
+        print("모델 학습 완료!")
+
+    def train(self, train_texts, train_party_labels, epochs=5, batch_size=2000):
+        """메모리에 있는 데이터로 학습 (노트북 인터페이스, 에폭마다 순서를 섞어 배치 학습)"""
+        texts = list(train_texts)
+        labels = np.asarray(train_party_labels, dtype=np.int64)
+        rng = np.random.default_rng(self.random_state)
+
+        def batches():
+            order = rng.permutation(len(texts))
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                yield [texts[i] for i in batch], labels[batch]
+
+        self.train_stream(batches, epochs=epochs)
+
+    def predict(self, texts):
+        """예측 수행"""
+        features = self.vectorizer.transform(texts)
+        return {
+            'party_preds': self.clf.predict(features),
+            'party_probs': self.clf.predict_proba(features)
+        }
+
+    def evaluate(self, texts, true_party_labels):
+        """모델 평가"""
+        party_preds = self.clf.predict(self.vectorizer.transform(texts))
+        party_report = classification_report(
+            true_party_labels,
+            party_preds,
+            labels=self.classes,
+            target_names=TARGET_NAMES,
+            output_dict=True,
+            zero_division=0
+        )
+        return {
+            'party_report': party_report,
+            'party_macro_f1': f1_score(true_party_labels, party_preds, labels=self.classes, average='macro')
+        }
+
+    def save(self, path):
+        """
+        모델 상태를 파일로 저장
+
+        클래스 자체가 아닌 설정값과 학습된 SGDClassifier만 저장하므로, 스크립트로 실행해
+        저장한 파일도 다른 모듈에서 import한 클래스로 불러올 수 있습니다.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        state = {
+            'n_features': self.vectorizer.n_features,
+            'ngram_range': self.vectorizer.ngram_range,
+            'balanced': self.balanced,
+            'random_state': self.random_state,
+            'class_counts': self.class_counts,
+            'clf': self.clf
+        }
+        joblib.dump(state, path, compress=3)
+
+    @staticmethod
+    def load(path):
+        """save로 저장한 상태에서 모델 복원"""
+        state = joblib.load(path)
+        model = StreamingBaselineModel(
+            n_features=state['n_features'],
+            ngram_range=tuple(state['ngram_range']),
+            alpha=state['clf'].alpha,
+            balanced=state['balanced'],
+            random_state=state['random_state']
+        )
+        model.clf = state['clf']
+        model.class_counts = np.asarray(state['class_counts'], dtype=np.int64)
+        return model
+
+
+def save_baseline_results(results, path='./baseline_results/baseline_results.csv'):
+    """노트북과 같은 형식(party_f1, party_accuracy)으로 결과 저장"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    baseline_results = {
+        'party_f1': results['party_report']['weighted avg']['f1-score'],
+        'party_accuracy': results['party_report']['accuracy']
+    }
+    pd.DataFrame([baseline_results]).to_csv(path, index=False)
+    return baseline_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스트리밍 베이스라인 학습/점진 학습")
+    parser.add_argument('--input', required=True, nargs='+', help="레이블이 있는 기사 CSV")
+    parser.add_argument('--model', default='./baseline_results/streaming_baseline.joblib', help="모델 파일")
+    parser.add_argument('--update', action='store_true', help="기존 모델 파일에 이어서 학습")
+    parser.add_argument('--epochs', type=int, default=None, help="학습 반복 횟수 (기본: 5, --update면 1)")
+    parser.add_argument('--chunksize', type=int, default=5000, help="CSV 청크 크기")
+    parser.add_argument('--holdout', type=float, default=0.2, help="텍스트 해시로 고르는 검증 비율")
+    parser.add_argument('--results', default='./baseline_results/streaming_baseline_results.csv',
+                        help="평가 결과 CSV (baseline_results.csv와 같은 형식)")
+    args = parser.parse_args()
+    if args.epochs is None:
+        args.epochs = 1 if args.update else 5
+
+    if args.update and os.path.exists(args.model):
+        model = StreamingBaselineModel.load(args.model)
+    else:
+        model = StreamingBaselineModel()
+
+    def train_chunks():
+        for path in args.input:
+            for texts, labels in read_labeled_chunks(path, args.chunksize):
+                keep = [i for i, text in enumerate(texts) if not is_holdout(text, args.holdout)]
+                yield [texts[i] for i in keep], labels[keep]
+
+    model.train_stream(train_chunks, epochs=args.epochs)
+    model.save(args.model)
+    print(f"모델 저장: {args.model} ({os.path.getsize(args.model) / 1024 / 1024:.1f}MB)")
+
+    val_texts, val_labels = [], []
+    for path in args.input:
+        for texts, labels in read_labeled_chunks(path, args.chunksize):
+            for text, label in zip(texts, labels):
+                if is_holdout(text, args.holdout):
+                    val_texts.append(text)
+                    val_labels.append(label)
+    if val_texts:
+        results = model.evaluate(val_texts, val_labels)
+        baseline_results = save_baseline_results(results, args.results)
+        print("\n베이스라인 모델 성능:")
+        print(f"F1 점수: {baseline_results['party_f1']:.4f}")
+        print(f"정확도: {baseline_results['party_accuracy']:.4f}")
+        print(f"Macro F1 점수: {results['party_macro_f1']:.4f}")
+
+
+if __name__ == "__main__":
+    main()
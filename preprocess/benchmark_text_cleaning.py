@@ -0,0 +1,219 @@
+"""
+텍스트 전처리 속도 비교 및 결과 동일성 확인 (합성 말뭉치 기준)
+
+- legacy: 노트북의 clean_text1/clean_text를 Series.apply로 행마다 적용
+- compiled: text_cleaning 모듈을 단일 프로세스로 적용
+- parallel: text_cleaning 모듈을 청크 단위로 프로세스 풀에서 적용
+
+합성 기사에는 기자명, 사진 설명, 언론사명, 저작권 문구, URL, HTML 태그, 괄호 등
+정제 대상 조각을 무작위로 섞어 넣고, 세 방식의 결과가 모두 같은지 확인합니다.
+
+사용법:
+    python benchmark_text_cleaning.py --articles 300000 --workers 8
+"""
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import random
+import re
+import time
+
+import pandas as pd
+
+from text_cleaning import clean_text as compiled_clean_text
+from text_cleaning import clean_text1 as compiled_clean_text1
+from text_cleaning import clean_records
+
+
+def legacy_clean_text1(text):
+    """news_preprocessing.ipynb의 clean_text1 (비교용)"""
+    if not isinstance(text, str):
+        return ""
+    text = re.sub(r'https?://\S+', '', text)
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'[\n\r]+', ' ', text)
+    text = re.sub(r'[^\w\s가-힣]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+    return text
+
+
+def legacy_clean_text(text):
+    """news_preprocessing.ipynb의 clean_text (비교용)"""
+    if not isinstance(text, str):
+        return ""
+
+    text = re.sub(r'\([^\)]+기자\)', '', text)
+    text = re.sub(r'[가-힣]{2,4}\s?기자(입니다)?', '', text)
+    text = re.sub(r'기자\s*=\s*', '', text)
+    text = re.sub(r'사진[=:\-]\s*[^,\n]+', '', text)
+    text = re.sub(r'(연합뉴스|뉴스1|뉴시스|SBS|KBS|MBC|JTBC|YTN)', '', text)
+
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'https?://\S+', '', text)
+
+    text = re.sub(r'\(서울=.*?\)', '', text)
+    text = re.sub(r'\[[^\]]*\]', '', text)
+
+    noise_patterns = [
+        r'무단 전재 및 재배포 금지',
+        r'해당 기사.*?무단 전재.*?금지합니다',
+        r'자세한 내용은.*?확인하십시오',
+        r'본 기사.*?무단 전재.*?금지',
+        r'ⓒ 오마이뉴스.*',
+        r'오마이뉴스\s*ⓒ.*',
+        r'조선닷컴.*',
+        r'경향신문.*?재배포 금지',
+        r'중앙일보.*?무단 전재.*',
+        r'한국일보.*?저작권.*',
+        r'SBS.*?All rights reserved',
+        r'All rights reserved.*',
+        r'사진[=:\-]\s*[^,\n]+',
+        r'\(사진=\s*SBS.*?\)',
+        r'경향신문\s*무단 전재.*',
+        r'동아일보\s*무단 전재.*',
+        r'중앙일보\s*재배포.*',
+        r'한국일보\s*무단.*',
+        r'뉴스1',
+        r'연합뉴스',
+        r'뉴시스',
+        r'기자\s*입력\s*\d{4}',
+        r'기자\s*승인\s*\d{4}',
+        r'중앙일보\s*제공',
+    ]
+    for pattern in noise_patterns:
+        text = re.sub(pattern, '', text)
+
+    text = re.sub(r'\n+', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s가-힣%℃·\-]', '', text)
+
+    return text.strip()
+
+
+WORDS = [
+    '국회', '대통령', '여당', '야당', '국민의힘', '더불어민주당', '정부', '예산안', '법안', '표결',
+    '위원장', '의원', '선거', '지지율', '여론조사', '개혁', '외교', '안보', '경제', '정책',
+    '발표했다', '밝혔다', '주장했다', '비판했다', '강조했다', '논란', '협상', '합의', '회의', '총선'
+]
+
+NOISE = [
+    '(서울=연합뉴스) 홍길동 기자 = ', '김철수 기자', '이영희기자입니다', '(박민수 기자)', '기자 = ',
+    '사진=연합뉴스', '사진: 국회사진기자단,', '연합뉴스', '뉴스1', '뉴시스', 'SBS', 'KBS', 'MBC', 'JTBC', 'YTN',
+    '<b>', '</b>', '<a href="https://news.naver.com">', 'https://n.news.naver.com/article/001/0000000001',
+    '[속보]', '[단독] ', '무단 전재 및 재배포 금지', '해당 기사는 무단 전재를 금지합니다',
+    '자세한 내용은 홈페이지에서 확인하십시오', '본 기사는 무단 전재 금지', 'ⓒ 오마이뉴스 무단 전재',
+    '오마이뉴스 ⓒ', '조선닷컴 바로가기', '경향신문 무단 전재 및 재배포 금지', '중앙일보 무단 전재',
+    '한국일보 저작권자', 'SBS All rights reserved', 'All rights reserved.', '(사진= SBS 캡처)',
+    '동아일보 무단 전재', '중앙일보 재배포', '한국일보 무단', '기자 입력 2024', '기자 승인 2025',
+    '중앙일보 제공', '\n', '\n\n', '\r\n', '  ', '!', '?', '...', '%', '℃', '·', '-', '"', "'", '(', ')',
+    '[', ']', '<', '>', '=', ':', ',', 'ⓒ', '▶', '△', '3.5%', '영하 5℃'
+]
+
+
+def make_corpus(n_articles, seed=42):
+    """정제 대상 조각이 섞인 합성 기사 DataFrame 생성"""
+    rng = random.Random(seed)
+
+    def sentence(n_words, noise_rate):
+        parts = []
+        for _ in range(n_words):
+            parts.append(rng.choice(NOISE) if rng.random() < noise_rate else rng.choice(WORDS))
+            parts.append('' if rng.random() < 0.1 else ' ')
+        return ''.join(parts)
+
+    titles = [sentence(rng.randint(4, 12), 0.15) for _ in range(n_articles)]
+    contents = [
+        '\n'.join(sentence(rng.randint(10, 25), 0.08) for _ in range(rng.randint(3, 10)))
+        for _ in range(n_articles)
+    ]
+    # 결측/비문자열 값도 포함
+    for i in range(0, n_articles, 997):
+        contents[i] = None
+    return pd.DataFrame({'title': titles, 'content': contents})
+
+
+def run_legacy(df):
+    return (
+        df['title'].apply(legacy_clean_text1).tolist(),
+        df['title'].apply(legacy_clean_text).tolist(),
+        df['content'].apply(legacy_clean_text).tolist()
+    )
+
+
+def run_compiled(df):
+    return (
+        df['title'].apply(compiled_clean_text1).tolist(),
+        df['title'].apply(compiled_clean_text).tolist(),
+        df['content'].apply(compiled_clean_text).tolist()
+    )
+
+
+def run_parallel(df, workers, chunk_size):
+    titles = df['title'].tolist()
+    contents = df['content'].tolist()
+    results = ([], [], [])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(clean_records, titles[start:start + chunk_size], contents[start:start + chunk_size])
+            for start in range(0, len(df), chunk_size)
+        ]
+        for future in futures:
+            for column, values in zip(results, future.result()):
+                column.extend(values)
+    return results
+
+
+def count_mismatches(name, expected, actual, df):
+    mismatches = 0
+    columns = ('title_cleaned', 'title_cleaned1', 'content_cleaned')
+    sources = (df['title'], df['title'], df['content'])
+    for column, source, expected_values, actual_values in zip(columns, sources, expected, actual):
+        for i, (a, b) in enumerate(zip(expected_values, actual_values)):
+            if a != b:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"[{name}] 불일치 ({column}, {i}행): {source.iloc[i]!r}\n  기존: {a!r}\n  신규: {b!r}")
+        if len(expected_values) != len(actual_values):
+            mismatches += abs(len(expected_values) - len(actual_values))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 전처리 속도 비교 및 결과 동일성 확인")
+    parser.add_argument('--articles', type=int, default=300000, help="합성 기사 수")
+    parser.add_argument('--workers', type=int, default=None, help="parallel 방식 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument('--chunk-size', type=int, default=2000, help="parallel 방식 작업 하나당 기사 수")
+    parser.add_argument('--seed', type=int, default=42, help="합성 말뭉치 시드")
+    args = parser.parse_args()
+
+    df = make_corpus(args.articles, args.seed)
+    chars = df['title'].str.len().sum() + df['content'].str.len().sum()
+    print(f"합성 기사 {len(df)}개 ({chars / 1e6:.1f}M 글자)")
+
+    timings = {}
+    started = time.perf_counter()
+    expected = run_legacy(df)
+    timings['legacy'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    compiled = run_compiled(df)
+    timings['compiled'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parallel = run_parallel(df, args.workers, args.chunk_size)
+    timings['parallel'] = time.perf_counter() - started
+
+    mismatches = count_mismatches('compiled', expected, compiled, df)
+    mismatches += count_mismatches('parallel', expected, parallel, df)
+
+    print()
+    for name, seconds in timings.items():
+        print(f"{name:<10} {seconds:8.2f} 초 | {len(df) / seconds:10.0f} 기사/초 | "
+              f"legacy 대비 {timings['legacy'] / seconds:5.1f}배")
+    print(f"불일치: {mismatches}건")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,429 @@
+"""
+MinHash/LSH 기반 유사 중복 기사 탐지
+
+연합뉴스, 뉴스1, 뉴시스 기사를 여러 언론사가 조금씩 고쳐 다시 싣는 경우처럼
+완전히 같지는 않은 중복 기사를 찾아 묶고, 묶음마다 대표 기사를 하나 고릅니다.
+
+- 공백을 뺀 본문을 글자 단위 k-gram(shingle)으로 나누고 MinHash 서명을 계산
+- 서명을 band로 나눠 같은 버킷에 들어간 기사끼리만 비교 (전체 쌍 비교 없음)
+- 서명과 band 버킷을 SQLite에 저장하므로 새로 수집한 기사만 추가로 비교 가능
+
+사용법:
+    python near_duplicates.py --input ../data/전체통합_전처리.csv \\
+        --output ../data/전체통합_전처리_중복제거.csv --index ../data/.near_dup_index.sqlite3
+"""
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import os
+import re
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+# 대표 기사로 우선 고르는 통신사
+WIRE_SERVICES = ('연합뉴스', '뉴스1', '뉴시스')
+
+_MASK64 = (1 << 64) - 1
+_WHITESPACE = re.compile(r'\s+')
+_NAVER_DATE = re.compile(r'(\d{4})\.(\d{1,2})\.(\d{1,2})\.?\s*(오전|오후)?\s*(\d{1,2}):(\d{2})')
+
+
+def _permutations(num_perm, seed):
+    """MinHash용 해시 함수 계수 (a는 홀수)"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+    return a.reshape(-1, 1), b.reshape(-1, 1)
+
+
+def shingle_hashes(text, shingle_size=5):
+    """공백을 뺀 텍스트의 글자 k-gram 해시 (중복 제거된 uint64 배열)"""
+    if not isinstance(text, str):
+        return np.empty(0, dtype=np.uint64)
+    text = _WHITESPACE.sub('', text)
+    if len(text) < shingle_size:
+        return np.empty(0, dtype=np.uint64)
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    n = len(codes) - shingle_size + 1
+    # k-gram 다항식 해시 (uint64 오버플로는 mod 2^64로 동작)
+    hashes = np.zeros(n, dtype=np.uint64)
+    for offset in range(shingle_size):
+        hashes = hashes * np.uint64(1000003) + codes[offset:offset + n]
+    # 비트 섞기 (splitmix64 마무리 단계)
+    hashes ^= hashes >> np.uint64(30)
+    hashes *= np.uint64(0xBF58476D1CE4E5B9)
+    hashes ^= hashes >> np.uint64(27)
+    hashes *= np.uint64(0x94D049BB133111EB)
+    hashes ^= hashes >> np.uint64(31)
+    return np.unique(hashes)
+
+
+def minhash_signatures(texts, num_perm=128, shingle_size=5, seed=1):
+    """
+    텍스트 목록의 MinHash 서명 계산
+
+    Returns:
+        tuple: (서명 배열 (n, num_perm) uint32, shingle이 하나도 없는 텍스트 여부 배열)
+    """
+    a, b = _permutations(num_perm, seed)
+    signatures = np.full((len(texts), num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+    empty = np.zeros(len(texts), dtype=bool)
+    for i, text in enumerate(texts):
+        hashes = shingle_hashes(text, shingle_size)
+        if len(hashes) == 0:
+            empty[i] = True
+            continue
+        # (a * x + b) mod 2^64 의 상위 32비트 (multiply-shift 해시)
+        permuted = (a * hashes + b) >> np.uint64(32)
+        signatures[i] = permuted.min(axis=1)
+    return signatures, empty
+
+
+def _signature_job(args):
+    texts, num_perm, shingle_size, seed = args
+    return minhash_signatures(texts, num_perm, shingle_size, seed)
+
+
+def parse_created_date(value):
+    """네이버 기사 입력 시각('2025.05.23. 오후 1:00')을 정렬 가능한 문자열로 변환"""
+    if not isinstance(value, str):
+        return ''
+    match = _NAVER_DATE.search(value)
+    if not match:
+        return value
+    year, month, day, meridiem, hour, minute = match.groups()
+    hour = int(hour) % 12 + (12 if meridiem == '오후' else 0) if meridiem else int(hour)
+    return f"{year}-{int(month):02d}-{int(day):02d} {hour:02d}:{minute}"
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, x):
+        self.parent.setdefault(x, x)
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
+
+    def union(self, x, y):
+        x, y = self.find(x), self.find(y)
+        if x != y:
+            # 이름이 작은 쪽을 루트로 (실행마다 같은 묶음 ID)
+            if y < x:
+                x, y = y, x
+            self.parent[y] = x
+
+
+class NearDuplicateIndex:
+    """
+    MinHash 서명과 LSH band 버킷을 저장하는 SQLite 인덱스
+
+    band 하나는 서명의 rows개 값이며, 어느 band든 값이 모두 같은 기사끼리만
+    후보가 됩니다. 후보는 서명으로 추정한 Jaccard 유사도가 threshold 이상일 때
+    같은 묶음이 됩니다. (기본값 16 x 8 band: 유사도 0.8인 쌍은 약 95%,
+    0.5인 쌍은 약 6%만 후보가 됨)
+
+    Args:
+        path (str): SQLite 파일 경로 (':memory:'면 저장하지 않음)
+        threshold (float): 같은 묶음으로 볼 최소 추정 Jaccard 유사도
+        num_perm (int): 서명 길이 (bands * rows)
+        bands (int): LSH band 수
+        shingle_size (int): shingle 글자 수
+        seed (int): 해시 함수 시드
+    """
+    def __init__(self, path=':memory:', threshold=0.8, num_perm=128, bands=16, shingle_size=5, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        directory = os.path.dirname(path)
+        if path != ':memory:' and directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS docs (
+                doc_id TEXT PRIMARY KEY,
+                cluster_id TEXT NOT NULL,
+                press TEXT,
+                created_date TEXT,
+                length INTEGER,
+                signature BLOB
+            );
+            CREATE INDEX IF NOT EXISTS docs_cluster ON docs (cluster_id);
+            CREATE TABLE IF NOT EXISTS bands (
+                band INTEGER NOT NULL,
+                bucket BLOB NOT NULL,
+                doc_id TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS bands_bucket ON bands (band, bucket);
+        ''')
+        self._check_params()
+
+    def _check_params(self):
+        """저장된 인덱스와 서명 설정이 같은지 확인 (다르면 서명을 비교할 수 없음)"""
+        params = {
+            'num_perm': str(self.num_perm),
+            'bands': str(self.bands),
+            'shingle_size': str(self.shingle_size),
+            'seed': str(self.seed)
+        }
+        stored = dict(self.conn.execute("SELECT key, value FROM meta").fetchall())
+        if stored:
+            changed = {key: (stored.get(key), value) for key, value in params.items() if stored.get(key) != value}
+            if changed:
+                raise ValueError(f"인덱스 설정이 다릅니다 (저장된 값, 요청 값): {changed}")
+        else:
+            with self.conn:
+                self.conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", params.items())
+
+    def signatures(self, texts, workers=1, chunk_size=2000):
+        """텍스트 목록의 MinHash 서명 계산 (workers > 1이면 프로세스 풀 사용)"""
+        texts = list(texts)
+        if workers <= 1 or len(texts) <= chunk_size:
+            return minhash_signatures(texts, self.num_perm, self.shingle_size, self.seed)
+        jobs = [
+            (texts[start:start + chunk_size], self.num_perm, self.shingle_size, self.seed)
+            for start in range(0, len(texts), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_signature_job, jobs))
+        return np.vstack([r[0] for r in results]), np.concatenate([r[1] for r in results])
+
+    def _band_keys(self, signature):
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def add(self, doc_ids, texts, presses=None, created_dates=None, workers=1):
+        """
+        기사를 인덱스에 추가하고 기존/새 기사와 유사 중복 묶음 갱신
+
+        Args:
+            doc_ids (list): 기사 ID (보통 URL)
+            texts (list): 비교할 텍스트 (전처리된 제목 + 본문)
+            presses (list): 언론사 이름 (대표 기사 선택용)
+            created_dates (list): 입력 시각 (대표 기사 선택용)
+            workers (int): 서명 계산 프로세스 수
+
+        Returns:
+            int: 새로 추가한 기사 수
+        """
+        texts = list(texts)
+        signatures, empty = self.signatures(texts, workers)
+        lengths = [len(text) if isinstance(text, str) else 0 for text in texts]
+        return self.add_signatures(doc_ids, signatures, empty, presses, created_dates, lengths)
+
+    def add_signatures(self, doc_ids, signatures, empty=None, presses=None, created_dates=None, lengths=None):
+        """미리 계산한 서명으로 기사 추가 (add 참고)"""
+        n = len(doc_ids)
+        doc_ids = [str(doc_id) for doc_id in doc_ids]
+        presses = list(presses) if presses is not None else [None] * n
+        created_dates = list(created_dates) if created_dates is not None else [None] * n
+        lengths = list(lengths) if lengths is not None else [0] * n
+        empty = empty if empty is not None else np.zeros(n, dtype=bool)
+
+        # 이미 인덱스에 있는 기사와 배치 안에서 반복된 ID는 건너뜀
+        existing = set()
+        for start in range(0, n, 500):
+            chunk = doc_ids[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT doc_id FROM docs WHERE doc_id IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            existing.update(row[0] for row in rows)
+        new = []
+        for i, doc_id in enumerate(doc_ids):
+            if doc_id not in existing:
+                existing.add(doc_id)
+                new.append(i)
+        if not new:
+            return 0
+
+        uf = _UnionFind()
+        band_rows = []
+        buckets = {}
+        for i in new:
+            uf.find(doc_ids[i])
+            # 너무 짧아 shingle이 없는 기사는 혼자 묶음으로 둠
+            if empty[i]:
+                continue
+            for band, key in enumerate(self._band_keys(signatures[i])):
+                band_rows.append((band, key, doc_ids[i]))
+                buckets.setdefault((band, key), []).append(i)
+
+        # 배치 안의 후보: 버킷마다 첫 기사와 비교, 다르면 바로 앞 기사와 비교 (버킷 크기에 선형)
+        pairs = set()
+        for members in buckets.values():
+            for previous, current in zip(members, members[1:]):
+                pairs.add((members[0], current))
+                if previous != members[0]:
+                    pairs.add((previous, current))
+        if pairs:
+            left, right = np.array(sorted(pairs)).T
+            similarity = (signatures[left] == signatures[right]).mean(axis=1)
+            for a, b in zip(left[similarity >= self.threshold], right[similarity >= self.threshold]):
+                uf.union(doc_ids[a], doc_ids[b])
+
+        # 기존 기사 후보: 새 band 버킷과 같은 버킷에 있는 기존 기사
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS new_bands (band INTEGER, bucket BLOB, doc_id TEXT)")
+        self.conn.execute("DELETE FROM new_bands")
+        self.conn.executemany("INSERT INTO new_bands VALUES (?, ?, ?)", band_rows)
+        candidates = self.conn.execute('''
+            SELECT DISTINCT n.doc_id, b.doc_id, d.cluster_id, d.signature
+            FROM new_bands n
+            JOIN bands b ON b.band = n.band AND b.bucket = n.bucket
+            JOIN docs d ON d.doc_id = b.doc_id
+        ''').fetchall()
+        position = {doc_ids[i]: i for i in new}
+        for new_id, _, cluster_id, signature in candidates:
+            other = np.frombuffer(signature, dtype=np.uint32)
+            if (signatures[position[new_id]] == other).mean() >= self.threshold:
+                uf.union(new_id, cluster_id)
+
+        # 기존 묶음 ID는 기존 기사의 cluster_id, 새 기사는 자기 ID에서 시작
+        existing_clusters = {cluster_id for _, _, cluster_id, _ in candidates}
+        merged = [
+            (uf.find(cluster_id), cluster_id)
+            for cluster_id in existing_clusters
+            if uf.find(cluster_id) != cluster_id
+        ]
+        with self.conn:
+            self.conn.executemany("UPDATE docs SET cluster_id = ? WHERE cluster_id = ?", merged)
+            self.conn.executemany(
+                "INSERT INTO docs (doc_id, cluster_id, press, created_date, length, signature) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (doc_ids[i], uf.find(doc_ids[i]), presses[i], created_dates[i], lengths[i],
+                     None if empty[i] else signatures[i].tobytes())
+                    for i in new
+                ]
+            )
+            self.conn.executemany("INSERT INTO bands (band, bucket, doc_id) VALUES (?, ?, ?)", band_rows)
+        return len(new)
+
+    def clusters(self, min_size=2):
+        """
+        유사 중복 묶음과 대표 기사
+
+        대표 기사는 통신사 기사, 입력 시각이 이른 기사, 본문이 긴 기사 순으로 고릅니다.
+
+        Returns:
+            DataFrame: cluster_id, doc_id, press, created_date, length, size, is_canonical
+        """
+        df = pd.read_sql_query('''
+            SELECT cluster_id, doc_id, press, created_date, length FROM docs
+            WHERE cluster_id IN (
+                SELECT cluster_id FROM docs GROUP BY cluster_id HAVING COUNT(*) >= ?
+            )
+        ''', self.conn, params=(min_size,))
+        if df.empty:
+            return df.assign(size=pd.Series(dtype='int64'), is_canonical=pd.Series(dtype=bool))
+        df['size'] = df.groupby('cluster_id')['doc_id'].transform('size')
+        df['_wire'] = ~df['press'].isin(WIRE_SERVICES)
+        df['_date'] = df['created_date'].map(parse_created_date)
+        df['_date'] = df['_date'].where(df['_date'] != '', '9999')
+        df = df.sort_values(['cluster_id', '_wire', '_date', 'length', 'doc_id'], ascending=[True, True, True, False, True])
+        df['is_canonical'] = ~df.duplicated('cluster_id')
+        return df.drop(columns=['_wire', '_date']).reset_index(drop=True)
+
+    def duplicate_ids(self):
+        """대표 기사가 아닌 유사 중복 기사 ID 집합"""
+        clusters = self.clusters()
+        return set(clusters.loc[~clusters['is_canonical'], 'doc_id'])
+
+    def close(self):
+        self.conn.close()
+
+
+def drop_near_duplicates(df, id_column='url', text_column='text', index=None, workers=1):
+    """
+    DataFrame에서 유사 중복 기사 중 대표 기사만 남기기
+
+    Args:
+        df (DataFrame): 전처리된 기사 (id_column, text_column 필요)
+        index (NearDuplicateIndex): 이전 실행의 인덱스 (None이면 메모리 인덱스)
+        workers (int): 서명 계산 프로세스 수
+
+    Returns:
+        tuple: (중복을 뺀 DataFrame, 묶음 DataFrame)
+    """
+    own_index = index is None
+    index = index or NearDuplicateIndex()
+    try:
+        index.add(
+            df[id_column].tolist(),
+            df[text_column].tolist(),
+            df['press'].tolist() if 'press' in df else None,
+            df['created_date'].tolist() if 'created_date' in df else None,
+            workers=workers
+        )
+        clusters = index.clusters()
+    finally:
+        if own_index:
+            index.close()
+    duplicates = set(clusters.loc[~clusters['is_canonical'], 'doc_id'])
+    return df[~df[id_column].astype(str).isin(duplicates)], clusters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MinHash/LSH 유사 중복 기사 제거")
+    parser.add_argument('--input', required=True, help="전처리된 기사 CSV")
+    parser.add_argument('--output', required=True, help="대표 기사만 남긴 CSV")
+    parser.add_argument('--index', default='../data/.near_dup_index.sqlite3',
+                        help="서명 인덱스 (SQLite, 다음 실행에서 새 기사만 추가 비교)")
+    parser.add_argument('--clusters', help="유사 중복 묶음 CSV 저장 경로")
+    parser.add_argument('--id-column', default='url', help="기사 ID 컬럼")
+    parser.add_argument('--text-column', default='text', help="비교할 텍스트 컬럼")
+    parser.add_argument('--threshold', type=float, default=0.8, help="유사 중복으로 볼 최소 Jaccard 유사도")
+    parser.add_argument('--workers', type=int, default=1, help="서명 계산 프로세스 수")
+    parser.add_argument('--chunk-size', type=int, default=20000, help="한 번에 읽을 기사 수")
+    args = parser.parse_args()
+
+    index = NearDuplicateIndex(args.index, threshold=args.threshold)
+    try:
+        # 1단계: 서명 계산 및 인덱스 갱신 (청크 단위)
+        total = 0
+        for chunk in pd.read_csv(args.input, chunksize=args.chunk_size):
+            chunk = chunk.dropna(subset=[args.id_column])
+            total += index.add(
+                chunk[args.id_column].tolist(),
+                chunk[args.text_column].tolist(),
+                chunk['press'].tolist() if 'press' in chunk else None,
+                chunk['created_date'].tolist() if 'created_date' in chunk else None,
+                workers=args.workers
+            )
+        print(f"새로 추가한 기사 수: {total}")
+
+        clusters = index.clusters()
+        duplicates = set(clusters.loc[~clusters['is_canonical'], 'doc_id'])
+        print(f"유사 중복 묶음: {clusters['cluster_id'].nunique()}개, 제거할 기사: {len(duplicates)}개")
+        if args.clusters:
+            clusters.to_csv(args.clusters, index=False)
+
+        # 2단계: 대표 기사가 아닌 중복 기사를 빼고 저장
+        kept = 0
+        for i, chunk in enumerate(pd.read_csv(args.input, chunksize=args.chunk_size)):
+            chunk = chunk[~chunk[args.id_column].astype(str).isin(duplicates)]
+            chunk.to_csv(args.output, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+            kept += len(chunk)
+        print(f"남은 기사 수: {kept}")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+감성 사전 기반 감성 레이블링 (news_sentiment_label.ipynb의 get_sentiment_label과 같은 점수)
+
+- 형태소 분석은 작업자 프로세스마다 분석기(Mecab)를 하나씩 만들어 병렬로 처리
+- 형태소는 어휘 ID로 한 번만 바꾸고, 기사별 (어휘 ID, 횟수)를 텍스트 해시로 캐시
+- 전체 기사를 희소 문서-어휘 행렬로 만들어 사전 가중치 벡터와 한 번에 곱해 점수 계산
+
+감성 사전만 바뀐 경우 캐시된 형태소 결과를 그대로 쓰므로 형태소 분석을 다시 하지 않습니다.
+빈 텍스트는 노트북에서 "neutral"로 표시되던 것을 다른 기사와 같은 "중립"으로 통일했습니다.
+
+사용법:
+    python sentiment_labeler.py --input ../data/정당_관점_라벨링_최종_업데이트.csv \\
+        --dict SentiWord_Dict.txt --cache ../data/.sentiment_cache.sqlite3 --workers 8
+"""
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+import argparse
+import hashlib
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+POSITIVE, NEUTRAL, NEGATIVE = '긍정', '중립', '부정'
+
+# 작업자 프로세스마다 하나씩 만드는 형태소 분석기
+_tokenizer = None
+
+
+def load_senti_dict(path):
+    """감성 사전 읽기 (구문은 첫 단어만 사용, 같은 단어는 처음 나온 점수 사용)"""
+    senti_dict = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip() == "":
+                continue
+            phrase, score = line.strip().split('\t')
+            if phrase:
+                key = phrase.strip().split()[0]
+                if key not in senti_dict:
+                    senti_dict[key] = int(score)
+    return senti_dict
+
+
+def mecab_tokenizer():
+    """Mecab 형태소 분석기 (morphs 메서드를 가진 객체)"""
+    from konlpy.tag import Mecab
+    return Mecab()
+
+
+def _init_worker(tokenizer_factory):
+    global _tokenizer
+    _tokenizer = tokenizer_factory()
+
+
+def _tokenize_chunk(texts):
+    """작업자 프로세스에서 형태소 분석 후 형태소별 횟수 반환"""
+    return [Counter(_tokenizer.morphs(text)) for text in texts]
+
+
+def text_hash(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def score_to_label(score):
+    if score > 0:
+        return POSITIVE
+    if score < 0:
+        return NEGATIVE
+    return NEUTRAL
+
+
+class SentimentLabeler:
+    """
+    감성 사전 점수 합으로 기사 감성을 레이블링
+
+    Args:
+        senti_dict (dict): 형태소 -> 감성 점수
+        cache_path (str): 형태소 분석 캐시 (SQLite, None이면 메모리)
+        workers (int): 형태소 분석 프로세스 수 (기본값: CPU 수)
+        chunk_size (int): 작업 하나당 기사 수
+        tokenizer_factory (callable): 작업자마다 분석기를 만드는 함수 (기본값: Mecab)
+    """
+    def __init__(self, senti_dict, cache_path=None, workers=None, chunk_size=200, tokenizer_factory=mecab_tokenizer):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.tokenizer_factory = tokenizer_factory
+
+        path = cache_path or ':memory:'
+        directory = os.path.dirname(path)
+        if cache_path and directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS vocab (
+                id INTEGER PRIMARY KEY,
+                term TEXT NOT NULL UNIQUE
+            );
+            CREATE TABLE IF NOT EXISTS tokens (
+                hash BLOB PRIMARY KEY,
+                term_ids BLOB NOT NULL,
+                counts BLOB NOT NULL
+            );
+        ''')
+        self.vocab = dict(self.conn.execute("SELECT term, id FROM vocab").fetchall())
+        self.set_lexicon(senti_dict)
+
+    def set_lexicon(self, senti_dict):
+        """감성 사전 교체 (형태소 캐시는 그대로 사용)"""
+        self.senti_dict = senti_dict
+        self._weights = None
+
+    def _lexicon_weights(self):
+        """어휘 ID 순서의 감성 점수 벡터"""
+        if self._weights is None or len(self._weights) != len(self.vocab):
+            weights = np.zeros(len(self.vocab), dtype=np.int64)
+            for term, term_id in self.vocab.items():
+                weights[term_id] = self.senti_dict.get(term, 0)
+            self._weights = weights
+        return self._weights
+
+    def _term_id(self, term, new_terms):
+        term_id = self.vocab.get(term)
+        if term_id is None:
+            term_id = len(self.vocab)
+            self.vocab[term] = term_id
+            new_terms.append((term_id, term))
+        return term_id
+
+    def _load_cached(self, hashes):
+        cached = {}
+        hashes = list(hashes)
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT hash, term_ids, counts FROM tokens WHERE hash IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            for key, term_ids, counts in rows:
+                cached[key] = (np.frombuffer(term_ids, dtype=np.int32), np.frombuffer(counts, dtype=np.int32))
+        return cached
+
+    def _tokenize_missing(self, texts_by_hash):
+        """캐시에 없는 텍스트를 형태소 분석해 (어휘 ID, 횟수)로 저장"""
+        keys = list(texts_by_hash)
+        chunks = [
+            [texts_by_hash[key] for key in keys[start:start + self.chunk_size]]
+            for start in range(0, len(keys), self.chunk_size)
+        ]
+        results = {}
+        if not chunks:
+            return results
+
+        if self.workers <= 1:
+            _init_worker(self.tokenizer_factory)
+            counters = map(_tokenize_chunk, chunks)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.tokenizer_factory,)
+            )
+            counters = executor.map(_tokenize_chunk, chunks)
+        try:
+            position = 0
+            for chunk_counters in counters:
+                new_terms = []
+                rows = []
+                for counter in chunk_counters:
+                    key = keys[position]
+                    position += 1
+                    term_ids = np.array([self._term_id(term, new_terms) for term in counter], dtype=np.int32)
+                    counts = np.array(list(counter.values()), dtype=np.int32)
+                    results[key] = (term_ids, counts)
+                    rows.append((key, term_ids.tobytes(), counts.tobytes()))
+                # 작업 하나가 끝날 때마다 캐시에 반영 (중단돼도 다음 실행에서 이어서 사용)
+                with self.conn:
+                    self.conn.executemany("INSERT INTO vocab (id, term) VALUES (?, ?)", new_terms)
+                    self.conn.executemany("INSERT OR REPLACE INTO tokens (hash, term_ids, counts) VALUES (?, ?, ?)", rows)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return results
+
+    def document_term_matrix(self, texts):
+        """
+        기사별 형태소 횟수 희소 행렬 (기사 수 x 어휘 수)
+
+        빈 텍스트와 결측값은 빈 행이 됩니다.
+        """
+        texts = list(texts)
+        hashes = [
+            text_hash(text) if isinstance(text, str) and text.strip() else None
+            for text in texts
+        ]
+        unique = {key: text for key, text in zip(hashes, texts) if key is not None}
+        entries = self._load_cached(unique)
+        missing = {key: text for key, text in unique.items() if key not in entries}
+        if missing:
+            print(f"형태소 분석: {len(missing)}개 (캐시 사용 {len(entries)}개)")
+        entries.update(self._tokenize_missing(missing))
+
+        empty = (np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32))
+        rows = [entries[key] if key is not None else empty for key in hashes]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(term_ids) for term_ids, _ in rows])
+        indices = np.concatenate([term_ids for term_ids, _ in rows]) if rows else empty[0]
+        data = np.concatenate([counts for _, counts in rows]) if rows else empty[1]
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), len(self.vocab)))
+
+    def score(self, texts=None, matrix=None):
+        """기사별 감성 점수 (형태소 점수의 합)"""
+        if matrix is None:
+            matrix = self.document_term_matrix(texts)
+        weights = self._lexicon_weights()
+        return matrix @ weights[:matrix.shape[1]]
+
+    def label(self, texts=None, matrix=None):
+        """기사별 감성 레이블 (긍정/중립/부정)"""
+        return [score_to_label(score) for score in self.score(texts, matrix)]
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감성 사전 기반 감성 레이블링")
+    parser.add_argument('--input', default='../data/정당_관점_라벨링_최종_업데이트.csv', help="기사 CSV")
+    parser.add_argument('--output', help="저장할 CSV (기본값: 입력 파일에 덮어쓰기)")
+    parser.add_argument('--dict', default='SentiWord_Dict.txt', help="감성 사전 파일")
+    parser.add_argument('--cache', default='../data/.sentiment_cache.sqlite3', help="형태소 분석 캐시 (SQLite)")
+    parser.add_argument('--text-column', default='text', help="레이블링할 텍스트 컬럼")
+    parser.add_argument('--workers', type=int, default=None, help="형태소 분석 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument('--score-column', help="감성 점수도 저장할 컬럼 이름 (생략하면 저장하지 않음)")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.input)
+    labeler = SentimentLabeler(load_senti_dict(args.dict), cache_path=args.cache, workers=args.workers)
+    try:
+        scores = labeler.score(df[args.text_column])
+    finally:
+        labeler.close()
+    df['sentiment'] = [score_to_label(score) for score in scores]
+    if args.score_column:
+        df[args.score_column] = scores
+    df.to_csv(args.output or args.input, index=False)
+    print(df['sentiment'].value_counts().to_string())
+    print("✅ 감성 레이블링 완료 및 저장 완료")
+
+
+if __name__ == "__main__":
+    main()
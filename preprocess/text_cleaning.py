@@ -0,0 +1,321 @@
+"""
+뉴스 텍스트 전처리 모듈 (news_preprocessing.ipynb의 clean_text1, clean_text와 같은 결과)
+
+정규식은 모듈을 불러올 때 한 번만 컴파일하고, 각 치환 단계는 그 패턴이 걸릴 수
+있는 문자열(예: '기자', '<', '://')이 본문에 있을 때만 실행합니다. 치환 순서는
+노트북과 같으며, 결과가 완전히 같다고 보장되는 단계만 하나로 합쳤습니다.
+(앞 단계에서 지운 자리에서 다음 패턴이 새로 생길 수 있어서, 순서가 있는 치환을
+무조건 하나의 alternation으로 합치면 결과가 달라질 수 있습니다.)
+
+말뭉치는 언론사 파일 단위로 읽어 청크로 나눈 뒤 프로세스 풀에서 정제하고,
+결과를 CSV에 이어 쓰므로 전체 데이터를 메모리에 올리지 않습니다.
+
+사용법:
+    python text_cleaning.py --data ../data --output ../data/전체통합_전처리.csv --workers 8
+"""
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from pathlib import Path
+import argparse
+import hashlib
+import os
+import re
+
+import pandas as pd
+
+
+class _AnchoredPattern:
+    """
+    반드시 anchor 문자열을 포함하고, 매치 시작이 anchor보다 최대 max_prefix 글자 앞인 패턴
+
+    re.sub은 모든 위치에서 매치를 시도하므로, anchor 위치 근처에서만 search 하도록
+    바꿉니다. 매치 결과와 순서는 re.sub과 같습니다.
+    """
+    def __init__(self, pattern, anchor, max_prefix):
+        self.pattern = re.compile(pattern)
+        self.anchor = anchor
+        self.max_prefix = max_prefix
+
+    def sub(self, replacement, text):
+        parts = []
+        last = 0
+        index = text.find(self.anchor)
+        while index != -1:
+            match = self.pattern.search(text, max(last, index - self.max_prefix))
+            if match is None:
+                break
+            parts.append(text[last:match.start()])
+            parts.append(replacement)
+            last = match.end()
+            index = text.find(self.anchor, last)
+        if not parts:
+            return text
+        parts.append(text[last:])
+        return ''.join(parts)
+
+
+class _Literal:
+    """고정 문자열 패턴 (re.sub 대신 str.replace, 결과는 같음)"""
+    def __init__(self, literal):
+        self.pattern = literal
+
+    def sub(self, replacement, text):
+        return text.replace(self.pattern, replacement)
+
+
+class _Whitespace:
+    """
+    연속된 공백 문자를 공백 한 칸으로 바꾸는 정규식 치환과 같은 결과
+    (str.split과 정규식은 같은 공백 문자 기준을 사용)
+
+    공백 한 칸도 매번 치환하는 정규식보다 split/join이 훨씬 빠릅니다.
+    """
+    def sub(self, replacement, text):
+        words = text.split()
+        if not words:
+            return replacement if text else text
+        joined = replacement.join(words)
+        if text[0].isspace():
+            joined = replacement + joined
+        if text[-1].isspace():
+            joined = joined + replacement
+        return joined
+
+
+# (가드 문자열, 패턴, 바꿀 문자열)
+# 가드 문자열 중 하나라도 있어야 패턴이 걸릴 수 있으므로, 없으면 치환을 건너뜀
+# (가드가 None이면 항상 실행)
+_TITLE_STEPS = [
+    # URL 제거
+    (('://',), re.compile(r'https?://\S+'), ''),
+    # HTML 태그 제거
+    (('<',), re.compile(r'<[^>]+>'), ''),
+    # 줄바꿈 -> 공백, 특수문자 -> 공백, 연속 공백 -> 공백 한 칸을 한 번에 처리
+    # (\W는 공백 문자와 [^\w\s가-힣]의 합집합이므로 \W+ -> ' ' 와 같고,
+    #  이미 공백 한 칸인 곳은 건너뛰도록 두 글자 이상이거나 공백이 아닌 경우만 치환)
+    (None, re.compile(r'\W{2,}|[^\w ]'), ' '),
+]
+
+_CONTENT_STEPS = [
+    # (1) 기자/출처 제거
+    (('기자)',), re.compile(r'\([^\)]+기자\)'), ''),
+    # 매치는 '기자' 앞 최대 5글자(한글 4자 + 공백)에서 시작
+    (('기자',), _AnchoredPattern(r'[가-힣]{2,4}\s?기자(입니다)?', '기자', 5), ''),
+    (('기자',), re.compile(r'기자\s*=\s*'), ''),
+    (('사진',), re.compile(r'사진[=:\-]\s*[^,\n]+'), ''),
+    (('연합뉴스', '뉴스1', '뉴시스', 'SBS', 'KBS', 'MBC', 'JTBC', 'YTN'),
+     re.compile(r'(연합뉴스|뉴스1|뉴시스|SBS|KBS|MBC|JTBC|YTN)'), ''),
+
+    # (2) HTML 태그 및 URL 제거
+    (('<',), re.compile(r'<[^>]+>'), ''),
+    (('://',), re.compile(r'https?://\S+'), ''),
+
+    # (3) 괄호/대괄호 제거
+    (('(서울=',), re.compile(r'\(서울=.*?\)'), ''),
+    (('[',), re.compile(r'\[[^\]]*\]'), ''),
+
+    # (4) 공통 및 언론사 클리셰 제거
+    (('무단 전재 및 재배포 금지',), _Literal('무단 전재 및 재배포 금지'), ''),
+    (('해당 기사',), re.compile(r'해당 기사.*?무단 전재.*?금지합니다'), ''),
+    (('자세한 내용은',), re.compile(r'자세한 내용은.*?확인하십시오'), ''),
+    (('본 기사',), re.compile(r'본 기사.*?무단 전재.*?금지'), ''),
+    (('ⓒ 오마이뉴스',), re.compile(r'ⓒ 오마이뉴스.*'), ''),
+    (('오마이뉴스',), re.compile(r'오마이뉴스\s*ⓒ.*'), ''),
+    (('조선닷컴',), re.compile(r'조선닷컴.*'), ''),
+    (('경향신문',), re.compile(r'경향신문.*?재배포 금지'), ''),
+    (('중앙일보',), re.compile(r'중앙일보.*?무단 전재.*'), ''),
+    (('한국일보',), re.compile(r'한국일보.*?저작권.*'), ''),
+    (('SBS',), re.compile(r'SBS.*?All rights reserved'), ''),
+    (('All rights reserved',), re.compile(r'All rights reserved.*'), ''),
+    (('사진',), re.compile(r'사진[=:\-]\s*[^,\n]+'), ''),
+    (('(사진=',), re.compile(r'\(사진=\s*SBS.*?\)'), ''),
+    (('경향신문',), re.compile(r'경향신문\s*무단 전재.*'), ''),
+    (('동아일보',), re.compile(r'동아일보\s*무단 전재.*'), ''),
+    (('중앙일보',), re.compile(r'중앙일보\s*재배포.*'), ''),
+    (('한국일보',), re.compile(r'한국일보\s*무단.*'), ''),
+    (('뉴스1',), _Literal('뉴스1'), ''),
+    (('연합뉴스',), _Literal('연합뉴스'), ''),
+    (('뉴시스',), _Literal('뉴시스'), ''),
+    (('입력',), re.compile(r'기자\s*입력\s*\d{4}'), ''),
+    (('승인',), re.compile(r'기자\s*승인\s*\d{4}'), ''),
+    (('중앙일보',), re.compile(r'중앙일보\s*제공'), ''),
+
+    # (5) 특수문자 정리 (의미 있는 기호는 유지)
+    # \n+ -> ' ' 다음 \s+ -> ' ' 는 \s+ -> ' ' 한 번과 같음
+    (None, _Whitespace(), ' '),
+    # 지우는 치환이므로 한 글자씩 지우는 것과 연속된 글자를 한 번에 지우는 것은 같음
+    (None, re.compile(r'[^\w\s가-힣%℃·\-]+'), ''),
+]
+
+
+def _apply_steps(text, steps):
+    for guards, pattern, replacement in steps:
+        if guards is None or any(map(text.__contains__, guards)):
+            text = pattern.sub(replacement, text)
+    return text
+
+
+def clean_text1(text):
+    """제목 정제: URL/HTML 태그 제거, 특수문자와 줄바꿈을 공백으로 정리"""
+    if not isinstance(text, str):
+        return ""
+    return _apply_steps(text, _TITLE_STEPS).strip()
+
+
+def clean_text(text):
+    """본문 정제: 기자/출처, HTML/URL, 괄호, 언론사 클리셰 제거 후 특수문자 정리"""
+    if not isinstance(text, str):
+        return ""
+    return _apply_steps(text, _CONTENT_STEPS).strip()
+
+
+def clean_records(titles, contents):
+    """
+    제목/본문 목록 정제 (프로세스 풀 작업 단위)
+
+    Returns:
+        tuple: (title_cleaned, title_cleaned1, content_cleaned) 목록
+    """
+    return (
+        [clean_text1(title) for title in titles],
+        [clean_text(title) for title in titles],
+        [clean_text(content) for content in contents]
+    )
+
+
+def _add_cleaned_columns(df, cleaned):
+    title_cleaned, title_cleaned1, content_cleaned = cleaned
+    df = df.copy()
+    df['title_cleaned'] = title_cleaned
+    df['title_cleaned1'] = title_cleaned1
+    df['content_cleaned'] = content_cleaned
+    # 제목과 본문 결합
+    df['text'] = df['title_cleaned'] + ' ' + df['content_cleaned']
+    return df
+
+
+def clean_frame(df):
+    """노트북과 같은 방식으로 title_cleaned, title_cleaned1, content_cleaned, text 컬럼 추가 (단일 프로세스)"""
+    return _add_cleaned_columns(df, clean_records(df['title'].tolist(), df['content'].tolist()))
+
+
+def iter_source_frames(data_path, usecols=None):
+    """
+    크롤러 결과를 언론사 파일 단위로 하나씩 읽기
+
+    - 샤드 구조 (data_path/news/press=<언론사>/date=<YYYY-MM-DD>/part-*.jsonl|parquet)
+    - 기존 CSV (data_path/<언론사>_*.csv, 언론사 이름은 파일명에서 추출)
+
+    Yields:
+        tuple: (언론사, DataFrame)
+    """
+    data_path = Path(data_path)
+    shard_root = data_path / 'news' if (data_path / 'news').is_dir() else data_path
+    shard_files = sorted(shard_root.glob('press=*/date=*/part-*'))
+    for path in shard_files:
+        press_name = path.parent.parent.name[len('press='):]
+        if path.suffix == '.parquet':
+            df = pd.read_parquet(path, columns=usecols)
+        elif path.suffix == '.jsonl':
+            df = pd.read_json(path, lines=True, dtype=False)
+            if usecols:
+                df = df[[column for column in usecols if column in df.columns]]
+        else:
+            continue
+        df['press'] = press_name
+        yield press_name, df
+
+    for path in sorted(data_path.glob('*.csv')):
+        press_name = path.stem.split('_')[0]
+        df = pd.read_csv(path, usecols=usecols)
+        df['press'] = press_name
+        yield press_name, df
+
+
+def _iter_chunks(frames, chunk_size):
+    for _, df in frames:
+        # 결측치 제거
+        df = df.dropna(subset=['title', 'content'])
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+
+
+def _clean_chunk(chunk):
+    return clean_records(chunk['title'].tolist(), chunk['content'].tolist())
+
+
+def preprocess_corpus(data_path, output_path, workers=None, chunk_size=2000, min_length=100):
+    """
+    크롤러 결과 전체를 정제해 CSV로 저장 (노트북 2장 '텍스트 전처리'와 같은 결과)
+
+    언론사 파일을 하나씩 읽어 chunk_size 단위로 프로세스 풀에 나눠 보내고,
+    입력 순서대로 결과를 받아 짧은 기사(text 길이 min_length 미만)와
+    (title_cleaned, content_cleaned) 중복을 제거한 뒤 CSV에 이어 씁니다.
+
+    Args:
+        data_path (str): 크롤러 출력 디렉토리
+        output_path (str): 저장할 CSV 경로
+        workers (int): 프로세스 수 (기본값: CPU 수)
+        chunk_size (int): 작업 하나당 기사 수
+        min_length (int): 남길 기사의 최소 text 길이
+
+    Returns:
+        int: 저장한 기사 수
+    """
+    workers = workers or os.cpu_count() or 1
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    if os.path.exists(output_path):
+        os.remove(output_path)
+
+    seen = set()
+    written = 0
+    pending = deque()
+
+    def consume(entry):
+        nonlocal written
+        chunk, future = entry
+        df = _add_cleaned_columns(chunk, future.result())
+        # 너무 짧은 기사 제거
+        df = df[df['text'].str.len() >= min_length]
+        # 중복 기사 제거 (제목과 본문이 동일한 경우, 앞에 나온 기사 유지)
+        keys = [
+            hashlib.blake2b(f"{title}\x00{content}".encode('utf-8'), digest_size=16).digest()
+            for title, content in zip(df['title_cleaned'], df['content_cleaned'])
+        ]
+        keep = []
+        for key in keys:
+            keep.append(key not in seen)
+            seen.add(key)
+        df = df[keep]
+        if len(df):
+            df.to_csv(output_path, mode='a', header=written == 0, index=False)
+            written += len(df)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in _iter_chunks(iter_source_frames(data_path), chunk_size):
+            pending.append((chunk, executor.submit(_clean_chunk, chunk[['title', 'content']])))
+            # 작업자가 쉬지 않을 만큼만 미리 보내고, 순서대로 기록
+            while len(pending) >= workers * 2:
+                consume(pending.popleft())
+        while pending:
+            consume(pending.popleft())
+
+    print(f"중복 제거 후 남은 기사 수: {written}")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 텍스트 전처리")
+    parser.add_argument('--data', default='../data', help="크롤러 출력 디렉토리 (샤드 또는 언론사별 CSV)")
+    parser.add_argument('--output', default='../data/전체통합_전처리.csv', help="저장할 CSV 경로")
+    parser.add_argument('--workers', type=int, default=None, help="프로세스 수 (기본값: CPU 수)")
+    parser.add_argument('--chunk-size', type=int, default=2000, help="작업 하나당 기사 수")
+    parser.add_argument('--min-length', type=int, default=100, help="남길 기사의 최소 text 길이")
+    args = parser.parse_args()
+    preprocess_corpus(args.data, args.output, args.workers, args.chunk_size, args.min_length)
+
+
+if __name__ == "__main__":
+    main()
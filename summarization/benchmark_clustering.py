@@ -0,0 +1,87 @@
+"""
+군집화 벤치마크 (노트북 방식 vs clustering.cluster_articles)
+
+SBERT 크기(768차원)의 합성 임베딩(중심 6개 주변에 퍼진 점)으로 기사 수별 시간을 비교합니다.
+노트북 방식은 k=2..10마다 KMeans + 전체 silhouette 후 최적 k를 다시 학습합니다.
+(전체 silhouette은 O(n²)이므로 --legacy-max보다 큰 크기에서는 생략)
+
+사용법:
+    python benchmark_clustering.py --sizes 500 5000 50000 --legacy-max 5000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.metrics import adjusted_rand_score, pairwise_distances_argmin_min, silhouette_score
+
+from clustering import cluster_articles, representatives_by_press
+
+
+def make_embeddings(n, dim=768, centers=6, spread=6.0, seed=42):
+    """합성 임베딩과 실제 군집 번호"""
+    rng = np.random.default_rng(seed)
+    means = rng.standard_normal((centers, dim)).astype(np.float32)
+    truth = rng.integers(0, centers, n)
+    embeddings = means[truth] + rng.standard_normal((n, dim)).astype(np.float32) * spread / np.sqrt(dim)
+    return embeddings, truth
+
+
+def legacy_clustering(embeddings):
+    """노트북과 같은 방식"""
+    sil_scores = []
+    K_range = range(2, min(11, len(embeddings)))
+    for k in K_range:
+        kmeans = KMeans(n_clusters=k, random_state=42)
+        labels = kmeans.fit_predict(embeddings)
+        score = silhouette_score(embeddings, labels)
+        sil_scores.append(score)
+    best_k = K_range[sil_scores.index(max(sil_scores))]
+
+    kmeans = KMeans(n_clusters=best_k, random_state=42)
+    cluster_labels = kmeans.fit_predict(embeddings)
+    selected_indices, _ = pairwise_distances_argmin_min(kmeans.cluster_centers_, embeddings)
+    return best_k, cluster_labels, selected_indices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="군집화 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 5000, 50000], help="기사 수")
+    parser.add_argument('--legacy-max', type=int, default=5000, help="노트북 방식을 실행할 최대 기사 수")
+    parser.add_argument('--centers', type=int, default=6, help="합성 데이터의 실제 군집 수")
+    args = parser.parse_args()
+
+    presses = np.array(['조선일보', '동아일보', '중앙일보', '한국일보', 'SBS', '경향신문', '오마이뉴스', '한겨레'])
+    rows = []
+    for n in args.sizes:
+        embeddings, truth = make_embeddings(n, centers=args.centers)
+        row = {'articles': n}
+
+        if n <= args.legacy_max:
+            started = time.perf_counter()
+            legacy_k, legacy_labels, legacy_reps = legacy_clustering(embeddings)
+            row['legacy_seconds'] = time.perf_counter() - started
+            row['legacy_k'] = legacy_k
+        else:
+            legacy_labels = None
+
+        result = cluster_articles(embeddings)
+        by_press = representatives_by_press(embeddings, result, presses[np.arange(n) % len(presses)])
+        row['fast_seconds'] = result.seconds
+        row['fast_k'] = result.best_k
+        row['ari_vs_truth'] = adjusted_rand_score(truth, result.labels)
+        if legacy_labels is not None:
+            row['ari_vs_legacy'] = adjusted_rand_score(legacy_labels, result.labels)
+            row['same_representatives'] = bool(np.array_equal(legacy_reps, result.representatives))
+            row['speedup'] = row['legacy_seconds'] / row['fast_seconds']
+        row['press_representatives'] = len(by_press)
+        rows.append(row)
+        print(row)
+
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(pd.DataFrame(rows).set_index('articles').round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+기사 임베딩 군집화와 대표 기사 선택 (sbert_based_generative.ipynb의 KMeans + silhouette 대체)
+
+- 기사 수가 exact_threshold 이하이면 노트북과 같은 KMeans(random_state=42)와 전체 silhouette을 사용
+  (같은 k, 같은 군집), 더 많으면 MiniBatchKMeans와 표본 silhouette(sample_size개) 사용
+- k마다 학습한 모델을 보관해 최적 k 모델을 다시 학습하지 않고 그대로 사용
+- 대표 기사: 군집 중심에 가장 가까운 기사 (전체), 군집 x 언론사별로 중심에 가장 가까운 기사
+
+사용 예:
+    result = cluster_articles(sbert_embeddings)
+    selected_indices = result.representatives
+    by_press = representatives_by_press(sbert_embeddings, result, filtered_data['press'])
+"""
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import pairwise_distances_argmin_min, silhouette_score
+
+
+class ClusterResult:
+    """
+    군집화 결과
+
+    Attributes:
+        best_k (int): silhouette 점수가 가장 높은 k
+        model: best_k로 학습한 KMeans/MiniBatchKMeans
+        labels (ndarray): 기사별 군집 번호
+        centers (ndarray): 군집 중심
+        scores (dict): k -> silhouette 점수
+        representatives (ndarray): 군집별 중심에 가장 가까운 기사 번호 (군집 순서)
+        seconds (float): 걸린 시간
+    """
+    def __init__(self, best_k, model, labels, scores, representatives, seconds):
+        self.best_k = best_k
+        self.model = model
+        self.labels = labels
+        self.centers = model.cluster_centers_
+        self.scores = scores
+        self.representatives = representatives
+        self.seconds = seconds
+
+
+def _fit(embeddings, k, minibatch, random_state, batch_size):
+    if minibatch:
+        model = MiniBatchKMeans(n_clusters=k, random_state=random_state, batch_size=batch_size, n_init=3)
+    else:
+        model = KMeans(n_clusters=k, random_state=random_state)
+    labels = model.fit_predict(embeddings)
+    return model, labels
+
+
+def cluster_articles(embeddings, k_range=None, exact_threshold=2000, sample_size=2000,
+                     random_state=42, batch_size=1024):
+    """
+    silhouette 점수로 k를 고르고 최적 모델과 대표 기사 반환
+
+    Args:
+        embeddings (ndarray): (기사 수, 차원)
+        k_range: 후보 k (기본값: 노트북과 같은 range(2, min(11, 기사 수)))
+        exact_threshold (int): 이 수 이하이면 노트북과 같은 KMeans + 전체 silhouette
+        sample_size (int): 큰 결과에서 silhouette을 계산할 표본 수
+        batch_size (int): MiniBatchKMeans 배치 크기
+
+    Returns:
+        ClusterResult
+    """
+    started = time.perf_counter()
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    n = len(embeddings)
+    if k_range is None:
+        k_range = range(2, min(11, n))
+    if len(k_range) == 0:
+        raise ValueError(f"군집화할 기사가 너무 적습니다: {n}개")
+
+    minibatch = n > exact_threshold
+    best = None
+    scores = {}
+    for k in k_range:
+        model, labels = _fit(embeddings, k, minibatch, random_state, batch_size)
+        if len(np.unique(labels)) < 2:
+            continue
+        score = silhouette_score(
+            embeddings, labels,
+            sample_size=sample_size if minibatch and n > sample_size else None,
+            random_state=random_state
+        )
+        scores[k] = float(score)
+        # 노트북과 같이 점수가 같으면 작은 k 사용
+        if best is None or score > scores[best[0]]:
+            best = (k, model, labels)
+    if best is None:
+        raise ValueError("모든 후보 k에서 군집이 하나로 모였습니다")
+
+    best_k, model, labels = best
+    representatives, _ = pairwise_distances_argmin_min(model.cluster_centers_, embeddings)
+    return ClusterResult(best_k, model, labels, scores, representatives, time.perf_counter() - started)
+
+
+def representatives_by_press(embeddings, result, presses):
+    """
+    군집 x 언론사별로 군집 중심에 가장 가까운 기사
+
+    Returns:
+        DataFrame: cluster, press, index(기사 번호), distance 컬럼 (군집, 거리순)
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    distances = np.linalg.norm(embeddings - result.centers[result.labels], axis=1)
+    frame = pd.DataFrame({
+        'cluster': result.labels,
+        'press': list(presses),
+        'index': np.arange(len(embeddings)),
+        'distance': distances,
+    })
+    nearest = frame.loc[frame.groupby(['cluster', 'press'], sort=False)['distance'].idxmin()]
+    return nearest.sort_values(['cluster', 'distance']).reset_index(drop=True)
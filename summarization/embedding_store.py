@@ -0,0 +1,247 @@
+"""
+SBERT 임베딩 저장소 (sbert_based_generative.ipynb의 model.encode 결과 재사용)
+
+- 기사 텍스트 해시(blake2b) -> 행 번호 인덱스 (SQLite)
+- 임베딩은 float16 행렬 파일(vectors.f16)에 행 단위로 이어 붙이고 메모리 맵으로 필요한 행만 읽음
+- encode()는 저장소에 없는 텍스트만 SBERT로 임베딩하고 저장한 뒤 입력 순서의 행렬을 반환
+
+새로 크롤링한 기사는 add_articles()나 CLI로 미리 넣어 두면 키워드 검색 때 임베딩 없이 바로 읽습니다.
+여러 프로세스가 같은 저장소를 열어도 됩니다 (CLI로 추가하면서 노트북에서 읽기). 행 번호 배정과
+벡터 파일 이어 쓰기는 SQLite 쓰기 잠금(BEGIN IMMEDIATE) 안에서 하고, 읽는 쪽은 다른 프로세스가
+추가한 행이 보이면 행 수를 다시 읽습니다.
+
+사용 예:
+    store = EmbeddingStore('../data/sbert_store')
+    model = SentenceTransformer('snunlp/KR-SBERT-V40K-klueNLI-augSTS')
+    sbert_embeddings = store.encode(filtered_data['text'].tolist(), model)
+
+사용법 (크롤링한 기사 추가):
+    python embedding_store.py --input ../data/전체통합_전처리.csv --store ../data/sbert_store
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+MODEL_NAME = 'snunlp/KR-SBERT-V40K-klueNLI-augSTS'
+
+
+def text_hash(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def load_encoder(model_name=MODEL_NAME, device=None):
+    """SBERT 모델 (encode 메서드를 가진 객체)"""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name, device=device)
+
+
+class EmbeddingStore:
+    """
+    텍스트 해시로 찾는 float16 임베딩 저장소
+
+    Args:
+        path (str): 저장 폴더 (index.sqlite3, vectors.f16)
+        model_name (str): 임베딩 모델 이름 (다른 모델로 만든 저장소를 열면 오류)
+    """
+    def __init__(self, path, model_name=MODEL_NAME):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.model_name = model_name
+        self.vectors_path = os.path.join(path, 'vectors.f16')
+
+        self.conn = sqlite3.connect(os.path.join(path, 'index.sqlite3'), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS rows (
+                hash BLOB PRIMARY KEY,
+                row INTEGER NOT NULL UNIQUE,
+                article_id TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_rows_article_id ON rows (article_id);
+        ''')
+        self.dim = None
+        self.count = 0
+        self._memmap = None
+        self._refresh()
+
+    def _refresh(self):
+        """다른 프로세스가 추가한 행까지 포함해 차원과 행 수를 다시 읽기"""
+        meta = dict(self.conn.execute("SELECT key, value FROM meta").fetchall())
+        if 'model_name' in meta and meta['model_name'] != self.model_name:
+            raise ValueError(f"저장소 모델({meta['model_name']})과 요청한 모델({self.model_name})이 다릅니다")
+        self.dim = int(meta['dim']) if 'dim' in meta else None
+        # 행 번호는 0부터 빈틈없이 배정되므로 (row의 UNIQUE 인덱스로) MAX(row) + 1이 행 수
+        self.count = self.conn.execute("SELECT COALESCE(MAX(row), -1) + 1 FROM rows").fetchone()[0]
+
+    def _repair(self):
+        """
+        인덱스에 기록되지 않은 행(저장 중 중단)을 벡터 파일에서 잘라냄
+
+        쓰기 잠금을 잡은 상태에서만 호출합니다 (다른 프로세스가 이어 쓰는 중인 행을 자르지 않도록).
+        """
+        if self.dim is None or not os.path.exists(self.vectors_path):
+            return
+        expected = self.count * self.dim * 2
+        if os.path.getsize(self.vectors_path) > expected:
+            with open(self.vectors_path, 'r+b') as f:
+                f.truncate(expected)
+
+    def __len__(self):
+        self._refresh()
+        return self.count
+
+    def _matrix(self):
+        """저장된 전체 행렬 메모리 맵 (행이 늘어나면 다시 매핑)"""
+        if self._memmap is None or self._memmap.shape[0] != self.count:
+            self._memmap = np.memmap(self.vectors_path, dtype=np.float16, mode='r', shape=(self.count, self.dim))
+        return self._memmap
+
+    def lookup(self, hashes):
+        """해시별 행 번호 (없으면 -1)"""
+        hashes = list(hashes)
+        found = {}
+        unique = list(set(hashes))
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            found.update(self.conn.execute(
+                f"SELECT hash, row FROM rows WHERE hash IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall())
+        return np.array([found.get(key, -1) for key in hashes], dtype=np.int64)
+
+    def vectors(self, rows):
+        """행 번호의 임베딩 (float32, 필요한 행만 읽음)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) == 0:
+            return np.zeros((0, self.dim or 0), dtype=np.float32)
+        if rows.max() >= self.count:
+            self._refresh()
+        return np.asarray(self._matrix()[rows], dtype=np.float32)
+
+    def add(self, hashes, vectors, article_ids=None):
+        """새 임베딩 추가 (이미 있는 해시는 건너뜀)"""
+        vectors = np.asarray(vectors)
+        if vectors.ndim != 2 or len(vectors) != len(hashes):
+            raise ValueError("vectors는 (해시 수, 차원) 행렬이어야 합니다")
+        if len(vectors) == 0:
+            return 0
+        article_ids = [None] * len(hashes) if article_ids is None else list(article_ids)
+
+        # 쓰기 잠금 안에서 행 수를 DB에서 다시 읽어 행 번호를 배정하고 벡터를 이어 씀
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._refresh()
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self.conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                      [('model_name', self.model_name), ('dim', str(self.dim))])
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"임베딩 차원이 다릅니다: {vectors.shape[1]} != {self.dim}")
+
+            existing = self.lookup(hashes)
+            keep, seen = [], set()
+            for i, key in enumerate(hashes):
+                if existing[i] < 0 and key not in seen:
+                    seen.add(key)
+                    keep.append(i)
+            if not keep:
+                self.conn.rollback()
+                return 0
+
+            # 이전에 중단된 쓰기가 남긴 행을 잘라낸 뒤, 벡터를 먼저 이어 쓰고 인덱스를 기록
+            # (기록 전에 중단되면 다음 쓰기가 _repair로 정리)
+            self._repair()
+            with open(self.vectors_path, 'ab') as f:
+                f.write(np.ascontiguousarray(vectors[keep], dtype=np.float16).tobytes())
+            rows = [(hashes[i], self.count + n, article_ids[i]) for n, i in enumerate(keep)]
+            self.conn.executemany("INSERT INTO rows (hash, row, article_id) VALUES (?, ?, ?)", rows)
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.count += len(keep)
+        return len(keep)
+
+    def encode(self, texts, encoder, batch_size=64, article_ids=None, show_progress_bar=False):
+        """
+        텍스트 임베딩 (저장소에 없는 텍스트만 encoder로 계산해 저장)
+
+        Args:
+            texts (list): 기사 텍스트 (결측값은 빈 문자열로 처리)
+            encoder: SentenceTransformer 등 encode(texts, batch_size=...) 메서드를 가진 객체
+            article_ids (list): 기사 ID (URL 등, 선택)
+
+        Returns:
+            ndarray: 입력 순서의 (텍스트 수, 차원) float32 행렬
+        """
+        return self._encode(texts, encoder, batch_size, article_ids, show_progress_bar)[0]
+
+    def _encode(self, texts, encoder, batch_size=64, article_ids=None, show_progress_bar=False):
+        """encode와 같고 (행렬, 새로 추가한 행 수) 반환"""
+        texts = ["" if pd.isnull(text) else str(text) for text in texts]
+        hashes = [text_hash(text) for text in texts]
+        rows = self.lookup(hashes)
+
+        added = 0
+        missing = {}
+        for i in np.flatnonzero(rows < 0):
+            missing.setdefault(hashes[i], i)
+        if missing:
+            positions = list(missing.values())
+            print(f"새 임베딩: {len(positions)}개 (저장소 사용 {len(texts) - int((rows < 0).sum())}개)")
+            embeddings = encoder.encode([texts[i] for i in positions], batch_size=batch_size,
+                                        show_progress_bar=show_progress_bar, convert_to_numpy=True)
+            ids = None if article_ids is None else [article_ids[i] for i in positions]
+            added = self.add([hashes[i] for i in positions], embeddings, ids)
+            rows = self.lookup(hashes)
+        return self.vectors(rows), added
+
+    def add_articles(self, df, encoder, text_column='text', id_column='url', chunk_size=2048, batch_size=64):
+        """DataFrame의 기사를 chunk_size개씩 임베딩해 추가 (이미 있는 기사는 건너뜀)"""
+        added = 0
+        for start in range(0, len(df), chunk_size):
+            chunk = df.iloc[start:start + chunk_size]
+            ids = chunk[id_column].tolist() if id_column in chunk else None
+            added += self._encode(chunk[text_column].tolist(), encoder, batch_size=batch_size, article_ids=ids)[1]
+        return added
+
+    def close(self):
+        self._memmap = None
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SBERT 임베딩 저장소에 기사 추가")
+    parser.add_argument('--input', required=True, nargs='+', help="기사 CSV/피클 파일")
+    parser.add_argument('--store', default='../data/sbert_store', help="저장소 폴더")
+    parser.add_argument('--text-column', default='text', help="임베딩할 텍스트 컬럼")
+    parser.add_argument('--id-column', default='url', help="기사 ID 컬럼")
+    parser.add_argument('--model-name', default=MODEL_NAME, help="SBERT 모델 이름")
+    parser.add_argument('--batch-size', type=int, default=64, help="임베딩 배치 크기")
+    parser.add_argument('--device', default=None, help="cpu 또는 cuda (기본값: 자동)")
+    args = parser.parse_args()
+
+    store = EmbeddingStore(args.store, model_name=args.model_name)
+    encoder = load_encoder(args.model_name, args.device)
+    try:
+        for path in args.input:
+            df = pd.read_pickle(path) if path.endswith('.pkl') else pd.read_csv(path)
+            if args.text_column not in df and {'title', 'content'} <= set(df.columns):
+                df[args.text_column] = df['title'].fillna('') + ' ' + df['content'].fillna('')
+            added = store.add_articles(df, encoder, args.text_column, args.id_column, batch_size=args.batch_size)
+            print(f"{path}: {len(df)}개 중 {added}개 추가 (전체 {len(store)}개)")
+    finally:
+        store.close()
+    print("✅ 임베딩 저장 완료")
+
+
+if __name__ == "__main__":
+    main()
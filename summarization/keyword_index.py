@@ -0,0 +1,377 @@
+"""
+키워드 역색인 (sbert_based_generative.ipynb의 contains_all_keywords 필터 대체)
+
+- 기사 텍스트(title + ' ' + content)의 글자 bigram/unigram -> 기사 번호 목록(posting)을 SQLite에 저장
+- 여러 키워드 AND 검색은 posting 교집합으로 후보를 찾고, 후보만 부분 문자열 검사로 확인
+  (노트북의 `kw in text`와 같은 결과)
+- 작성일(오전/오후 포함)은 색인할 때 한 번만 파싱해 두고, 최신순 정렬과
+  "최신 N개 / 최근 30일" 조건을 기사 본문을 읽기 전에 적용
+- 새로 크롤링한 기사는 add()로 이어서 색인 (URL이 같은 기사는 건너뜀)
+
+사용 예:
+    index = KeywordIndex('../data/keyword_index.sqlite3')
+    filtered_data = index.search(['이재명', '대장동'])          # 노트북과 같은 500개/30일 규칙
+    latest = index.query(['대장동'], limit=100, days=7)        # 최근 7일 중 최신 100개
+
+사용법 (색인 만들기/추가):
+    python keyword_index.py --input cleaned_combined_df.pkl --index ../data/keyword_index.sqlite3
+    python keyword_index.py --index ../data/keyword_index.sqlite3 --query 이재명 대장동
+"""
+import argparse
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+# bigram 코드는 (앞 글자 << 21) | 뒤 글자, unigram 코드는 UNIGRAM | 글자 (유니코드는 21비트 이내)
+UNIGRAM = 1 << 42
+WHITESPACE = np.array([ord(c) for c in ' \t\n\r\x0b\x0c\xa0　'], dtype=np.int64)
+
+
+def parse_created_date(values):
+    """노트북과 같은 작성일 파싱 ('2025.05.23. 오후 1:00' -> datetime, 실패하면 NaT)"""
+    values = pd.Series(values, dtype=object).astype(str)
+    values = values.str.replace('오전', 'AM', regex=False).str.replace('오후', 'PM', regex=False)
+    return pd.to_datetime(values, format="%Y.%m.%d. %p %I:%M", errors='coerce')
+
+
+def search_text(title, content):
+    """노트북과 같은 검색 대상 텍스트 (결측값은 빈 문자열)"""
+    title = '' if pd.isnull(title) else str(title)
+    content = '' if pd.isnull(content) else str(content)
+    return title + ' ' + content
+
+
+def gram_codes(text):
+    """텍스트의 글자 unigram/bigram 코드 (공백이 들어간 bigram 제외, 중복 제거)"""
+    chars = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+    if len(chars) == 0:
+        return chars
+    space = np.isin(chars, WHITESPACE)
+    unigrams = chars[~space] | UNIGRAM
+    pair = ~(space[:-1] | space[1:])
+    bigrams = (chars[:-1][pair] << 21) | chars[1:][pair]
+    return np.unique(np.concatenate([unigrams, bigrams]))
+
+
+def keyword_codes(keyword):
+    """키워드를 포함하는 기사가 반드시 가진 gram 코드"""
+    codes = gram_codes(keyword)
+    bigrams = codes[codes < UNIGRAM]
+    # bigram이 있으면 unigram은 더 거르지 못하므로 bigram만 사용
+    return bigrams if len(bigrams) else codes
+
+
+def _encode_postings(ids):
+    """오름차순 기사 번호 -> 차분 + zlib 압축 바이트"""
+    deltas = np.diff(ids, prepend=0).astype(np.uint32)
+    return zlib.compress(deltas.tobytes(), 1)
+
+
+def _decode_postings(blob):
+    return np.cumsum(np.frombuffer(zlib.decompress(blob), dtype=np.uint32), dtype=np.int64)
+
+
+class KeywordIndex:
+    """
+    글자 n-gram 역색인과 기사 저장소
+
+    Args:
+        path (str): SQLite 파일 경로
+    """
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS docs (
+                id INTEGER PRIMARY KEY,
+                url TEXT UNIQUE,
+                created_ts REAL,
+                record TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                gram INTEGER NOT NULL,
+                chunk INTEGER NOT NULL,
+                ids BLOB NOT NULL,
+                PRIMARY KEY (gram, chunk)
+            );
+        ''')
+        # 기사 번호 -> 작성일 (초, 파싱 실패는 NaN) 배열을 메모리에 두고 정렬/기간 조건에 사용
+        self.created_ts = np.empty(0)
+        self.num_docs = 0
+        self._refresh()
+
+    def _refresh(self):
+        """다른 프로세스(새 크롤링 색인)가 추가한 기사의 작성일을 created_ts 뒤에 이어 붙이기"""
+        known = len(self.created_ts)
+        rows = self.conn.execute(
+            "SELECT id, created_ts FROM docs WHERE id >= ? ORDER BY id", (known,)
+        ).fetchall()
+        if not rows:
+            return
+        created_ts = np.full(rows[-1][0] + 1, np.nan)
+        created_ts[:known] = self.created_ts
+        for doc_id, ts in rows:
+            created_ts[doc_id] = np.nan if ts is None else ts
+        self.created_ts = created_ts
+        self.num_docs += len(rows)
+
+    def _begin_write(self):
+        """쓰기 잠금을 잡고 트랜잭션 시작 (다른 프로세스와 기사 번호/chunk가 겹치지 않도록)"""
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def __len__(self):
+        self._refresh()
+        return self.num_docs
+
+    def add(self, df, chunk_size=5000):
+        """
+        기사 DataFrame 색인에 추가 (url이 이미 있는 기사는 건너뜀)
+
+        title, content, created_date 컬럼이 필요하고 나머지 컬럼은 그대로 저장해 search 결과로 돌려줍니다.
+
+        Returns:
+            int: 새로 추가한 기사 수
+        """
+        added = 0
+        for start in range(0, len(df), chunk_size):
+            added += self._add_chunk(df.iloc[start:start + chunk_size])
+        return added
+
+    def _add_chunk(self, df):
+        records = json.loads(df.to_json(orient='records', force_ascii=False, date_format='iso'))
+        urls = df['url'].tolist() if 'url' in df else [None] * len(df)
+        created = parse_created_date(df['created_date'].tolist())
+        created_ts = [None if pd.isnull(value) else value.timestamp() for value in created]
+        # gram 계산은 잠금 밖에서 (청크 안의 위치 기준)
+        codes = [gram_codes(search_text(title, content)) for title, content in zip(df['title'], df['content'])]
+
+        # 이미 있는 url 확인과 기사 번호/chunk 배정은 쓰기 잠금 안에서 DB 기준으로
+        self._begin_write()
+        try:
+            existing = set()
+            known = [url for url in urls if isinstance(url, str)]
+            for start in range(0, len(known), 500):
+                chunk = known[start:start + 500]
+                existing.update(row[0] for row in self.conn.execute(
+                    f"SELECT url FROM docs WHERE url IN ({','.join('?' * len(chunk))})", chunk
+                ))
+            next_id = self.conn.execute("SELECT COALESCE(MAX(id), -1) + 1 FROM docs").fetchone()[0]
+            chunk_id = self.conn.execute("SELECT COALESCE(MAX(chunk), -1) + 1 FROM postings").fetchone()[0]
+
+            docs, doc_codes, owners, seen = [], [], [], set()
+            for record, url, ts, gram in zip(records, urls, created_ts, codes):
+                if isinstance(url, str):
+                    if url in existing or url in seen:
+                        continue
+                    seen.add(url)
+                doc_id = next_id + len(docs)
+                docs.append((doc_id, url if isinstance(url, str) else None, ts,
+                             json.dumps(record, ensure_ascii=False)))
+                doc_codes.append(gram)
+                owners.append(np.full(len(gram), doc_id, dtype=np.int64))
+            if not docs:
+                self.conn.rollback()
+                return 0
+
+            # (gram, 기사 번호) 쌍을 gram 순으로 정렬해 gram별 posting으로 나눔
+            doc_codes = np.concatenate(doc_codes)
+            owners = np.concatenate(owners)
+            order = np.lexsort((owners, doc_codes))
+            doc_codes, owners = doc_codes[order], owners[order]
+            bounds = np.flatnonzero(np.diff(doc_codes)) + 1
+            starts = np.r_[0, bounds]
+            ends = np.r_[bounds, len(doc_codes)]
+            postings = [
+                (int(doc_codes[start]), chunk_id, _encode_postings(owners[start:end]))
+                for start, end in zip(starts, ends)
+            ]
+
+            self.conn.executemany("INSERT INTO docs (id, url, created_ts, record) VALUES (?, ?, ?, ?)", docs)
+            self.conn.executemany("INSERT INTO postings (gram, chunk, ids) VALUES (?, ?, ?)", postings)
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+
+        self._refresh()
+        return len(docs)
+
+    def postings(self, code):
+        """gram 코드의 기사 번호 (오름차순)"""
+        blobs = self.conn.execute("SELECT ids FROM postings WHERE gram = ? ORDER BY chunk", (int(code),)).fetchall()
+        if not blobs:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([_decode_postings(blob) for blob, in blobs])
+
+    def candidates(self, keywords):
+        """모든 키워드의 gram을 가진 기사 번호 (부분 문자열 검사 전 후보)"""
+        codes = [keyword_codes(keyword) for keyword in keywords]
+        codes = np.unique(np.concatenate(codes)) if codes else np.empty(0, dtype=np.int64)
+        if len(codes) == 0:
+            self._refresh()
+            return np.arange(len(self.created_ts))
+        lists = sorted((self.postings(code) for code in codes), key=len)
+        result = lists[0]
+        for ids in lists[1:]:
+            if len(result) == 0:
+                break
+            result = np.intersect1d(result, ids, assume_unique=True)
+        return result
+
+    def _records(self, ids):
+        records = {}
+        ids = [int(doc_id) for doc_id in ids]
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            records.update(self.conn.execute(
+                f"SELECT id, record FROM docs WHERE id IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall())
+        return [json.loads(records[doc_id]) for doc_id in ids]
+
+    def _columns(self):
+        row = self.conn.execute("SELECT record FROM docs ORDER BY id LIMIT 1").fetchone()
+        return list(json.loads(row[0])) if row else []
+
+    def _matches(self, keywords, since=None):
+        """
+        모든 키워드를 포함하는 기사를 작성일 최신순으로 하나씩 (record, 작성일 초)
+
+        후보를 작성일 순으로 정렬한 뒤 500개씩 본문을 읽어 부분 문자열을 확인하므로,
+        필요한 만큼만 읽고 멈출 수 있습니다. (작성일이 없는 기사는 마지막)
+        """
+        keywords = [keyword for keyword in keywords if keyword]
+        ids = self.candidates(keywords)
+        # posting에 있는 기사는 docs에도 있으므로 posting을 읽은 뒤 작성일을 갱신
+        self._refresh()
+        ts = self.created_ts[ids]
+        order = np.lexsort((ids, np.where(np.isnan(ts), np.inf, -ts)))
+        ids, ts = ids[order], ts[order]
+        if since is not None:
+            keep = ts >= pd.Timestamp(since).timestamp()
+            ids, ts = ids[keep], ts[keep]
+
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            for doc_ts, record in zip(ts[start:start + 500], self._records(batch)):
+                text = search_text(record.get('title'), record.get('content'))
+                if all(keyword in text for keyword in keywords):
+                    yield record, doc_ts
+
+    def _frame(self, records):
+        result = pd.DataFrame(records) if records else pd.DataFrame(columns=self._columns())
+        result['created_date_parsed'] = parse_created_date(result['created_date'].tolist())
+        return result
+
+    def query(self, keywords, limit=None, days=None, since=None):
+        """
+        모든 키워드를 포함하는 기사 (작성일 최신순)
+
+        Args:
+            keywords (list): 키워드 (모두 포함해야 함)
+            limit (int): 최신 기사 최대 개수
+            days (int): 검색 결과 중 가장 최신 기사로부터 며칠 이내만
+            since (datetime): 이 시각 이후 기사만
+
+        Returns:
+            DataFrame: 저장한 컬럼 + created_date_parsed
+        """
+        records = []
+        cutoff = None
+        for record, doc_ts in self._matches(keywords, since):
+            if days is not None:
+                if cutoff is None:
+                    # 첫 결과가 가장 최신 기사 (작성일이 없으면 NaN이 되어 모두 제외)
+                    cutoff = doc_ts - days * 86400
+                if not doc_ts >= cutoff:
+                    break
+            records.append(record)
+            if limit is not None and len(records) >= limit:
+                break
+        return self._frame(records)
+
+    def search(self, keywords, max_articles=500, recent_days=30):
+        """
+        노트북과 같은 규칙의 검색: 결과가 max_articles개를 넘으면 가장 최신 기사로부터
+        recent_days일 이내 기사만 반환
+
+        max_articles개를 넘는 순간 기간 조건이 정해지므로 그보다 오래된 후보는 읽지 않습니다.
+        """
+        records, stamps = [], []
+        cutoff = None
+        for record, doc_ts in self._matches(keywords):
+            if cutoff is not None and not doc_ts >= cutoff:
+                break
+            records.append(record)
+            stamps.append(doc_ts)
+            if cutoff is None and len(records) > max_articles:
+                cutoff = stamps[0] - recent_days * 86400
+                records = [record for record, ts in zip(records, stamps) if ts >= cutoff]
+        return self._frame(records)
+
+    def compact(self):
+        """gram마다 여러 번 나눠 추가된 posting을 하나로 합치기"""
+        self._begin_write()
+        try:
+            grams = [row[0] for row in self.conn.execute(
+                "SELECT gram FROM postings GROUP BY gram HAVING COUNT(*) > 1"
+            )]
+            for gram in grams:
+                ids = self.postings(gram)
+                self.conn.execute("DELETE FROM postings WHERE gram = ?", (gram,))
+                self.conn.execute("INSERT INTO postings (gram, chunk, ids) VALUES (?, 0, ?)",
+                                  (gram, _encode_postings(ids)))
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.execute("VACUUM")
+        return len(grams)
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 역색인 만들기/검색")
+    parser.add_argument('--index', default='../data/keyword_index.sqlite3', help="색인 파일")
+    parser.add_argument('--input', nargs='*', default=[], help="추가할 기사 피클/CSV 파일")
+    parser.add_argument('--query', nargs='*', help="검색할 키워드")
+    parser.add_argument('--limit', type=int, default=None, help="최신 기사 최대 개수")
+    parser.add_argument('--days', type=int, default=None, help="최신 기사로부터 며칠 이내만")
+    parser.add_argument('--compact', action='store_true', help="추가한 뒤 posting 합치기")
+    args = parser.parse_args()
+
+    index = KeywordIndex(args.index)
+    try:
+        for path in args.input:
+            df = pd.read_pickle(path) if path.endswith('.pkl') else pd.read_csv(path)
+            started = time.perf_counter()
+            added = index.add(df)
+            print(f"{path}: {len(df)}개 중 {added}개 색인 ({time.perf_counter() - started:.1f}초, 전체 {len(index)}개)")
+        if args.compact:
+            print(f"posting 합치기: {index.compact()}개 gram")
+        if args.query:
+            started = time.perf_counter()
+            if args.limit is None and args.days is None:
+                result = index.search(args.query)
+            else:
+                result = index.query(args.query, limit=args.limit, days=args.days)
+            print(f"검색 결과: {len(result)}개 ({(time.perf_counter() - started) * 1000:.1f}ms)")
+            if len(result):
+                print(result[['press', 'created_date', 'title']].head(10).to_string())
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+KoBART 기사 요약 (sbert_based_generative.ipynb의 summarize_kobart 대체)
+
+- 엑셀로 내보내는 대표 기사만 요약 (노트북은 filtered_data 전체를 요약)
+- 토큰 길이순으로 묶어 배치마다 가장 긴 기사까지만 패딩하고 generate 한 번으로 요약
+- 요약 결과는 (모델, 생성 파라미터, 기사 텍스트) 해시로 SQLite에 캐시해 같은 기사는 다시 요약하지 않음
+
+사용 예:
+    summarizer = KoBARTSummarizer(cache_path='../data/.summary_cache.sqlite3')
+    representative_articles = summarize_representatives(filtered_data, selected_indices, summarizer)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+
+import numpy as np
+import torch
+
+MODEL_NAME = 'digit82/kobart-summarization'
+# 노트북과 같은 생성 파라미터
+GENERATION_PARAMS = {
+    'max_length': 100,
+    'min_length': 20,
+    'length_penalty': 2.0,
+    'num_beams': 4,
+    'early_stopping': True,
+}
+
+
+def is_summarizable(text):
+    """노트북과 같은 예외 처리: 빈 문장이나 짧은 문장은 요약 생략"""
+    return isinstance(text, str) and len(text.strip()) >= 10
+
+
+class SummaryCache:
+    """
+    요약 캐시 (SQLite)
+
+    키는 모델 이름, 생성 파라미터, 입력 최대 길이, 기사 텍스트를 합친 blake2b 해시입니다.
+    """
+    def __init__(self, path=None):
+        path = path or ':memory:'
+        directory = os.path.dirname(path)
+        if path != ':memory:' and directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS summaries (
+                key BLOB PRIMARY KEY,
+                summary TEXT NOT NULL
+            )
+        ''')
+
+    @staticmethod
+    def key(text, model_name, params):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps([model_name, params], sort_keys=True).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(text.encode('utf-8'))
+        return digest.digest()
+
+    def get_many(self, keys):
+        found = {}
+        keys = list(set(keys))
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            found.update(self.conn.execute(
+                f"SELECT key, summary FROM summaries WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall())
+        return found
+
+    def put_many(self, items):
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO summaries (key, summary) VALUES (?, ?)", items)
+
+    def close(self):
+        self.conn.close()
+
+
+class KoBARTSummarizer:
+    """
+    배치 생성과 캐시를 사용하는 KoBART 요약기
+
+    Args:
+        model_name (str): 요약 모델 이름
+        cache_path (str): 요약 캐시 파일 (None이면 메모리)
+        device: 추론 장치 (기본값: GPU가 있으면 cuda)
+        batch_size (int): generate 한 번에 요약할 기사 수
+        max_input_length (int): 입력 최대 토큰 수
+        **generation_params: 생성 파라미터 (기본값: GENERATION_PARAMS)
+    """
+    def __init__(self, model_name=MODEL_NAME, cache_path=None, device=None, batch_size=8,
+                 max_input_length=1024, model=None, tokenizer=None, **generation_params):
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        self.model_name = model_name
+        self.device = device or torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        self.tokenizer = tokenizer or AutoTokenizer.from_pretrained(model_name)
+        self.model = (model or AutoModelForSeq2SeqLM.from_pretrained(model_name)).to(self.device).eval()
+        self.batch_size = batch_size
+        self.max_input_length = max_input_length
+        self.generation_params = {**GENERATION_PARAMS, **generation_params}
+        self.cache = SummaryCache(cache_path)
+
+    def _cache_key(self, text):
+        params = {**self.generation_params, 'max_input_length': self.max_input_length}
+        return SummaryCache.key(text, self.model_name, params)
+
+    def _generate(self, texts):
+        """캐시에 없는 기사를 토큰 길이순 배치로 요약"""
+        encodings = self.tokenizer(texts, truncation=True, max_length=self.max_input_length)['input_ids']
+        order = np.argsort([len(ids) for ids in encodings], kind='stable')
+        summaries = [None] * len(texts)
+        with torch.no_grad():
+            for start in range(0, len(order), self.batch_size):
+                batch = order[start:start + self.batch_size]
+                enc = self.tokenizer.pad({'input_ids': [encodings[i] for i in batch]}, return_tensors='pt')
+                summary_ids = self.model.generate(
+                    input_ids=enc['input_ids'].to(self.device),
+                    attention_mask=enc['attention_mask'].to(self.device),
+                    **self.generation_params
+                )
+                decoded = self.tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+                for i, summary in zip(batch, decoded):
+                    summaries[i] = summary
+        return summaries
+
+    def summarize(self, texts):
+        """
+        기사 요약 (입력 순서, 짧거나 빈 기사는 "")
+
+        같은 텍스트는 한 번만 요약하고 캐시에 있는 텍스트는 생성하지 않습니다.
+        """
+        texts = list(texts)
+        keys = {text: self._cache_key(text) for text in texts if is_summarizable(text)}
+        cached = self.cache.get_many(keys.values())
+        missing = [text for text, key in keys.items() if key not in cached]
+        if missing:
+            print(f"요약 생성: {len(missing)}개 (캐시 사용 {len(keys) - len(missing)}개)")
+            generated = self._generate(missing)
+            self.cache.put_many([(keys[text], summary) for text, summary in zip(missing, generated)])
+            cached.update((keys[text], summary) for text, summary in zip(missing, generated))
+        return [cached[keys[text]] if text in keys else "" for text in texts]
+
+    def close(self):
+        self.cache.close()
+
+
+def summarize_representatives(df, indices, summarizer, text_column='text', summary_column='kobart_summary'):
+    """
+    대표 기사 행만 골라 요약 컬럼을 추가한 DataFrame 반환 (노트북의 representative_articles)
+
+    Args:
+        df (DataFrame): 키워드로 고른 기사 (filtered_data)
+        indices: 대표 기사 위치 (selected_indices)
+    """
+    representative_articles = df.iloc[list(indices)].copy()
+    representative_articles[summary_column] = summarizer.summarize(representative_articles[text_column].tolist())
+    return representative_articles